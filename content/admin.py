@@ -15,6 +15,7 @@ from .models import (
     DiscipleshipJourney, StageProgress, MissionReport, BibleStudyGroup,
     BaptismRecord, MissionMapLocation, Certificate, GlobalSoulsCounter
 )
+from .services import engagement, global_counter
 
 # ===========================
 # Custom Admin Site
@@ -34,9 +35,7 @@ class GodCares365AdminSite(admin.AdminSite):
     
     def mission_stats_view(self, request):
         """Custom view for mission statistics"""
-        global_stats = GlobalSoulsCounter.objects.first()
-        if not global_stats:
-            global_stats = GlobalSoulsCounter.objects.create(pk=1)
+        global_stats = global_counter.snapshot()
         
         # Recent mission reports
         recent_missions = MissionReport.objects.select_related('missionary').order_by('-created_at')[:10]
@@ -58,9 +57,7 @@ class GodCares365AdminSite(admin.AdminSite):
     
     def global_dashboard_view(self, request):
         """Global dashboard view"""
-        global_stats = GlobalSoulsCounter.objects.first()
-        if not global_stats:
-            global_stats = GlobalSoulsCounter.objects.create(pk=1)
+        global_stats = global_counter.snapshot()
         
         # Discipleship progress
         journey_stats = DiscipleshipJourney.objects.aggregate(
@@ -117,12 +114,22 @@ class GlobalSoulsCounterAdmin(admin.ModelAdmin):
         'total_souls_reached', 'total_baptisms', 'total_mission_reports',
         'total_bible_study_groups', 'active_missionaries', 'last_updated'
     ]
-    readonly_fields = ['last_updated']
+    readonly_fields = list_display
     actions = ['refresh_stats']
 
     def has_add_permission(self, request):
         return not GlobalSoulsCounter.objects.exists()
 
+    def get_object(self, request, object_id, from_field=None):
+        # Onyesha base row + shards (content/services/global_counter.py)
+        obj = super().get_object(request, object_id, from_field)
+        return global_counter.snapshot() if obj is not None else None
+
+    def save_model(self, request, obj, form, change):
+        # Snapshot haihifadhiwi (shards zingehesabiwa mara mbili)
+        if not change:
+            super().save_model(request, obj, form, change)
+
     def changelist_view(self, request, extra_context=None):
         try:
             obj = GlobalSoulsCounter.objects.get(pk=1)
@@ -132,8 +139,7 @@ class GlobalSoulsCounterAdmin(admin.ModelAdmin):
 
     def refresh_stats(self, request, queryset):
         """Refresh global statistics"""
-        from .signals import update_global_souls_counter
-        update_global_souls_counter()
+        global_counter.reconcile()
         self.message_user(request, "Global statistics refreshed successfully.", messages.SUCCESS)
     refresh_stats.short_description = "Refresh global statistics"
 
@@ -246,19 +252,11 @@ class LessonAdmin(admin.ModelAdmin):
     search_fields = ["title", "content", "bible_references", "description"]
     prepopulated_fields = {"slug": ("title",)}
     list_editable = ["status", "order"]
-    readonly_fields = ["views", "created_at", "updated_at", "published_at"]
+    readonly_fields = ["views", "like_count", "comment_count", "created_at", "updated_at", "published_at"]
     inlines = [LessonCommentInline, LessonLikeInline]
     date_hierarchy = "published_at"
     actions = ["publish_selected", "unpublish_selected"]
 
-    def like_count(self, obj):
-        return obj.lesson_likes.count()
-    like_count.short_description = "Likes"
-
-    def comment_count(self, obj):
-        return obj.lesson_comments.filter(is_approved=True).count()
-    comment_count.short_description = "Comments"
-
     def publish_selected(self, request, queryset):
         updated = 0
         now = timezone.now()
@@ -273,7 +271,13 @@ class LessonAdmin(admin.ModelAdmin):
     publish_selected.short_description = "Publish selected lessons"
 
     def unpublish_selected(self, request, queryset):
-        updated = queryset.update(status="draft")
+        # save() ya kila lesson (si queryset.update) ili signals za search index
+        # na response cache zitumwe, kama publish_selected
+        updated = 0
+        for lesson in queryset.exclude(status="draft"):
+            lesson.status = "draft"
+            lesson.save()
+            updated += 1
         self.message_user(request, f"Moved {updated} lesson(s) to Draft.", messages.INFO)
     unpublish_selected.short_description = "Unpublish selected lessons"
 
@@ -484,13 +488,13 @@ class BibleStudyGroupAdmin(admin.ModelAdmin):
     member_count.short_description = "Members"
 
     def activate_groups(self, request, queryset):
-        queryset.update(is_active=True)
-        self.message_user(request, f"Activated {queryset.count()} group(s).", messages.SUCCESS)
+        updated = global_counter.set_groups_active(queryset, True)
+        self.message_user(request, f"Activated {updated} group(s).", messages.SUCCESS)
     activate_groups.short_description = "Activate selected groups"
 
     def deactivate_groups(self, request, queryset):
-        queryset.update(is_active=False)
-        self.message_user(request, f"Deactivated {queryset.count()} group(s).", messages.SUCCESS)
+        updated = global_counter.set_groups_active(queryset, False)
+        self.message_user(request, f"Deactivated {updated} group(s).", messages.SUCCESS)
     deactivate_groups.short_description = "Deactivate selected groups"
 
 @admin.register(BaptismRecord)
@@ -643,12 +647,12 @@ class LessonCommentAdmin(admin.ModelAdmin):
     short_body.short_description = "Comment"
 
     def approve_comments(self, request, queryset):
-        queryset.update(is_approved=True)
+        engagement.set_comments_approved(queryset, True)
         self.message_user(request, f"Approved {queryset.count()} comment(s).", messages.SUCCESS)
     approve_comments.short_description = "Approve selected comments"
 
     def disapprove_comments(self, request, queryset):
-        queryset.update(is_approved=False)
+        engagement.set_comments_approved(queryset, False)
         self.message_user(request, f"Disapproved {queryset.count()} comment(s).", messages.SUCCESS)
     disapprove_comments.short_description = "Disapprove selected comments"
 
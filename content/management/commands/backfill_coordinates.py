@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from content.models import MissionMapLocation, MissionReport, parse_gps_coordinates
+
+
+class Command(BaseCommand):
+    help = "Fill latitude/longitude columns from gps_coordinates for existing mission reports and map locations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        for model in (MissionReport, MissionMapLocation):
+            changed = []
+            updated = 0
+            rows = model.objects.only("gps_coordinates", "latitude", "longitude")
+            for row in rows.iterator(chunk_size=batch_size):
+                point = parse_gps_coordinates(row.gps_coordinates)
+                if point == (row.latitude, row.longitude):
+                    continue
+                row.latitude, row.longitude = point
+                changed.append(row)
+                if len(changed) >= batch_size:
+                    model.objects.bulk_update(changed, ["latitude", "longitude"])
+                    updated += len(changed)
+                    changed = []
+            if changed:
+                model.objects.bulk_update(changed, ["latitude", "longitude"])
+                updated += len(changed)
+            self.stdout.write(f"{model._meta.label}: {updated} row(s) updated")
+
+        self.stdout.write(self.style.SUCCESS("Coordinates backfilled. Run rebuild_mission_heatmap next."))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from content.models import Lesson, Post, reading_stats
+from core.response_cache import purge_tags
+
+
+class Command(BaseCommand):
+    help = "Compute word_count/read_time for existing posts and lessons."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        for model in (Post, Lesson):
+            changed = []
+            updated = 0
+            rows = model.objects.only("content", "word_count", "read_time")
+            for row in rows.iterator(chunk_size=batch_size):
+                stats = reading_stats(row.content)
+                if stats == (row.word_count, row.read_time):
+                    continue
+                row.word_count, row.read_time = stats
+                changed.append(row)
+                if len(changed) >= batch_size:
+                    model.objects.bulk_update(changed, ["word_count", "read_time"])
+                    updated += len(changed)
+                    changed = []
+            if changed:
+                model.objects.bulk_update(changed, ["word_count", "read_time"])
+                updated += len(changed)
+            self.stdout.write(f"{model._meta.label}: {updated} row(s) updated")
+
+        # bulk_update haitumi signals
+        purge_tags(Post._meta.label, Lesson._meta.label)
+        self.stdout.write(self.style.SUCCESS("Reading stats backfilled."))
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.services.view_counts import flush_view_counts
+from core.response_cache import cache_is_process_local
+
+
+class Command(BaseCommand):
+    help = "Flush buffered Post/Lesson/MediaItem view counts to the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop", action="store_true",
+            help="Endelea kumwaga kila --interval sekunde (worker mode).",
+        )
+        parser.add_argument("--interval", type=int, default=10)
+
+    def handle(self, *args, **options):
+        if cache_is_process_local():
+            # Buffer iko ndani ya process za web; command hii ingeona buffer tupu
+            raise CommandError(
+                "flush_view_counts needs a shared cache (CACHE_BACKEND=Redis/Memcached); "
+                "with LocMemCache views are flushed inline by the web process "
+                "(VIEW_COUNTER_FLUSH_INTERVAL)."
+            )
+        while True:
+            flushed = flush_view_counts()
+            self.stdout.write(self.style.SUCCESS(f"Flushed {flushed} view(s)."))
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from content.services.heatmap import rebuild_heatmap
+
+
+class Command(BaseCommand):
+    help = "Rebuild the pre-aggregated mission heatmap tiles from MissionMapLocation."
+
+    def handle(self, *args, **options):
+        cells = rebuild_heatmap()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {cells} heatmap cell(s)."))
@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.services.global_counter import recompute_derived_stats
+from core.response_cache import cache_is_process_local
+
+
+class Command(BaseCommand):
+    help = "Recompute derived global stats (active missionaries) if they were marked dirty."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop", action="store_true",
+            help="Endelea kukagua kila --interval sekunde (worker mode).",
+        )
+        parser.add_argument("--interval", type=int, default=10)
+        parser.add_argument("--force", action="store_true", help="Hesabu hata kama si dirty.")
+
+    def handle(self, *args, **options):
+        if cache_is_process_local() and not options["force"]:
+            # Flag ya dirty iko ndani ya process za web; hapa ingeonekana safi daima
+            raise CommandError(
+                "recompute_global_stats needs a shared cache (CACHE_BACKEND=Redis/Memcached) "
+                "to see the dirty flag; with LocMemCache use --force or the inline "
+                "recompute (GLOBAL_STATS_RECOMPUTE_INTERVAL > 0)."
+            )
+        while True:
+            ran = recompute_derived_stats(force=options["force"])
+            self.stdout.write(self.style.SUCCESS("Recomputed." if ran else "Nothing to recompute."))
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from content.services.global_counter import reconcile
+
+
+class Command(BaseCommand):
+    help = "Recompute GlobalSoulsCounter totals from mission reports, baptisms, groups and journeys, and reset the counter shards."
+
+    def handle(self, *args, **options):
+        totals = reconcile()
+        for field, value in totals.items():
+            self.stdout.write(f"{field}: {value}")
+        self.stdout.write(self.style.SUCCESS("Global counters reconciled."))
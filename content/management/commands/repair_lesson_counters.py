@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from content.services.engagement import repair_lesson_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute Lesson.like_count and Lesson.comment_count from likes and approved comments."
+
+    def handle(self, *args, **options):
+        fixed = repair_lesson_counts()
+        self.stdout.write(self.style.SUCCESS(f"Repaired {fixed} lesson(s)."))
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0006_discipleshipjourney_globalsoulscounter_missionreport_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lessoncomment',
+            name='content_les_lesson__8d83b9_idx',
+        ),
+        migrations.AddIndex(
+            model_name='lessoncomment',
+            index=models.Index(fields=['lesson', 'created_at', 'id'], name='content_les_lesson__cbbe5e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lessoncomment',
+            index=models.Index(fields=['created_at', 'id'], name='content_les_created_0de8b1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='content_pos_status_f911e8_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:10
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('content', '0007_remove_lessoncomment_content_les_lesson__8d83b9_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MissionHeatmapCell',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('zoom', models.PositiveSmallIntegerField()),
+                ('tile_x', models.PositiveIntegerField()),
+                ('tile_y', models.PositiveIntegerField()),
+                ('visits', models.IntegerField(default=0)),
+                ('weight', models.IntegerField(default=0)),
+                ('lat_sum', models.FloatField(default=0)),
+                ('lng_sum', models.FloatField(default=0)),
+                ('missionary', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='heatmap_cells', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['zoom', 'tile_x', 'tile_y'], name='content_mis_zoom_49e3b7_idx')],
+                'unique_together': {('missionary', 'zoom', 'tile_x', 'tile_y')},
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:11
+
+import content.models
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0008_missionheatmapcell'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='biblestudygroup',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)]),
+        ),
+        migrations.AddField(
+            model_name='biblestudygroup',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)]),
+        ),
+        migrations.AddField(
+            model_name='missionmaplocation',
+            name='latitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='missionmaplocation',
+            name='longitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='missionreport',
+            name='latitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='missionreport',
+            name='longitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='missionmaplocation',
+            name='gps_coordinates',
+            field=models.JSONField(default=dict, validators=[content.models.validate_gps_coordinates]),
+        ),
+        migrations.AlterField(
+            model_name='missionreport',
+            name='gps_coordinates',
+            field=models.JSONField(default=dict, validators=[content.models.validate_gps_coordinates]),
+        ),
+        migrations.AddIndex(
+            model_name='biblestudygroup',
+            index=models.Index(fields=['latitude', 'longitude'], name='content_bib_latitud_1adc19_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='missionmaplocation',
+            index=models.Index(fields=['latitude', 'longitude'], name='content_mis_latitud_09df90_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='missionreport',
+            index=models.Index(fields=['latitude', 'longitude'], name='content_mis_latitud_4d6989_idx'),
+        ),
+    ]
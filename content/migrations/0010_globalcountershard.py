@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0009_biblestudygroup_latitude_biblestudygroup_longitude_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GlobalCounterShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard', models.PositiveSmallIntegerField(unique=True)),
+                ('total_souls_reached', models.BigIntegerField(default=0)),
+                ('total_baptisms', models.BigIntegerField(default=0)),
+                ('total_mission_reports', models.BigIntegerField(default=0)),
+                ('total_bible_study_groups', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['shard'],
+            },
+        ),
+    ]
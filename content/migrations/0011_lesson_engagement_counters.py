@@ -0,0 +1,47 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:18
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counts(apps, schema_editor):
+    Lesson = apps.get_model('content', 'Lesson')
+    LessonLike = apps.get_model('content', 'LessonLike')
+    LessonComment = apps.get_model('content', 'LessonComment')
+
+    def count_of(queryset):
+        return Coalesce(
+            Subquery(
+                queryset.filter(lesson=OuterRef('pk')).order_by().values('lesson')
+                .annotate(n=Count('pk')).values('n'),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        )
+
+    Lesson.objects.update(
+        like_count=count_of(LessonLike.objects.all()),
+        comment_count=count_of(LessonComment.objects.filter(is_approved=True)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0010_globalcountershard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lesson',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0011_lesson_engagement_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lesson',
+            name='read_time',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='read_time',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -2,7 +2,10 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.utils.text import slugify
 from django.utils import timezone
-from django.core.validators import RegexValidator, FileExtensionValidator
+from django.core.exceptions import ValidationError
+from django.core.validators import (
+    RegexValidator, FileExtensionValidator, MinValueValidator, MaxValueValidator,
+)
 from django.db.models.functions import Lower
 
 # ----------------- Helpers -----------------
@@ -19,6 +22,56 @@ def unique_slugify(instance, value, slug_field_name: str = "slug", max_length: i
         n += 1
     setattr(instance, slug_field_name, slug)
 
+def parse_gps_coordinates(value):
+    """``{"lat": .., "lng": ..}`` → (lat, lng) kama floats, au (None, None)."""
+    try:
+        lat, lng = float(value["lat"]), float(value["lng"])
+    except (KeyError, TypeError, ValueError):
+        return None, None
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        return None, None
+    return lat, lng
+
+def validate_gps_coordinates(value):
+    # {} inaruhusiwa (hakuna GPS); vinginevyo lazima iwe point halali
+    if value in (None, {}):
+        return
+    if parse_gps_coordinates(value) == (None, None):
+        raise ValidationError(
+            'gps_coordinates must be {"lat": <-90..90>, "lng": <-180..180>}.'
+        )
+
+def sync_coordinates(instance, save_kwargs):
+    """Jaza latitude/longitude kutoka gps_coordinates kabla ya save()."""
+    instance.latitude, instance.longitude = parse_gps_coordinates(instance.gps_coordinates)
+    update_fields = save_kwargs.get("update_fields")
+    if update_fields is not None and "gps_coordinates" in update_fields:
+        save_kwargs["update_fields"] = {*update_fields, "latitude", "longitude"}
+
+WORDS_PER_MINUTE = 200
+
+def reading_stats(text):
+    """(word_count, read_time kwa dakika) ya ``text``."""
+    word_count = len((text or "").split())
+    return word_count, max(1, round(word_count / WORDS_PER_MINUTE))
+
+def sync_reading_stats(instance, save_kwargs):
+    """Jaza word_count/read_time kutoka content kabla ya save()."""
+    update_fields = save_kwargs.get("update_fields")
+    if update_fields is not None and "content" not in update_fields:
+        return
+    if "content" not in instance.__dict__:
+        return  # content iko deferred, haijabadilika
+    instance.word_count, instance.read_time = reading_stats(instance.content)
+    if update_fields is not None:
+        save_kwargs["update_fields"] = {*update_fields, "word_count", "read_time"}
+
+def latitude_validators():
+    return [MinValueValidator(-90), MaxValueValidator(90)]
+
+def longitude_validators():
+    return [MinValueValidator(-180), MaxValueValidator(180)]
+
 def image_validator():
     return FileExtensionValidator(allowed_extensions=("jpg", "jpeg", "png", "webp", "gif"))
 
@@ -72,6 +125,9 @@ class Post(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
     featured = models.BooleanField(default=False)
     views = models.PositiveIntegerField(default=0)
+    # Zinatokana na content kwenye save() (tazama reading_stats)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    read_time = models.PositiveIntegerField(default=1, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(blank=True, null=True)
@@ -84,6 +140,7 @@ class Post(models.Model):
         indexes = [
             models.Index(fields=['status', 'published_at']),
             models.Index(fields=['category', 'status']),
+            models.Index(fields=['status', 'created_at', 'id']),
             models.Index(Lower('slug'), name='post_slug_lower_idx'),
         ]
         constraints = [models.UniqueConstraint(Lower('slug'), name='post_slug_ci_unique')]
@@ -93,6 +150,7 @@ class Post(models.Model):
             unique_slugify(self, self.title, max_length=200)
         if not self.excerpt and self.content:
             self.excerpt = self.content[:297] + '...' if len(self.content) > 300 else self.content
+        sync_reading_stats(self, kwargs)
         if self.status == 'published' and not self.published_at:
             self.published_at = timezone.now()
         super().save(*args, **kwargs)
@@ -168,6 +226,11 @@ class Lesson(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
     order = models.PositiveIntegerField(default=0)
     views = models.PositiveIntegerField(default=0)
+    # Denormalized; zinasasishwa kwa F() na signals (content/services/engagement.py)
+    like_count = models.PositiveIntegerField(default=0, editable=False)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)  # approved tu
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    read_time = models.PositiveIntegerField(default=1, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(blank=True, null=True)
@@ -185,16 +248,9 @@ class Lesson(models.Model):
             unique_slugify(self, self.title, max_length=200)
         if self.status == 'published' and not self.published_at:
             self.published_at = timezone.now()
+        sync_reading_stats(self, kwargs)
         super().save(*args, **kwargs)
 
-    @property
-    def like_count(self):
-        return self.lesson_likes.count()
-
-    @property
-    def comment_count(self):
-        return self.lesson_comments.filter(is_approved=True).count()
-
     @property
     def is_published(self):
         return self.status == "published"
@@ -299,7 +355,10 @@ class LessonComment(models.Model):
 
     class Meta:
         ordering = ['-created_at']
-        indexes = [models.Index(fields=['lesson', 'created_at'])]
+        indexes = [
+            models.Index(fields=['lesson', 'created_at', 'id']),
+            models.Index(fields=['created_at', 'id']),
+        ]
 
     def __str__(self):
         return f"Comment by {self.user.username} on {self.lesson.slug}"
@@ -386,7 +445,10 @@ class MissionReport(models.Model):
     missionary = models.ForeignKey(User, on_delete=models.CASCADE, related_name='mission_reports')
     title = models.CharField(max_length=200)
     location = models.CharField(max_length=100)
-    gps_coordinates = models.JSONField(default=dict)  # {lat: x, lng: y}
+    gps_coordinates = models.JSONField(default=dict, validators=[validate_gps_coordinates])  # {lat: x, lng: y}
+    # Zinajazwa kutoka gps_coordinates kwenye save() (kwa bbox/radius queries)
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
     date_conducted = models.DateTimeField(default=timezone.now)
     souls_reached = models.IntegerField(default=0)
     testimonies = models.TextField(blank=True)
@@ -410,6 +472,11 @@ class MissionReport(models.Model):
 
     class Meta:
         ordering = ['-date_conducted']
+        indexes = [models.Index(fields=['latitude', 'longitude'])]
+
+    def save(self, *args, **kwargs):
+        sync_coordinates(self, kwargs)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.missionary.username} - {self.location} - {self.date_conducted.strftime('%Y-%m-%d')}"
@@ -430,6 +497,8 @@ class BibleStudyGroup(models.Model):
     meeting_frequency = models.CharField(max_length=20, choices=FREQUENCY_CHOICES, default='weekly')
     meeting_schedule = models.JSONField(default=dict)  # {day: "Monday", time: "19:00", frequency: "weekly"}
     location = models.CharField(max_length=200, blank=True)
+    latitude = models.FloatField(null=True, blank=True, validators=latitude_validators())
+    longitude = models.FloatField(null=True, blank=True, validators=longitude_validators())
     online_link = models.URLField(blank=True)
     
     # Group status
@@ -444,6 +513,9 @@ class BibleStudyGroup(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['latitude', 'longitude'])]
+
     def __str__(self):
         return f"{self.group_name} - Led by {self.leader.username}"
 
@@ -477,7 +549,9 @@ class BaptismRecord(models.Model):
 class MissionMapLocation(models.Model):
     missionary = models.ForeignKey(User, on_delete=models.CASCADE, related_name='mission_locations')
     location_name = models.CharField(max_length=100)
-    gps_coordinates = models.JSONField(default=dict)  # {lat: x, lng: y}
+    gps_coordinates = models.JSONField(default=dict, validators=[validate_gps_coordinates])  # {lat: x, lng: y}
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
     date_visited = models.DateTimeField()
     visit_type = models.CharField(max_length=50, choices=[
         ('door_to_door', 'Door-to-Door Evangelism'),
@@ -494,10 +568,37 @@ class MissionMapLocation(models.Model):
 
     class Meta:
         ordering = ['-date_visited']
+        indexes = [models.Index(fields=['latitude', 'longitude'])]
+
+    def save(self, *args, **kwargs):
+        sync_coordinates(self, kwargs)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.missionary.username} - {self.location_name} - {self.visit_type}"
 
+class MissionHeatmapCell(models.Model):
+    """
+    Bin ya heatmap iliyokusanywa mapema: visits za missionary mmoja ndani ya
+    tile (zoom, x, y) ya Web Mercator. Inasasishwa na signals za
+    MissionMapLocation (tazama content/services/heatmap.py).
+    """
+    missionary = models.ForeignKey(User, on_delete=models.CASCADE, related_name='heatmap_cells')
+    zoom = models.PositiveSmallIntegerField()
+    tile_x = models.PositiveIntegerField()
+    tile_y = models.PositiveIntegerField()
+    visits = models.IntegerField(default=0)
+    weight = models.IntegerField(default=0)  # jumla ya souls_contacted
+    lat_sum = models.FloatField(default=0)   # kwa centroid = lat_sum / visits
+    lng_sum = models.FloatField(default=0)
+
+    class Meta:
+        unique_together = ['missionary', 'zoom', 'tile_x', 'tile_y']
+        indexes = [models.Index(fields=['zoom', 'tile_x', 'tile_y'])]
+
+    def __str__(self):
+        return f"{self.missionary_id} z{self.zoom}/{self.tile_x}/{self.tile_y} ({self.visits})"
+
 class Certificate(models.Model):
     CERTIFICATE_TYPES = [
         ('seeker_completion', '📘 Faith Discovery Badge - Seeker Stage'),
@@ -549,4 +650,25 @@ class GlobalSoulsCounter(models.Model):
 
     class Meta:
         verbose_name = "Global Souls Counter"
-        verbose_name_plural = "Global Souls Counter"
\ No newline at end of file
+        verbose_name_plural = "Global Souls Counter"
+
+
+class GlobalCounterShard(models.Model):
+    """
+    Sehemu (shard) ya totals za GlobalSoulsCounter. Writers wanaongeza kwa
+    ``F()`` kwenye shard moja ya nasibu, hivyo hawasubiriani kwenye row moja.
+    Total halisi = GlobalSoulsCounter (base) + jumla ya shards zote
+    (tazama content/services/global_counter.py).
+    """
+    shard = models.PositiveSmallIntegerField(unique=True)
+    total_souls_reached = models.BigIntegerField(default=0)
+    total_baptisms = models.BigIntegerField(default=0)
+    total_mission_reports = models.BigIntegerField(default=0)
+    total_bible_study_groups = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['shard']
+
+    def __str__(self):
+        return f"Global counter shard {self.shard}"
@@ -2,6 +2,7 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 
+from core.fields import AnnotatedCountField
 from .models import (
     Category,
     Post,
@@ -55,15 +56,12 @@ class ProfileSerializer(serializers.ModelSerializer):
 
 
 class CategorySerializer(serializers.ModelSerializer):
-    posts_count = serializers.SerializerMethodField()
+    posts_count = AnnotatedCountField("posts", filter={"status": "published"})
 
     class Meta:
         model = Category
         fields = ["id", "name", "slug", "description", "posts_count", "created_at"]
 
-    def get_posts_count(self, obj):
-        return obj.posts.filter(status="published").count()
-
 
 class PostListSerializer(serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
@@ -71,7 +69,6 @@ class PostListSerializer(serializers.ModelSerializer):
         source="author.get_full_name",
         read_only=True,
     )
-    read_time = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
@@ -90,10 +87,6 @@ class PostListSerializer(serializers.ModelSerializer):
             "read_time",
         ]
 
-    def get_read_time(self, obj):
-        word_count = len((obj.content or "").split())
-        return max(1, round(word_count / 200))
-
 
 class PostDetailSerializer(serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
@@ -101,7 +94,6 @@ class PostDetailSerializer(serializers.ModelSerializer):
         source="author.get_full_name",
         read_only=True,
     )
-    read_time = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
@@ -120,15 +112,12 @@ class PostDetailSerializer(serializers.ModelSerializer):
             "updated_at",
             "published_at",
             "read_time",
+            "word_count",
         ]
 
-    def get_read_time(self, obj):
-        word_count = len((obj.content or "").split())
-        return max(1, round(word_count / 200))
-
 
 class SeriesSerializer(serializers.ModelSerializer):
-    lessons_count = serializers.SerializerMethodField()
+    lessons_count = AnnotatedCountField("lessons", filter={"status": "published"})
     season_name = serializers.CharField(source="season.name", read_only=True)
 
     class Meta:
@@ -144,13 +133,10 @@ class SeriesSerializer(serializers.ModelSerializer):
             "order",
         ]
 
-    def get_lessons_count(self, obj):
-        return obj.lessons.filter(status="published").count()
-
 
 class SeasonSerializer(serializers.ModelSerializer):
     series = SeriesSerializer(many=True, read_only=True)
-    series_count = serializers.SerializerMethodField()
+    series_count = AnnotatedCountField("series")
 
     class Meta:
         model = Season
@@ -169,9 +155,6 @@ class SeasonSerializer(serializers.ModelSerializer):
             "created_at",
         ]
 
-    def get_series_count(self, obj):
-        return obj.series.count()
-
 
 class LessonListSerializer(serializers.ModelSerializer):
     series_name = serializers.CharField(source="series.name", read_only=True)
@@ -179,6 +162,7 @@ class LessonListSerializer(serializers.ModelSerializer):
     has_video = serializers.SerializerMethodField()
     has_pdf = serializers.SerializerMethodField()
     has_audio = serializers.SerializerMethodField()
+    liked_by_me = serializers.SerializerMethodField()
 
     class Meta:
         model = Lesson
@@ -197,8 +181,14 @@ class LessonListSerializer(serializers.ModelSerializer):
             "has_audio",
             "order",
             "views",
+            "like_count",
+            "comment_count",
+            "liked_by_me",
+            "read_time",
             "created_at",
         ]
+        # Fields zinazosomwa na SerializerMethodFields (core/querysets.py)
+        only_extra = ["video_url", "video_embed_code", "pdf_file", "audio_file"]
 
     def get_has_video(self, obj):
         return bool(getattr(obj, "video_url", None) or getattr(obj, "video_embed_code", None))
@@ -209,6 +199,10 @@ class LessonListSerializer(serializers.ModelSerializer):
     def get_has_audio(self, obj):
         return bool(getattr(obj, "audio_file", None))
 
+    def get_liked_by_me(self, obj):
+        # Annotation ya LessonViewSet (EXISTS moja ndani ya query ya ukurasa)
+        return bool(getattr(obj, "liked_by_me", False))
+
 
 class LessonDetailSerializer(serializers.ModelSerializer):
     series = SeriesSerializer(read_only=True)
@@ -237,6 +231,10 @@ class LessonDetailSerializer(serializers.ModelSerializer):
             "has_audio",
             "order",
             "views",
+            "like_count",
+            "comment_count",
+            "read_time",
+            "word_count",
             "created_at",
             "updated_at",
         ]
@@ -408,7 +406,7 @@ class MissionReportSerializer(serializers.ModelSerializer):
 
 class BibleStudyGroupSerializer(serializers.ModelSerializer):
     leader_name = serializers.CharField(source="leader.get_full_name", read_only=True)
-    member_count = serializers.SerializerMethodField()
+    member_count = AnnotatedCountField("members", offset=1)  # +1 kwa ajili ya leader
     current_lesson_title = serializers.CharField(
         source="current_lesson.title",
         read_only=True,
@@ -418,9 +416,16 @@ class BibleStudyGroupSerializer(serializers.ModelSerializer):
         model = BibleStudyGroup
         fields = "__all__"
 
-    def get_member_count(self, obj):
-        # +1 kwa ajili ya leader mwenyewe
-        return obj.members.count() + 1
+    def validate(self, attrs):
+        # latitude na longitude ziwe pamoja (au zote tupu)
+        instance = self.instance
+        lat = attrs.get("latitude", getattr(instance, "latitude", None))
+        lng = attrs.get("longitude", getattr(instance, "longitude", None))
+        if (lat is None) != (lng is None):
+            raise serializers.ValidationError(
+                "latitude and longitude must be provided together."
+            )
+        return attrs
 
 
 class BaptismRecordSerializer(serializers.ModelSerializer):
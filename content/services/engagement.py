@@ -0,0 +1,94 @@
+# content/services/engagement.py
+"""
+Counters za engagement za Lesson (``like_count``, ``comment_count``).
+
+Zinasasishwa kwa UPDATE ya ``F()`` (signals za LessonLike/LessonComment na
+admin actions), hivyo list/admin hazifanyi COUNT kwa kila lesson.
+``repair_lesson_counts()`` inazihesabu upya kutoka tables.
+
+Counters haziguzi ``updated_at`` wala tag ``content.Lesson``: ziko kwenye
+ETag ya LessonViewSet (``conditional_fields``/``conditional_aggregates``),
+na ETag iko kwenye key ya response cache, hivyo idadi mpya inaonekana mara
+moja bila kufuta cache za lessons zote. Like inafuta pia ``user_tag`` ya
+aliyelike (``liked_by_me`` kwenye cache na ETag ya list yake).
+"""
+from django.db import transaction
+from django.db.models import Count, Exists, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from content.models import Lesson, LessonComment, LessonLike
+from core.response_cache import purge_tags
+
+
+def _purge():
+    # update() haitumi post_save, hivyo futa response cache hapa
+    purge_tags(Lesson._meta.label)
+
+
+def user_tag(user_id):
+    return f"content.Lesson:likes:u{user_id}"
+
+
+def invalidate_user_likes(user_id):
+    transaction.on_commit(lambda: purge_tags(user_tag(user_id)))
+
+
+def adjust_lesson_counts(lesson_id, likes=0, comments=0):
+    changes = {}
+    if likes:
+        changes["like_count"] = F("like_count") + likes
+    if comments:
+        changes["comment_count"] = F("comment_count") + comments
+    if not changes:
+        return
+    Lesson.objects.filter(pk=lesson_id).update(**changes)
+
+
+def set_comments_approved(queryset, approved):
+    """Bulk approve/disapprove (admin) na urekebishe ``comment_count``. Inarudisha idadi."""
+    with transaction.atomic():
+        changed = queryset.exclude(is_approved=approved)
+        per_lesson = list(changed.values("lesson").annotate(n=Count("pk")))
+        updated = changed.update(is_approved=approved)
+        sign = 1 if approved else -1
+        for row in per_lesson:
+            adjust_lesson_counts(row["lesson"], comments=sign * row["n"])
+    return updated
+
+
+def _count_subquery(queryset):
+    return Coalesce(
+        Subquery(
+            queryset.filter(lesson=OuterRef("pk"))
+            .order_by()
+            .values("lesson")
+            .annotate(n=Count("pk"))
+            .values("n"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def repair_lesson_counts():
+    """Hesabu counters upya; inarudisha idadi ya lessons zilizokuwa na drift."""
+    lessons = Lesson.objects.annotate(
+        real_likes=_count_subquery(LessonLike.objects.all()),
+        real_comments=_count_subquery(LessonComment.objects.filter(is_approved=True)),
+    ).filter(~Q(like_count=F("real_likes")) | ~Q(comment_count=F("real_comments")))
+    stale = list(lessons.values_list("pk", "real_likes", "real_comments"))
+    with transaction.atomic():
+        for pk, likes, comments in stale:
+            Lesson.objects.filter(pk=pk).update(like_count=likes, comment_count=comments)
+    if stale:
+        transaction.on_commit(_purge)
+    return len(stale)
+
+
+def annotate_liked_by_me(queryset, user):
+    """``liked_by_me`` kama EXISTS ndani ya query ile ile ya ukurasa."""
+    if user is None or not user.is_authenticated:
+        return queryset.annotate(liked_by_me=Value(False))
+    return queryset.annotate(
+        liked_by_me=Exists(LessonLike.objects.filter(lesson=OuterRef("pk"), user=user))
+    )
@@ -0,0 +1,82 @@
+# content/services/geo.py
+"""
+Spatial queries juu ya columns ``latitude``/``longitude`` (zenye index)
+za MissionReport, MissionMapLocation na BibleStudyGroup.
+
+- ``within_bbox``: range scan kwenye index.
+- ``within_radius``: bbox prefilter kisha haversine (SQL) kwa umbali kamili.
+- ``nearest``: radius inayokua hadi kupata N, kisha panga kwa umbali.
+"""
+import math
+
+from django.db.models import ExpressionWrapper, F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+NEAREST_START_KM = 5.0
+NEAREST_MAX_KM = 20037.5  # nusu ya mzingo wa dunia
+
+
+def within_bbox(queryset, west, south, east, north):
+    queryset = queryset.filter(latitude__gte=south, latitude__lte=north)
+    if west <= east:
+        return queryset.filter(longitude__gte=west, longitude__lte=east)
+    # bbox inavuka antimeridian (mf. west=170, east=-170)
+    return queryset.filter(Q(longitude__gte=west) | Q(longitude__lte=east))
+
+
+def bbox_around(lat, lng, radius_km):
+    """Bbox inayozunguka duara la ``radius_km`` (west, south, east, north)."""
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    south, north = max(-90.0, lat - dlat), min(90.0, lat + dlat)
+    cos_lat = math.cos(math.radians(lat))
+    if north >= 90 or south <= -90 or cos_lat < 1e-6:
+        return -180.0, south, 180.0, north  # karibu na ncha: longitude zote
+    dlng = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    if dlng >= 180:
+        return -180.0, south, 180.0, north
+    west, east = lng - dlng, lng + dlng
+    if west < -180:
+        west += 360
+    if east > 180:
+        east -= 360
+    return west, south, east, north
+
+
+def annotate_distance(queryset, lat, lng):
+    """Ongeza ``distance_km`` (haversine) kwenye kila row."""
+    dlat = Radians(F("latitude") - Value(lat))
+    dlng = Radians(F("longitude") - Value(lng))
+    a = Power(Sin(dlat / 2), 2) + Value(math.cos(math.radians(lat))) * Cos(
+        Radians(F("latitude"))
+    ) * Power(Sin(dlng / 2), 2)
+    distance = ExpressionWrapper(
+        Value(2 * EARTH_RADIUS_KM) * ASin(Sqrt(a)), output_field=FloatField()
+    )
+    return queryset.annotate(distance_km=distance)
+
+
+def within_radius(queryset, lat, lng, radius_km):
+    west, south, east, north = bbox_around(lat, lng, radius_km)
+    queryset = within_bbox(queryset, west, south, east, north)
+    return (
+        annotate_distance(queryset, lat, lng)
+        .filter(distance_km__lte=radius_km)
+        .order_by("distance_km")
+    )
+
+
+def nearest(queryset, lat, lng, n):
+    """N zilizo karibu zaidi; radius inaongezeka x4 hadi kupata N."""
+    radius = NEAREST_START_KM
+    while radius < NEAREST_MAX_KM:
+        rows = list(within_radius(queryset, lat, lng, radius)[:n])
+        if len(rows) >= n:
+            return rows
+        radius *= 4
+    return list(
+        annotate_distance(
+            queryset.filter(latitude__isnull=False, longitude__isnull=False), lat, lng
+        ).order_by("distance_km")[:n]
+    )
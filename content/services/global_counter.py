@@ -0,0 +1,195 @@
+# content/services/global_counter.py
+"""
+GlobalSoulsCounter isiyo na contention.
+
+- ``increment(...)``: UPDATE moja ya ``F()`` kwenye shard ya nasibu
+  (GlobalCounterShard); hakuna read-modify-write wala lock ya row moja.
+- ``snapshot()``: base row (GlobalSoulsCounter pk=1) + SUM ya shards,
+  ina-cache kwa ``GLOBAL_COUNTER_CACHE_TIMEOUT`` sekunde.
+- ``reconcile()``: hesabu totals upya kutoka tables asili, weka kwenye base
+  row na rudisha shards kuwa sifuri.
+- ``mark_dirty()``: signals zinaashiria tu kuwa stats zinazotokana na COUNT
+  (active_missionaries) zimechafuka; ``recompute_derived_stats()`` inaendeshwa
+  mara moja kwa kila ``GLOBAL_STATS_RECOMPUTE_INTERVAL`` (inline) au na
+  ``manage.py recompute_global_stats``, bila kujali idadi ya events.
+  Command inahitaji cache ya pamoja (flag ya dirty iko kwenye cache).
+  Trailing edge: events zilizofika ndani ya interval zinaacha flag ya dirty,
+  na ``snapshot()`` ya kwanza baada ya interval kuisha inahesabu upya.
+"""
+import logging
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Sum
+from django.utils import timezone
+
+from content.models import (
+    BaptismRecord,
+    BibleStudyGroup,
+    DiscipleshipJourney,
+    GlobalCounterShard,
+    GlobalSoulsCounter,
+    MissionReport,
+)
+from core.response_cache import purge_tags
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = (
+    "total_souls_reached",
+    "total_baptisms",
+    "total_mission_reports",
+    "total_bible_study_groups",
+)
+TOTALS_CACHE_KEY = "global_counter:totals"
+DIRTY_KEY = "global_counter:dirty"
+RECOMPUTE_LOCK_KEY = "global_counter:recompute-lock"
+RECOMPUTE_TICK_KEY = "global_counter:recompute-tick"
+
+
+def shard_count():
+    return max(1, getattr(settings, "GLOBAL_COUNTER_SHARDS", 8))
+
+
+def invalidate():
+    cache.delete(TOTALS_CACHE_KEY)
+    # F() updates hazitumi post_save, hivyo futa response cache hapa
+    purge_tags(GlobalSoulsCounter._meta.label)
+
+
+def increment(**deltas):
+    """Mf. ``increment(total_baptisms=1)``. Deltas hasi zinaruhusiwa."""
+    unknown = set(deltas) - set(COUNTER_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown counter field(s): {', '.join(sorted(unknown))}")
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+
+    shard = random.randrange(shard_count())
+    now = timezone.now()
+    changes = {field: F(field) + value for field, value in deltas.items()}
+    shards = GlobalCounterShard.objects.filter(shard=shard)
+    with transaction.atomic():
+        if not shards.update(updated_at=now, **changes):
+            try:
+                with transaction.atomic():
+                    GlobalCounterShard.objects.create(shard=shard, **deltas)
+            except IntegrityError:
+                # Request nyingine imeunda shard hii sasa hivi
+                shards.update(updated_at=now, **changes)
+    transaction.on_commit(invalidate)
+
+
+def set_groups_active(queryset, active):
+    """Bulk activate/deactivate BibleStudyGroups (admin) na urekebishe counter."""
+    with transaction.atomic():
+        updated = queryset.exclude(is_active=active).update(is_active=active)
+        increment(total_bible_study_groups=updated if active else -updated)
+    return updated
+
+
+def _totals():
+    base, _ = GlobalSoulsCounter.objects.get_or_create(pk=1)
+    sums = GlobalCounterShard.objects.aggregate(
+        latest=Max("updated_at"), **{field: Sum(field) for field in COUNTER_FIELDS}
+    )
+    totals = {field: getattr(base, field) + (sums[field] or 0) for field in COUNTER_FIELDS}
+    totals["active_missionaries"] = base.active_missionaries
+    totals["last_updated"] = max(filter(None, (base.last_updated, sums["latest"])))
+    return totals
+
+
+def snapshot():
+    """
+    GlobalSoulsCounter (pk=1) yenye totals kamili. Ni ya kusoma tu —
+    usiite ``save()`` juu yake (shards zingehesabiwa mara mbili).
+    """
+    _recompute_if_due()
+    totals = cache.get(TOTALS_CACHE_KEY)
+    if totals is None:
+        totals = _totals()
+        timeout = getattr(settings, "GLOBAL_COUNTER_CACHE_TIMEOUT", 5)
+        if timeout:
+            cache.set(TOTALS_CACHE_KEY, totals, timeout)
+    return GlobalSoulsCounter(pk=1, **totals)
+
+
+# --------------------- Derived stats (debounced) ---------------------
+def mark_dirty():
+    """Ashiria kuwa derived stats zinahitaji kuhesabiwa upya (baada ya commit)."""
+    transaction.on_commit(_on_dirty)
+
+
+def _recompute_if_due():
+    interval = getattr(settings, "GLOBAL_STATS_RECOMPUTE_INTERVAL", 30)
+    if interval <= 0 or not cache.get(DIRTY_KEY):
+        return
+    if cache.add(RECOMPUTE_TICK_KEY, 1, timeout=interval):
+        try:
+            recompute_derived_stats()
+        except Exception:  # usiangushe request kwa sababu ya stats
+            logger.exception("Inline global stats recompute failed")
+
+
+def _on_dirty():
+    cache.set(DIRTY_KEY, 1, timeout=None)
+    _recompute_if_due()
+
+
+def recompute_derived_stats(force=False):
+    """
+    Hesabu active_missionaries upya kama stats ziko dirty (au ``force``).
+    Inarudisha True kama recompute imefanyika.
+    """
+    if not force and not cache.get(DIRTY_KEY):
+        return False
+    if not cache.add(RECOMPUTE_LOCK_KEY, 1, timeout=60):
+        return False
+    try:
+        # Futa flag kwanza: events za wakati wa recompute zitaiweka tena
+        cache.delete(DIRTY_KEY)
+        active_missionaries = DiscipleshipJourney.objects.filter(
+            missionary_completed=True
+        ).count()
+        GlobalSoulsCounter.objects.get_or_create(pk=1)
+        GlobalSoulsCounter.objects.filter(pk=1).update(
+            active_missionaries=active_missionaries, last_updated=timezone.now()
+        )
+    except Exception:
+        cache.set(DIRTY_KEY, 1, timeout=None)
+        raise
+    finally:
+        cache.delete(RECOMPUTE_LOCK_KEY)
+    transaction.on_commit(invalidate)
+    return True
+
+
+def reconcile():
+    """Hesabu totals zote upya kutoka tables asili. Inarudisha dict ya totals."""
+    with transaction.atomic():
+        GlobalSoulsCounter.objects.get_or_create(pk=1)
+        # Funga base + shards ili increments zisubiri hadi reconcile imalize
+        GlobalSoulsCounter.objects.select_for_update().filter(pk=1).first()
+        list(GlobalCounterShard.objects.select_for_update())
+
+        verified = MissionReport.objects.filter(is_verified=True).aggregate(
+            souls=Sum("souls_reached"), baptisms=Sum("baptisms_performed"), reports=Count("pk")
+        )
+
+        totals = {
+            "total_souls_reached": verified["souls"] or 0,
+            # Kama signals: baptisms za reports zilizothibitishwa + kila BaptismRecord
+            "total_baptisms": (verified["baptisms"] or 0) + BaptismRecord.objects.count(),
+            "total_mission_reports": verified["reports"],
+            "total_bible_study_groups": BibleStudyGroup.objects.filter(is_active=True).count(),
+            "active_missionaries": DiscipleshipJourney.objects.filter(
+                missionary_completed=True
+            ).count(),
+        }
+        GlobalCounterShard.objects.update(**{field: 0 for field in COUNTER_FIELDS})
+        GlobalSoulsCounter.objects.filter(pk=1).update(last_updated=timezone.now(), **totals)
+    transaction.on_commit(invalidate)
+    return totals
@@ -0,0 +1,169 @@
+# content/services/heatmap.py
+"""
+Heatmap ya mission map kwa tiles za Web Mercator (slippy map z/x/y).
+
+Kila MissionMapLocation inaongezwa kwenye bin moja kwa kila zoom
+(0..MISSION_HEATMAP_MAX_ZOOM) wakati inapohifadhiwa, kwa UPDATE moja ya
+``F()`` + bulk_create kwa bins mpya. Query ya ``?zoom=&bbox=`` inasoma
+bins za tiles zilizo kwenye skrini tu, hivyo payload inategemea viewport
+na si idadi ya visits.
+"""
+import math
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q, Sum
+
+from content.models import MissionHeatmapCell, MissionMapLocation
+
+MAX_LAT = 85.05112878  # mpaka wa Web Mercator
+MAX_CELLS = 5000
+
+
+def max_zoom():
+    return getattr(settings, "MISSION_HEATMAP_MAX_ZOOM", 16)
+
+
+def location_point(location):
+    """(lat, lng) ya location au None kama haina GPS halali."""
+    if location.latitude is None or location.longitude is None:
+        return None
+    return location.latitude, location.longitude
+
+
+def tile_for(lat, lng, zoom):
+    n = 2 ** zoom
+    lat = max(-MAX_LAT, min(MAX_LAT, lat))
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+# ----------------------------- Maintenance -----------------------------
+def apply_visit(missionary_id, point, weight, sign=1):
+    """
+    Ongeza (sign=1) au toa (sign=-1) visit moja kwenye bins za zoom zote.
+    Query 1 kwa bins zilizopo; +2 tu pale bins mpya zinapoundwa.
+    """
+    if point is None:
+        return
+    lat, lng = point
+    tiles = {z: tile_for(lat, lng, z) for z in range(max_zoom() + 1)}
+    match = Q()
+    for z, (x, y) in tiles.items():
+        match |= Q(zoom=z, tile_x=x, tile_y=y)
+    cells = MissionHeatmapCell.objects.filter(match, missionary_id=missionary_id)
+    changes = dict(
+        visits=F("visits") + sign,
+        weight=F("weight") + sign * weight,
+        lat_sum=F("lat_sum") + sign * lat,
+        lng_sum=F("lng_sum") + sign * lng,
+    )
+
+    with transaction.atomic():
+        updated = cells.update(**changes)
+        if sign < 0:
+            cells.filter(visits__lte=0).delete()
+            return
+        if updated == len(tiles):
+            return
+        existing = set(cells.values_list("zoom", flat=True))
+        missing = [
+            MissionHeatmapCell(
+                missionary_id=missionary_id, zoom=z, tile_x=x, tile_y=y,
+                visits=1, weight=weight, lat_sum=lat, lng_sum=lng,
+            )
+            for z, (x, y) in tiles.items()
+            if z not in existing
+        ]
+        try:
+            with transaction.atomic():
+                MissionHeatmapCell.objects.bulk_create(missing)
+        except IntegrityError:
+            # Request nyingine imeunda bins hizo hizo sasa hivi: ongeza juu yake
+            MissionHeatmapCell.objects.filter(
+                missionary_id=missionary_id,
+                zoom__in=[cell.zoom for cell in missing],
+            ).filter(match).update(**changes)
+
+
+@transaction.atomic
+def rebuild_heatmap():
+    """Jenga bins zote upya kutoka MissionMapLocation. Inarudisha idadi ya bins."""
+    MissionHeatmapCell.objects.all().delete()
+    zooms = range(max_zoom() + 1)
+    bins = defaultdict(lambda: [0, 0, 0.0, 0.0])
+    locations = MissionMapLocation.objects.filter(latitude__isnull=False).only(
+        "missionary_id", "latitude", "longitude", "souls_contacted"
+    )
+    for location in locations.iterator(chunk_size=1000):
+        point = location_point(location)
+        if point is None:
+            continue
+        for z in zooms:
+            acc = bins[(location.missionary_id, z) + tile_for(*point, z)]
+            acc[0] += 1
+            acc[1] += location.souls_contacted
+            acc[2] += point[0]
+            acc[3] += point[1]
+    MissionHeatmapCell.objects.bulk_create(
+        [
+            MissionHeatmapCell(
+                missionary_id=m, zoom=z, tile_x=x, tile_y=y,
+                visits=v, weight=w, lat_sum=la, lng_sum=ln,
+            )
+            for (m, z, x, y), (v, w, la, ln) in bins.items()
+        ],
+        batch_size=1000,
+    )
+    return len(bins)
+
+
+# ------------------------------- Queries -------------------------------
+def parse_bbox(raw):
+    """'west,south,east,north' → tuple ya floats; ValueError kama si sahihi."""
+    west, south, east, north = (float(v) for v in raw.split(","))
+    if not (-90 <= south <= north <= 90 and -180 <= west <= 180 and -180 <= east <= 180):
+        raise ValueError("bbox out of range")
+    return west, south, east, north
+
+
+def cells_in_view(zoom, bbox=None, missionary=None):
+    """
+    Bins za ``zoom`` ndani ya ``bbox`` (au dunia nzima). ``missionary`` = None
+    kwa staff (bins za wamisionari wote zinajumlishwa kwa SQL).
+    """
+    west, south, east, north = bbox or (-180.0, -MAX_LAT, 180.0, MAX_LAT)
+    x_min, y_min = tile_for(north, west, zoom)
+    x_max, y_max = tile_for(south, east, zoom)
+
+    qs = MissionHeatmapCell.objects.filter(zoom=zoom, tile_y__gte=y_min, tile_y__lte=y_max)
+    if x_min <= x_max:
+        qs = qs.filter(tile_x__gte=x_min, tile_x__lte=x_max)
+    else:  # bbox inavuka antimeridian
+        qs = qs.filter(Q(tile_x__gte=x_min) | Q(tile_x__lte=x_max))
+    if missionary is not None:
+        qs = qs.filter(missionary=missionary)
+
+    rows = (
+        qs.values("tile_x", "tile_y")
+        .annotate(
+            total_visits=Sum("visits"), total_weight=Sum("weight"),
+            total_lat=Sum("lat_sum"), total_lng=Sum("lng_sum"),
+        )
+        .filter(total_visits__gt=0)
+        .order_by("-total_weight", "tile_x", "tile_y")[: MAX_CELLS + 1]
+    )
+    rows = list(rows)
+    cells = [
+        {
+            "lat": round(row["total_lat"] / row["total_visits"], 6),
+            "lng": round(row["total_lng"] / row["total_visits"], 6),
+            "weight": row["total_weight"],
+            "visits": row["total_visits"],
+            "tile": [zoom, row["tile_x"], row["tile_y"]],
+        }
+        for row in rows[:MAX_CELLS]
+    ]
+    return cells, len(rows) > MAX_CELLS
@@ -0,0 +1,135 @@
+# content/services/view_counts.py
+"""
+Write-behind view counters kwa Post, Lesson na MediaItem.
+
+Kila hit inaongeza delta kwenye cache (LocMem kwa dev, Redis/Memcached
+ikiwa CACHES imewekwa hivyo) badala ya kugusa row. Deltas zinamwagwa
+(flush) kwa UPDATE moja ``views = views + n`` kwa kila kundi la objects
+lenye delta sawa — ama inline angalau mara moja kwa kila
+``VIEW_COUNTER_FLUSH_INTERVAL`` sekunde, ama na ``manage.py flush_view_counts``.
+
+``flush_view_counts`` (command) inahitaji cache ya pamoja: kwa LocMem buffer
+iko ndani ya kila process ya web, hivyo command inakataa kuendeshwa na
+flush ni ya inline tu (hit ya kwanza baada ya interval kuisha).
+"""
+import logging
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "viewcount"
+SEQ_KEY = f"{KEY_PREFIX}:seq"
+FLUSHED_KEY = f"{KEY_PREFIX}:flushed"
+FLUSH_LOCK_KEY = f"{KEY_PREFIX}:flush-lock"
+TICK_KEY = f"{KEY_PREFIX}:tick"
+
+# Marker ikipotea (mf. slot haikuandikwa), counter itapata slot mpya baada ya muda huu
+MARKER_TIMEOUT = 300
+SLOT_BATCH = 500
+
+
+def _counter_key(label, pk, field):
+    return f"{KEY_PREFIX}:n:{label}:{field}:{pk}"
+
+
+def _marker_key(label, pk, field):
+    return f"{KEY_PREFIX}:dirty:{label}:{field}:{pk}"
+
+
+def _slot_key(seq):
+    return f"{KEY_PREFIX}:slot:{seq}"
+
+
+def _incr(key, delta=1):
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        return cache.incr(key, delta)
+
+
+def _buffer(label, pk, field, n):
+    pending = _incr(_counter_key(label, pk, field), n)
+    # Jiandikishe kwenye orodha ya "dirty" mara moja tu hadi flush ijayo
+    if cache.add(_marker_key(label, pk, field), 1, timeout=MARKER_TIMEOUT):
+        seq = _incr(SEQ_KEY)
+        cache.set(_slot_key(seq), (label, pk, field), timeout=None)
+    return pending
+
+
+def record_view(instance, field="views", n=1):
+    """
+    Buffer hit moja (au ``n``) ya ``instance``. Inarudisha idadi ya views
+    ambazo bado hazijaandikwa kwenye DB, ikijumuisha hii.
+    """
+    pending = _buffer(instance._meta.label_lower, instance.pk, field, n)
+
+    interval = getattr(settings, "VIEW_COUNTER_FLUSH_INTERVAL", 30)
+    if interval > 0 and cache.add(TICK_KEY, 1, timeout=interval):
+        try:
+            flush_view_counts()
+        except Exception:  # usiangushe request kwa sababu ya flush
+            logger.exception("Inline view counter flush failed")
+    return pending
+
+
+def pending_views(instance, field="views"):
+    return cache.get(_counter_key(instance._meta.label_lower, instance.pk, field), 0)
+
+
+def _write(deltas):
+    """deltas: {(label, field): {pk: n}} → UPDATE moja kwa kila (model, field, n)."""
+    for (label, field), per_pk in deltas.items():
+        model = apps.get_model(label)
+        by_amount = defaultdict(list)
+        for pk, n in per_pk.items():
+            by_amount[n].append(pk)
+        for n, pks in by_amount.items():
+            model._base_manager.filter(pk__in=pks).update(**{field: F(field) + n})
+
+
+def flush_view_counts():
+    """
+    Mwaga deltas zote zilizo kwenye buffer kwenda DB.
+    Inarudisha jumla ya views zilizoandikwa (0 kama flush nyingine inaendelea).
+    """
+    if not cache.add(FLUSH_LOCK_KEY, 1, timeout=60):
+        return 0
+
+    deltas = defaultdict(lambda: defaultdict(int))
+    total = 0
+    try:
+        start = cache.get(FLUSHED_KEY, 0)
+        end = cache.get(SEQ_KEY, 0)
+        for batch_start in range(start + 1, end + 1, SLOT_BATCH):
+            seqs = range(batch_start, min(batch_start + SLOT_BATCH, end + 1))
+            slot_keys = [_slot_key(seq) for seq in seqs]
+            for label, pk, field in cache.get_many(slot_keys).values():
+                # Futa marker kwanza: hit mpya zitajiandikisha upya kwa slot mpya
+                cache.delete(_marker_key(label, pk, field))
+                key = _counter_key(label, pk, field)
+                n = cache.get(key, 0)
+                if n:
+                    # decr (si delete) ili hits za katikati zisipotee
+                    cache.decr(key, n)
+                    deltas[(label, field)][pk] += n
+                    total += n
+            cache.delete_many(slot_keys)
+        cache.set(FLUSHED_KEY, end, timeout=None)
+
+        try:
+            _write(deltas)
+        except Exception:
+            # Rudisha deltas kwenye buffer ili zisipotee
+            for (label, field), per_pk in deltas.items():
+                for pk, n in per_pk.items():
+                    _buffer(label, pk, field, n)
+            raise
+    finally:
+        cache.delete(FLUSH_LOCK_KEY)
+    return total
@@ -1,6 +1,7 @@
 # backend/content/signals.py
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_init, post_save, pre_save, post_delete
 from django.dispatch import receiver
+from django.db import transaction
 from django.contrib.auth.models import User
 
 from .models import (
@@ -16,7 +17,14 @@ from .models import (
     Post,
     LessonLike,
     LessonComment,
+    Category,
+    Season,
+    Series,
+    Event,
+    MissionMapLocation,
 )
+from .services import engagement, global_counter, heatmap
+from core.response_cache import connect_invalidation
 
 
 @receiver(post_save, sender=User)
@@ -75,11 +83,11 @@ def update_souls_counter_on_mission(sender, instance, created, **kwargs):
     """
     was_verified = getattr(instance, "_was_verified", False)
     if not was_verified and instance.is_verified:
-        global_counter, _ = GlobalSoulsCounter.objects.get_or_create(pk=1)
-        global_counter.total_souls_reached += instance.souls_reached
-        global_counter.total_baptisms += instance.baptisms_performed
-        global_counter.total_mission_reports += 1
-        global_counter.save()
+        global_counter.increment(
+            total_souls_reached=instance.souls_reached,
+            total_baptisms=instance.baptisms_performed,
+            total_mission_reports=1,
+        )
 
 
 @receiver(post_save, sender=BaptismRecord)
@@ -88,20 +96,35 @@ def update_baptism_counter(sender, instance, created, **kwargs):
     Update baptism count when a new baptism record is created.
     """
     if created:
-        global_counter, _ = GlobalSoulsCounter.objects.get_or_create(pk=1)
-        global_counter.total_baptisms += 1
-        global_counter.save()
+        global_counter.increment(total_baptisms=1)
+
+
+@receiver(post_init, sender=BibleStudyGroup)
+def remember_group_active_state(sender, instance, **kwargs):
+    instance._was_active = bool(instance.__dict__.get("is_active"))
 
 
 @receiver(post_save, sender=BibleStudyGroup)
-def update_groups_counter(sender, instance, created, **kwargs):
+def update_groups_counter(sender, instance, created, raw=False, update_fields=None, **kwargs):
     """
-    Update Bible study groups counter when a new active group is created.
+    Update Bible study groups counter when a group is created active,
+    activated or deactivated.
     """
-    if created and instance.is_active:
-        global_counter, _ = GlobalSoulsCounter.objects.get_or_create(pk=1)
-        global_counter.total_bible_study_groups += 1
-        global_counter.save()
+    if raw:
+        return
+    if not created and update_fields is not None and "is_active" not in update_fields:
+        return
+    was_active = False if created else instance._was_active
+    is_active = bool(instance.is_active)
+    if is_active != was_active:
+        global_counter.increment(total_bible_study_groups=1 if is_active else -1)
+    instance._was_active = is_active
+
+
+@receiver(post_delete, sender=BibleStudyGroup)
+def decrement_groups_counter(sender, instance, **kwargs):
+    if instance.is_active:
+        global_counter.increment(total_bible_study_groups=-1)
 
 
 @receiver(post_save, sender=Lesson)
@@ -144,37 +167,118 @@ def update_journey_progress(sender, instance, **kwargs):
             journey.save()
 
 
+@receiver(post_init, sender=User)
+def remember_user_active_state(sender, instance, **kwargs):
+    # __dict__ ili field iliyo-deferred isilete query
+    instance._was_active = instance.__dict__.get("is_active")
+
+
 @receiver(pre_save, sender=User)
-def update_active_missionaries_count(sender, instance, **kwargs):
+def update_active_missionaries_count(sender, instance, update_fields=None, **kwargs):
     """
     Update active missionaries count when user status changes.
+    Hakuna query: hali ya awali imehifadhiwa na post_init.
     """
-    if instance.pk:
-        try:
-            old_user = User.objects.get(pk=instance.pk)
-            if old_user.is_active != instance.is_active:
-                update_global_souls_counter()
-        except User.DoesNotExist:
-            pass
+    if instance.pk is None:
+        return
+    if update_fields is not None and "is_active" not in update_fields:
+        return  # mf. last_login kwenye login
+    if instance._was_active != instance.is_active:
+        update_global_souls_counter()
+    instance._was_active = instance.is_active
 
 
 def update_global_souls_counter():
     """
-    Update derived counts in the global souls counter.
+    Mark derived counts in the global souls counter as stale. The recompute
+    runs at most once per GLOBAL_STATS_RECOMPUTE_INTERVAL (see
+    content/services/global_counter.py), however many events arrive.
     """
-    global_counter, _ = GlobalSoulsCounter.objects.get_or_create(pk=1)
-
-    active_missionaries = DiscipleshipJourney.objects.filter(
-        missionary_completed=True
-    ).count()
-
-    active_groups = BibleStudyGroup.objects.filter(is_active=True).count()
-
-    global_counter.active_missionaries = active_missionaries
-    global_counter.total_bible_study_groups = active_groups
-    global_counter.save()
+    global_counter.mark_dirty()
 
 @receiver(post_save, sender=GlobalSoulsCounter)
 def initialize_global_counter(sender, instance, created, **kwargs):
     if created:
         update_global_souls_counter()
+    transaction.on_commit(global_counter.invalidate)
+
+
+# ---------------- Lesson engagement counters ----------------
+@receiver(post_save, sender=LessonLike)
+def count_like_on_create(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        engagement.adjust_lesson_counts(instance.lesson_id, likes=1)
+        engagement.invalidate_user_likes(instance.user_id)
+
+
+@receiver(post_delete, sender=LessonLike)
+def count_like_on_delete(sender, instance, **kwargs):
+    engagement.adjust_lesson_counts(instance.lesson_id, likes=-1)
+    engagement.invalidate_user_likes(instance.user_id)
+
+
+@receiver(post_init, sender=LessonComment)
+def remember_comment_approval(sender, instance, **kwargs):
+    instance._was_approved = instance.__dict__.get("is_approved")
+
+
+@receiver(post_save, sender=LessonComment)
+def count_comment_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        delta = 1 if instance.is_approved else 0
+    else:
+        delta = int(bool(instance.is_approved)) - int(bool(instance._was_approved))
+    instance._was_approved = instance.is_approved
+    engagement.adjust_lesson_counts(instance.lesson_id, comments=delta)
+
+
+@receiver(post_delete, sender=LessonComment)
+def count_comment_on_delete(sender, instance, **kwargs):
+    if instance.is_approved:
+        engagement.adjust_lesson_counts(instance.lesson_id, comments=-1)
+
+
+# ---------------- Mission heatmap bins ----------------
+def _heatmap_state(location):
+    return (location.missionary_id, heatmap.location_point(location), location.souls_contacted)
+
+
+@receiver(pre_save, sender=MissionMapLocation)
+def capture_old_map_location(sender, instance, **kwargs):
+    instance._heatmap_old = None
+    if instance.pk:
+        old = (
+            MissionMapLocation.objects.filter(pk=instance.pk)
+            .only("missionary_id", "latitude", "longitude", "souls_contacted")
+            .first()
+        )
+        if old is not None:
+            instance._heatmap_old = _heatmap_state(old)
+
+
+@receiver(post_save, sender=MissionMapLocation)
+def update_heatmap_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    old = getattr(instance, "_heatmap_old", None)
+    new = _heatmap_state(instance)
+    if old == new:
+        return
+    if old is not None:
+        heatmap.apply_visit(*old, sign=-1)
+    heatmap.apply_visit(*new)
+
+
+@receiver(post_delete, sender=MissionMapLocation)
+def update_heatmap_on_delete(sender, instance, **kwargs):
+    heatmap.apply_visit(*_heatmap_state(instance), sign=-1)
+
+
+# ---------------- Response cache invalidation ----------------
+# Tazama core/response_cache.py; tags ni labels za models hizi.
+connect_invalidation(
+    Post, Lesson, Series, Season, Event, Category,
+    GlobalSoulsCounter, DiscipleshipJourney, BibleStudyGroup, BaptismRecord,
+)
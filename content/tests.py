@@ -1,4 +1,10 @@
+from io import StringIO
+
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import models
+from django.test import override_settings
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 
@@ -78,6 +84,368 @@ class PostAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["title"], "Test Post")
 
+    def test_read_time_is_stored_and_list_skips_content(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.post.content = "neno " * 450
+        self.post.save(update_fields=["content"])
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.word_count, self.post.read_time), (450, 2))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/content/posts/")
+        self.assertEqual(response.data["results"][0]["read_time"], 2)
+        selects = [q["sql"] for q in queries if '"content_post"."title"' in q["sql"]]
+        self.assertTrue(selects)
+        self.assertFalse(any('"content_post"."content"' in sql for sql in selects))
+
+    @override_settings(VIEW_COUNTER_FLUSH_INTERVAL=0)
+    def test_increment_views_is_buffered_until_flush(self):
+        from .services.view_counts import flush_view_counts
+
+        cache.clear()
+        url = f"/api/v1/content/posts/{self.post.id}/increment_views/"
+        for expected in (1, 2, 3):
+            response = self.client.post(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data["views"], expected)
+
+        # Row haiguswi hadi flush
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 0)
+
+        # Buffer ya LocMem haionekani kwa process nyingine: command inakataa
+        with self.assertRaises(CommandError):
+            call_command("flush_view_counts", stdout=StringIO())
+        flush_view_counts()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 3)
+
+        response = self.client.post(url)
+        self.assertEqual(response.data["views"], 4)
+
+
+class ResponseCacheTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin_user = User.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="adminpass123",
+        )
+        self.category = Category.objects.create(name="Test Category")
+        self.post = Post.objects.create(
+            title="Cached Post",
+            content="Test content",
+            category=self.category,
+            author=self.admin_user,
+            status="published",
+        )
+
+    def test_public_list_is_cached_and_purged_on_save(self):
+        url = "/api/v1/content/posts/"
+        self.assertEqual(self.client.get(url)["X-Cache"], "MISS")
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response.data["results"][0]["title"], "Cached Post")
+
+        self.post.title = "Renamed Post"
+        self.post.save()
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["title"], "Renamed Post")
+
+    def test_season_list_is_purged_when_a_lesson_is_published(self):
+        from .models import Lesson, Season, Series
+
+        series = Series.objects.create(season=Season.objects.create(name="S"), name="Series")
+        lesson = Lesson.objects.create(series=series, title="Somo", status="draft")
+        url = "/api/v1/content/seasons/"
+        self.assertEqual(self.client.get(url).data["results"][0]["series"][0]["lessons_count"], 0)
+
+        lesson.status = "published"
+        lesson.save()
+        self.assertEqual(self.client.get(url).data["results"][0]["series"][0]["lessons_count"], 1)
+
+    def test_staff_and_public_do_not_share_entries(self):
+        draft = Post.objects.create(
+            title="Draft", content="x", category=self.category,
+            author=self.admin_user, status="draft",
+        )
+        url = "/api/v1/content/posts/"
+        self.assertEqual(len(self.client.get(url).data["results"]), 1)
+
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIn(draft.id, [p["id"] for p in response.data["results"]])
+
+        stats = self.client.get("/api/v1/core/api/cache/stats/").data
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 2))
+
+
+class ConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="writer", password="testpass123")
+        self.category = Category.objects.create(name="Test Category")
+        self.post = Post.objects.create(
+            title="Etag Post",
+            content="Test content",
+            category=self.category,
+            author=self.user,
+            status="published",
+        )
+
+    def test_detail_returns_304_until_post_changes(self):
+        url = f"/api/v1/content/posts/{self.post.id}/"
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+        self.post.content = "Changed"
+        self.post.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag_tracks_row_count(self):
+        url = "/api/v1/content/posts/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+        Post.objects.filter(pk=self.post.pk).delete()
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_200_OK,
+        )
+
+
+class CursorPaginationTest(APITestCase):
+    def setUp(self):
+        from .models import Lesson, LessonComment, Season, Series
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="commenter", password="testpass123")
+        season = Season.objects.create(name="Season 1")
+        series = Series.objects.create(season=season, name="Series 1")
+        lesson = Lesson.objects.create(series=series, title="Lesson 1", status="published")
+        self.comments = [
+            LessonComment.objects.create(user=self.user, lesson=lesson, body=f"c{i}")
+            for i in range(5)
+        ]
+
+    def test_cursor_mode_walks_feed_without_count(self):
+        url = "/api/v1/content/lesson-comments/"
+        seen = []
+        response = self.client.get(url, {"cursor": "", "page_size": 2})
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+        while True:
+            seen += [c["id"] for c in response.data["results"]]
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(seen, [c.id for c in reversed(self.comments)])
+
+        back = self.client.get(response.data["previous"])
+        self.assertEqual([c["id"] for c in back.data["results"]], seen[2:4])
+
+    def test_bad_cursor_is_404(self):
+        response = self.client.get("/api/v1/content/lesson-comments/", {"cursor": "zzz"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_mode_is_default(self):
+        response = self.client.get("/api/v1/content/lesson-comments/")
+        self.assertEqual(response.data["count"], 5)
+
+
+class LessonEngagementTest(APITestCase):
+    def setUp(self):
+        from .models import Lesson, Season, Series
+
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="msomaji", password="testpass123")
+        series = Series.objects.create(season=Season.objects.create(name="S"), name="Series")
+        self.lessons = [
+            Lesson.objects.create(series=series, title=f"Somo {i}", status="published", order=i)
+            for i in range(3)
+        ]
+
+    def test_counters_follow_likes_and_comment_approval(self):
+        from .models import Lesson, LessonComment
+
+        lesson = self.lessons[0]
+        self.client.force_authenticate(user=self.user)
+        url = f"/api/v1/content/lessons/{lesson.id}/"
+        self.assertEqual(self.client.post(url + "toggle_like/").data["like_count"], 1)
+        self.client.post(url + "add_comment/", {"body": "Amina"})
+        comment = LessonComment.objects.get(lesson=lesson)
+        comment.is_approved = False
+        comment.save()
+        lesson.refresh_from_db()
+        self.assertEqual((lesson.like_count, lesson.comment_count), (1, 0))
+
+        self.assertEqual(self.client.post(url + "toggle_like/").data["like_count"], 0)
+        Lesson.objects.filter(pk=lesson.pk).update(like_count=9)
+        call_command("repair_lesson_counters", stdout=StringIO())
+        lesson.refresh_from_db()
+        self.assertEqual(lesson.like_count, 0)
+
+    def test_liked_by_me_is_annotated_in_list_query(self):
+        from .models import LessonLike
+
+        LessonLike.objects.create(user=self.user, lesson=self.lessons[1])
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/v1/content/lessons/")
+        liked = {row["id"]: row["liked_by_me"] for row in response.data["results"]}
+        self.assertEqual(liked, {l.id: l == self.lessons[1] for l in self.lessons})
+
+        other = User.objects.create_user(username="mwingine", password="testpass123")
+        self.client.force_authenticate(user=other)
+        response = self.client.get("/api/v1/content/lessons/")
+        self.assertFalse(any(row["liked_by_me"] for row in response.data["results"]))
+
+    def test_other_users_like_and_comment_change_etags(self):
+        from .models import LessonComment, LessonLike
+
+        lesson = self.lessons[0]
+        detail_url = f"/api/v1/content/lessons/{lesson.id}/"
+        list_url = "/api/v1/content/lessons/"
+        detail = self.client.get(detail_url)
+        listing = self.client.get(list_url)
+
+        other = User.objects.create_user(username="mwingine", password="testpass123")
+        with self.captureOnCommitCallbacks(execute=True):
+            LessonLike.objects.create(user=other, lesson=lesson)
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["like_count"], 1)
+        response = self.client.get(list_url, HTTP_IF_NONE_MATCH=listing["ETag"])
+        self.assertEqual(response.status_code, 200)
+        counts = {row["id"]: row["like_count"] for row in response.data["results"]}
+        self.assertEqual(counts[lesson.id], 1)
+
+        detail, listing = self.client.get(detail_url), self.client.get(list_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            LessonComment.objects.create(user=other, lesson=lesson, body="Amina", is_approved=True)
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail["ETag"])
+        self.assertEqual((response.status_code, response.data["comment_count"]), (200, 1))
+        response = self.client.get(list_url, HTTP_IF_NONE_MATCH=listing["ETag"])
+        self.assertEqual(response.status_code, 200)
+
+    def test_staff_users_get_their_own_liked_by_me(self):
+        from .models import LessonLike
+
+        admins = [
+            User.objects.create_user(username=f"admin{i}", password="testpass123", is_staff=True)
+            for i in range(2)
+        ]
+        for admin, lesson in zip(admins, self.lessons):
+            LessonLike.objects.create(user=admin, lesson=lesson)
+        for admin, lesson in zip(admins, self.lessons):
+            self.client.force_authenticate(user=admin)
+            response = self.client.get("/api/v1/content/lessons/")
+            liked = {row["id"] for row in response.data["results"] if row["liked_by_me"]}
+            self.assertEqual(liked, {lesson.id})
+
+    def test_like_does_not_touch_updated_at_and_refreshes_liker_cache(self):
+        from .models import Lesson
+
+        lesson = self.lessons[0]
+        before = Lesson.objects.get(pk=lesson.pk).updated_at
+        self.client.force_authenticate(user=self.user)
+        first = self.client.get("/api/v1/content/lessons/")
+        self.assertFalse(any(row["liked_by_me"] for row in first.data["results"]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"/api/v1/content/lessons/{lesson.id}/toggle_like/")
+        self.assertEqual(Lesson.objects.get(pk=lesson.pk).updated_at, before)
+
+        response = self.client.get("/api/v1/content/lessons/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        liked = {row["id"] for row in response.data["results"] if row["liked_by_me"]}
+        self.assertEqual(liked, {lesson.id})
+
+
+class ListOnlyFieldsTest(APITestCase):
+    def setUp(self):
+        from .models import Lesson, MediaItem, Season, Series
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="mwandishi", password="testpass123")
+        category = Category.objects.create(name="Habari")
+        series = Series.objects.create(season=Season.objects.create(name="S"), name="Series")
+        for i in range(3):
+            Post.objects.create(
+                title=f"Post {i}", content="maneno " * 50, category=category,
+                author=self.user, status="published",
+            )
+            Lesson.objects.create(
+                series=series, title=f"Somo {i}", status="published",
+                content="somo " * 50, video_embed_code="<iframe></iframe>",
+            )
+            MediaItem.objects.create(title=f"Media {i}", media_type="video", category=category)
+
+    def test_list_endpoints_never_load_deferred_fields(self):
+        from core.testing import assert_no_deferred_loads
+
+        self.client.force_authenticate(user=self.user)
+        for url in (
+            "/api/v1/content/posts/",
+            "/api/v1/content/lessons/",
+            "/api/v1/content/media/",
+        ):
+            with self.subTest(url=url), assert_no_deferred_loads():
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.data["results"]), 3)
+
+    def test_helper_reports_per_row_refetch(self):
+        from core.testing import assert_no_deferred_loads
+
+        with self.assertRaises(AssertionError):
+            with assert_no_deferred_loads():
+                [post.content for post in Post.objects.only("title")]
+
+
+class AnnotatedCountsTest(APITestCase):
+    def setUp(self):
+        from .models import Lesson, Season, Series
+
+        cache.clear()
+        self.client = APIClient()
+        for s in range(3):
+            season = Season.objects.create(name=f"Msimu {s}", order=s)
+            for n in range(2):
+                series = Series.objects.create(season=season, name=f"Series {s}-{n}", order=n)
+                Lesson.objects.create(series=series, title=f"Somo {s}-{n}", status="published")
+                Lesson.objects.create(series=series, title=f"Rasimu {s}-{n}")
+
+    def test_nested_counts_do_not_query_per_row(self):
+        # count + seasons + prefetch ya series (iliyo-annotated)
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/v1/content/seasons/")
+        season = response.data["results"][0]
+        self.assertEqual(season["series_count"], 2)
+        self.assertEqual([s["lessons_count"] for s in season["series"]], [1, 1])
+
+    def test_fallback_without_annotation(self):
+        from .models import Series
+        from .serializers import SeriesSerializer
+
+        series = Series.objects.first()
+        self.assertEqual(SeriesSerializer(series).data["lessons_count"], 1)
+
 
 class PrayerRequestAPITest(APITestCase):
     def setUp(self):
@@ -213,6 +581,87 @@ class BibleStudyGroupAPITest(APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+        # member_count = members + leader, hata kwenye list iliyochujwa kwa members
+        response = self.client.get("/api/v1/content/bible-study-groups/")
+        self.assertEqual(response.data["results"][0]["member_count"], 2)
+
+
+class MissionHeatmapTest(APITestCase):
+    def setUp(self):
+        from django.utils import timezone
+        from .models import MissionMapLocation
+
+        self.client = APIClient()
+        self.missionary = User.objects.create_user(username="mmisionari", password="testpass123")
+        self.staff = User.objects.create_user(username="staff", password="testpass123", is_staff=True)
+
+        def visit(lat, lng, souls, user=None):
+            return MissionMapLocation.objects.create(
+                missionary=user or self.missionary, location_name="Kijiji",
+                gps_coordinates={"lat": lat, "lng": lng}, date_visited=timezone.now(),
+                visit_type="door_to_door", souls_contacted=souls,
+            )
+
+        self.visit = visit
+        self.dar = visit(-6.80, 39.28, 5)
+        visit(-6.81, 39.27, 3)
+        visit(-3.37, 36.68, 2)  # Arusha
+
+    def test_cells_are_binned_and_clipped_to_bbox(self):
+        url = "/api/v1/content/mission/heatmap-data/"
+        self.client.force_authenticate(user=self.missionary)
+
+        response = self.client.get(url, {"zoom": 6})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        cells = response.data["cells"]
+        self.assertEqual(len(cells), 2)
+        self.assertEqual((cells[0]["visits"], cells[0]["weight"]), (2, 8))
+
+        response = self.client.get(url, {"zoom": 6, "bbox": "38,-8,40,-6"})
+        self.assertEqual([c["weight"] for c in response.data["cells"]], [8])
+
+    def test_bins_follow_edits_and_deletes(self):
+        from .models import MissionHeatmapCell
+
+        self.dar.souls_contacted = 10
+        self.dar.save()
+        self.client.force_authenticate(user=self.staff)
+        self.visit(-6.80, 39.28, 1, user=self.staff)
+        response = self.client.get(
+            "/api/v1/content/mission-map-locations/heatmap_data/",
+            {"zoom": 6, "bbox": "38,-8,40,-6"},
+        )
+        self.assertEqual(response.data["cells"][0]["weight"], 14)
+
+        self.dar.delete()
+        call_command("rebuild_mission_heatmap", stdout=StringIO())
+        self.assertEqual(
+            MissionHeatmapCell.objects.filter(zoom=6).aggregate(n=models.Sum("weight"))["n"], 6
+        )
+
+    def test_bad_bbox(self):
+        self.client.force_authenticate(user=self.missionary)
+        response = self.client.get("/api/v1/content/mission/heatmap-data/", {"bbox": "x"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_nearby_radius_and_nearest(self):
+        self.assertEqual((self.dar.latitude, self.dar.longitude), (-6.80, 39.28))
+        url = "/api/v1/content/mission-map-locations/nearby/"
+        self.client.force_authenticate(user=self.missionary)
+
+        response = self.client.get(url, {"lat": -6.80, "lng": 39.28, "radius_km": 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["results"][0]["distance_km"], 0)
+
+        response = self.client.get(url, {"lat": -3.0, "lng": 36.0, "nearest": 1})
+        self.assertEqual(response.data["results"][0]["location_name"], "Kijiji")
+        self.assertAlmostEqual(response.data["results"][0]["distance_km"], 85.7, delta=1)
+
+        response = self.client.get(url, {"bbox": "36,-4,37,-3"})
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(self.client.get(url, {"lat": 100, "lng": 0}).status_code, 400)
+
 
 class GlobalSoulsCounterTest(APITestCase):
     def setUp(self):
@@ -226,6 +675,103 @@ class GlobalSoulsCounterTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("total_souls_reached", response.data)
 
+    def test_sharded_increments_and_reconcile(self):
+        from django.utils import timezone
+        from .models import BaptismRecord, GlobalCounterShard, MissionReport
+
+        missionary = User.objects.create_user(username="mshards", password="testpass123")
+        report = MissionReport.objects.create(
+            missionary=missionary, title="Kampeni", location="Mwanza",
+            date_conducted=timezone.now(), souls_reached=7, baptisms_performed=2,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            report.is_verified = True
+            report.save()
+            BaptismRecord.objects.create(
+                missionary=missionary, candidate_name="Yohana", baptism_date=timezone.now(),
+                location="Ziwa Victoria",
+            )
+        self.assertTrue(GlobalCounterShard.objects.exists())
+
+        response = self.client.get("/api/v1/content/global/stats/")
+        counter = response.data["global_counter"]
+        self.assertEqual((counter["total_souls_reached"], counter["total_baptisms"]), (7, 3))
+
+        GlobalCounterShard.objects.update(total_souls_reached=100)  # drift
+        call_command("reconcile_global_counters", stdout=StringIO())
+        stats = self.client.get("/api/v1/content/global-souls-counter/dashboard_stats/").data
+        self.assertEqual((stats["total_souls_reached"], stats["total_mission_reports"]), (7, 1))
+
+    def test_group_deactivation_updates_counter(self):
+        from .models import BibleStudyGroup
+        from .services import global_counter
+
+        leader = User.objects.create_user(username="kiongozi", password="testpass123")
+        with self.captureOnCommitCallbacks(execute=True):
+            groups = [
+                BibleStudyGroup.objects.create(group_name=f"Kundi {i}", leader=leader)
+                for i in range(3)
+            ]
+        self.assertEqual(global_counter.snapshot().total_bible_study_groups, 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            groups[0].is_active = False
+            groups[0].save()
+            groups[0].save()  # hakuna mabadiliko
+        self.assertEqual(global_counter.snapshot().total_bible_study_groups, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            updated = global_counter.set_groups_active(BibleStudyGroup.objects.all(), False)
+        self.assertEqual(updated, 2)
+        self.assertEqual(global_counter.snapshot().total_bible_study_groups, 0)
+
+    @override_settings(GLOBAL_STATS_RECOMPUTE_INTERVAL=60)
+    def test_debounced_recompute_has_trailing_edge(self):
+        from .services import global_counter
+
+        cache.clear()
+        users = []
+        for i in range(2):
+            with self.captureOnCommitCallbacks(execute=True):
+                users.append(User.objects.create_user(username=f"leading{i}", password="testpass123"))
+                DiscipleshipJourney.objects.filter(user=users[-1]).update(missionary_completed=True)
+                global_counter.mark_dirty()
+        # Event ya kwanza: recompute ya inline; ya pili iko ndani ya interval
+        self.assertEqual(GlobalSoulsCounter.objects.get(pk=1).active_missionaries, 1)
+        self.assertEqual(global_counter.snapshot().active_missionaries, 1)
+
+        cache.delete(global_counter.RECOMPUTE_TICK_KEY)  # interval imeisha
+        with self.captureOnCommitCallbacks(execute=True):
+            global_counter.snapshot()
+        self.assertEqual(GlobalSoulsCounter.objects.get(pk=1).active_missionaries, 2)
+        self.assertEqual(global_counter.snapshot().active_missionaries, 2)
+
+    @override_settings(GLOBAL_STATS_RECOMPUTE_INTERVAL=0)
+    def test_derived_stats_recompute_is_deferred(self):
+        from .services.global_counter import recompute_derived_stats
+
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                user = User.objects.create_user(username=f"bulk{i}", password="testpass123")
+            DiscipleshipJourney.objects.filter(user=user).update(missionary_completed=True)
+        self.assertEqual(GlobalSoulsCounter.objects.get(pk=1).active_missionaries, 0)
+
+        # Flag ya LocMem haionekani kwa process nyingine: command inakataa bila --force
+        with self.assertRaises(CommandError):
+            call_command("recompute_global_stats", stdout=StringIO())
+        self.assertTrue(recompute_derived_stats())
+        self.assertEqual(GlobalSoulsCounter.objects.get(pk=1).active_missionaries, 1)
+
+        # Login (update_fields=last_login) haiashirii stats wala haisomi user upya
+        with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(1):
+            user.save(update_fields=["last_login"])
+        self.assertFalse(recompute_derived_stats())
+
+        out = StringIO()
+        call_command("recompute_global_stats", "--force", stdout=out)
+        self.assertIn("Recomputed", out.getvalue())
+
 
 class UserDashboardTest(APITestCase):
     def setUp(self):
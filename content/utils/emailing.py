@@ -4,7 +4,6 @@ from __future__ import annotations
 import logging
 from typing import Iterable, Optional
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template import TemplateDoesNotExist
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
@@ -12,6 +11,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
 
 from content.models import Lesson, MissionReport, DiscipleshipJourney, Certificate
+from notifications.email_outbox import enqueue_email
 
 logger = logging.getLogger(__name__)
 UserModel = get_user_model()
@@ -43,27 +43,24 @@ def send_html_email(
     bcc: Optional[Iterable[str]] = None,
 ) -> bool:
     """
-    Tuma barua pepe (text + HTML).
+    Panga barua pepe (text + HTML) kwenye EmailOutbox; inatumwa na
+    `manage.py send_email_outbox` (retry, rate limit, status ya kila message).
     """
     text_body, html_body = _render_email_bodies(template_name, context)
 
-    msg = EmailMultiAlternatives(
-        subject=subject,
-        body=text_body,
-        from_email=_get_from_email(),
-        to=[to_email],
-        bcc=list(bcc) if bcc else None,
-        reply_to=list(reply_to) if reply_to else None,
-    )
-    msg.attach_alternative(html_body, "text/html")
-
-    fail_silently = getattr(settings, "EMAIL_FAIL_SILENTLY", settings.DEBUG)
-
     try:
-        sent = msg.send(fail_silently=fail_silently)
-        return bool(sent)
+        enqueue_email(
+            subject,
+            text_body,
+            to_email,
+            html_body=html_body,
+            from_email=_get_from_email(),
+            bcc=bcc,
+            reply_to=reply_to,
+        )
+        return True
     except Exception as e:
-        logger.exception("Email send failed (to=%s, subject=%s): %s", to_email, subject, e)
+        logger.exception("Email enqueue failed (to=%s, subject=%s): %s", to_email, subject, e)
         return False
 
 # ==================== MISSION PLATFORM EMAILS ====================
@@ -262,51 +259,25 @@ def send_bulk_missionary_update(missionaries: Iterable[AbstractBaseUser], update
     """
     site_name = getattr(settings, "SITE_NAME", "GOD CARES 365")
     total_sent = 0
-    
-    # Use single connection for better performance
-    fail_silently = getattr(settings, "EMAIL_FAIL_SILENTLY", settings.DEBUG)
-    connection = get_connection(fail_silently=fail_silently)
-    
-    try:
-        connection.open()
-    except Exception as e:
-        logger.exception("Failed to open email connection: %s", e)
-        if fail_silently:
-            return 0
-        raise
-    
-    try:
-        for missionary in missionaries:
-            ctx = {
-                "user": missionary,
-                "site_name": site_name,
-                "update_data": update_data
-            }
-            
-            text_body, html_body = _render_email_bodies("emails/missionary_update.html", ctx)
-            
-            msg = EmailMultiAlternatives(
-                subject=f"🌍 Mission Update - {site_name}",
-                body=text_body,
-                from_email=_get_from_email(),
-                to=[missionary.email],
-                connection=connection,
-            )
-            msg.attach_alternative(html_body, "text/html")
-            
-            try:
-                sent = msg.send(fail_silently=fail_silently)
-                total_sent += int(bool(sent))
-            except Exception as e:
-                logger.warning("Could not send missionary update to %s: %s", missionary.email, e)
-                if not fail_silently:
-                    raise
-    finally:
-        try:
-            connection.close()
-        except Exception:
-            pass
-    
+
+    # Worker wa outbox anatuma zote kwa connection moja
+    for missionary in missionaries:
+        ctx = {
+            "user": missionary,
+            "site_name": site_name,
+            "update_data": update_data
+        }
+
+        success = send_html_email(
+            subject=f"🌍 Mission Update - {site_name}",
+            to_email=missionary.email,
+            template_name="emails/missionary_update.html",
+            context=ctx,
+        )
+
+        if success:
+            total_sent += 1
+
     return total_sent
 
 def send_announcement_to_subscribers(announcement, subscribers: Iterable[AbstractBaseUser]) -> int:
@@ -315,50 +286,24 @@ def send_announcement_to_subscribers(announcement, subscribers: Iterable[Abstrac
     """
     site_name = getattr(settings, "SITE_NAME", "GOD CARES 365")
     total_sent = 0
-    
-    fail_silently = getattr(settings, "EMAIL_FAIL_SILENTLY", settings.DEBUG)
-    connection = get_connection(fail_silently=fail_silently)
-    
-    try:
-        connection.open()
-    except Exception as e:
-        logger.exception("Failed to open email connection: %s", e)
-        if fail_silently:
-            return 0
-        raise
-    
-    try:
-        for subscriber in subscribers:
-            ctx = {
-                "user": subscriber,
-                "site_name": site_name,
-                "announcement": announcement
-            }
-            
-            text_body, html_body = _render_email_bodies("emails/announcement.html", ctx)
-            
-            msg = EmailMultiAlternatives(
-                subject=f"📢 {announcement.title} - {site_name}",
-                body=text_body,
-                from_email=_get_from_email(),
-                to=[subscriber.email],
-                connection=connection,
-            )
-            msg.attach_alternative(html_body, "text/html")
-            
-            try:
-                sent = msg.send(fail_silently=fail_silently)
-                total_sent += int(bool(sent))
-            except Exception as e:
-                logger.warning("Could not send announcement to %s: %s", subscriber.email, e)
-                if not fail_silently:
-                    raise
-    finally:
-        try:
-            connection.close()
-        except Exception:
-            pass
-    
+
+    for subscriber in subscribers:
+        ctx = {
+            "user": subscriber,
+            "site_name": site_name,
+            "announcement": announcement
+        }
+
+        success = send_html_email(
+            subject=f"📢 {announcement.title} - {site_name}",
+            to_email=subscriber.email,
+            template_name="emails/announcement.html",
+            context=ctx,
+        )
+
+        if success:
+            total_sent += 1
+
     return total_sent
 
 # ==================== LEGACY FUNCTIONS (FOR COMPATIBILITY) ====================
@@ -8,6 +8,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 
 from django.db.models import Q, Count, Prefetch, Sum
+from django.conf import settings
 from django.utils import timezone
 
 from .models import (
@@ -27,11 +28,17 @@ from .serializers import (
     GlobalSoulsCounterSerializer
 )
 from .permissions import AdminOrReadOnly
+from .services.view_counts import record_view
+from .services import engagement, geo, global_counter, heatmap
+from core.response_cache import CachedResponseMixin, cache_response, tags_version
+from core.conditional import ConditionalGetMixin
+from core.pagination import CreatedAtCursorPagination
+from core.querysets import AnnotatedCountsMixin, ListOnlyFieldsMixin
 
 
 # ==================== CONTENT VIEWSETS ====================
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(AnnotatedCountsMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all().order_by("name")
     serializer_class = CategorySerializer
     permission_classes = [AdminOrReadOnly]
@@ -42,8 +49,10 @@ class CategoryViewSet(viewsets.ModelViewSet):
     ordering = ["name"]
 
 
-class PostViewSet(viewsets.ModelViewSet):
+class PostViewSet(ConditionalGetMixin, CachedResponseMixin, ListOnlyFieldsMixin, viewsets.ModelViewSet):
     queryset = Post.objects.select_related("category", "author").all()
+    cache_tags = ("content.Post", "content.Category")
+    pagination_class = CreatedAtCursorPagination
     permission_classes = [AdminOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["status", "featured", "category", "author"]
@@ -62,16 +71,16 @@ class PostViewSet(viewsets.ModelViewSet):
             return PostDetailSerializer
         return PostListSerializer
 
-    @action(detail=True, methods=["post"])
+    @action(detail=True, methods=["post"], permission_classes=[permissions.AllowAny])
     def increment_views(self, request, pk=None):
         post = self.get_object()
-        post.views += 1
-        post.save()
-        return Response({"views": post.views})
+        pending = record_view(post)
+        return Response({"views": post.views + pending})
 
 
-class SeasonViewSet(viewsets.ModelViewSet):
+class SeasonViewSet(CachedResponseMixin, AnnotatedCountsMixin, viewsets.ModelViewSet):
     queryset = Season.objects.prefetch_related("series").all()
+    cache_tags = ("content.Season", "content.Series", "content.Lesson")  # lessons_count
     serializer_class = SeasonSerializer
     permission_classes = [AdminOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -81,8 +90,9 @@ class SeasonViewSet(viewsets.ModelViewSet):
     ordering = ["order"]
 
 
-class SeriesViewSet(viewsets.ModelViewSet):
-    queryset = Series.objects.select_related("season").prefetch_related("lessons").all()
+class SeriesViewSet(CachedResponseMixin, AnnotatedCountsMixin, viewsets.ModelViewSet):
+    queryset = Series.objects.select_related("season").all()
+    cache_tags = ("content.Series", "content.Season", "content.Lesson")
     serializer_class = SeriesSerializer
     permission_classes = [AdminOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -92,8 +102,13 @@ class SeriesViewSet(viewsets.ModelViewSet):
     ordering = ["season", "order"]
 
 
-class LessonViewSet(viewsets.ModelViewSet):
+class LessonViewSet(ConditionalGetMixin, CachedResponseMixin, ListOnlyFieldsMixin, viewsets.ModelViewSet):
     queryset = Lesson.objects.select_related("series", "series__season").all()
+    cache_tags = ("content.Lesson", "content.Series", "content.Season")
+    cache_per_user = True  # liked_by_me
+    # Counters haziguzi updated_at (content/services/engagement.py)
+    conditional_fields = ("like_count", "comment_count")
+    conditional_aggregates = {"likes": Sum("like_count"), "comments": Sum("comment_count")}
     permission_classes = [AdminOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["series", "status", "series__season"]
@@ -105,30 +120,45 @@ class LessonViewSet(viewsets.ModelViewSet):
         queryset = super().get_queryset()
         if not self.request.user.is_staff:
             queryset = queryset.filter(status="published")
+        if self.action == "list":
+            queryset = engagement.annotate_liked_by_me(queryset, self.request.user)
         return queryset
 
+    def _likes_tag(self):
+        user = self.request.user
+        return engagement.user_tag(user.pk) if user.is_authenticated else None
+
+    def get_cache_tags(self):
+        tag = self._likes_tag()
+        return self.cache_tags + ((tag,) if tag else ())
+
+    def conditional_etag_parts(self):
+        tag = self._likes_tag()
+        return (tags_version(tag),) if tag else ()
+
     def get_serializer_class(self):
         if self.action == "retrieve":
             return LessonDetailSerializer
         return LessonListSerializer
 
-    @action(detail=True, methods=["post"])
+    @action(detail=True, methods=["post"], permission_classes=[permissions.AllowAny])
     def increment_views(self, request, pk=None):
         lesson = self.get_object()
-        lesson.views += 1
-        lesson.save()
-        return Response({"views": lesson.views})
+        pending = record_view(lesson)
+        return Response({"views": lesson.views + pending})
 
     @action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated])
     def toggle_like(self, request, pk=None):
         lesson = self.get_object()
-        like, created = LessonLike.objects.get_or_create(user=request.user, lesson=lesson)
-
-        if not created:
-            like.delete()
-            return Response({"status": "unliked", "liked": False})
+        # Delete ya queryset: post_delete (na -1) inatumwa tu kama row ilikuwepo kweli
+        deleted, _ = LessonLike.objects.filter(user=request.user, lesson=lesson).delete()
+        if not deleted:
+            LessonLike.objects.get_or_create(user=request.user, lesson=lesson)
 
-        return Response({"status": "liked", "liked": True})
+        like_count = Lesson.objects.filter(pk=lesson.pk).values_list("like_count", flat=True).first()
+        if deleted:
+            return Response({"status": "unliked", "liked": False, "like_count": like_count})
+        return Response({"status": "liked", "liked": True, "like_count": like_count})
 
     @action(detail=True, methods=["get"])
     def comments(self, request, pk=None):
@@ -140,15 +170,18 @@ class LessonViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated])
     def add_comment(self, request, pk=None):
         lesson = self.get_object()
-        serializer = LessonCommentSerializer(data=request.data)
+        data = request.data.copy()
+        data["lesson"] = lesson.pk  # lesson inatoka kwenye URL
+        serializer = LessonCommentSerializer(data=data)
         if serializer.is_valid():
             serializer.save(user=request.user, lesson=lesson)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = Event.objects.all()
+    cache_tags = ("content.Event",)
     serializer_class = EventSerializer
     permission_classes = [AdminOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -158,19 +191,21 @@ class EventViewSet(viewsets.ModelViewSet):
     ordering = ["date"]
 
     @action(detail=False)
+    @cache_response(tags=("content.Event",))
     def upcoming(self, request):
         upcoming_events = self.get_queryset().filter(date__gte=timezone.now())
         serializer = self.get_serializer(upcoming_events, many=True)
         return Response(serializer.data)
 
     @action(detail=False)
+    @cache_response(tags=("content.Event",))
     def past(self, request):
         past_events = self.get_queryset().filter(date__lt=timezone.now())
         serializer = self.get_serializer(past_events, many=True)
         return Response(serializer.data)
 
 
-class MediaItemViewSet(viewsets.ModelViewSet):
+class MediaItemViewSet(ListOnlyFieldsMixin, viewsets.ModelViewSet):
     queryset = MediaItem.objects.select_related("category").all()
     serializer_class = MediaItemSerializer
     permission_classes = [AdminOrReadOnly]
@@ -180,12 +215,11 @@ class MediaItemViewSet(viewsets.ModelViewSet):
     ordering_fields = ["created_at", "views"]
     ordering = ["-created_at"]
 
-    @action(detail=True, methods=["post"])
+    @action(detail=True, methods=["post"], permission_classes=[permissions.AllowAny])
     def increment_views(self, request, pk=None):
         media_item = self.get_object()
-        media_item.views += 1
-        media_item.save()
-        return Response({"views": media_item.views})
+        pending = record_view(media_item)
+        return Response({"views": media_item.views + pending})
 
 
 class PrayerRequestViewSet(viewsets.ModelViewSet):
@@ -212,6 +246,7 @@ class PrayerRequestViewSet(viewsets.ModelViewSet):
 class LessonCommentViewSet(viewsets.ModelViewSet):
     queryset = LessonComment.objects.select_related("user", "lesson").all()
     serializer_class = LessonCommentSerializer
+    pagination_class = CreatedAtCursorPagination
     permission_classes = [AdminOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["lesson", "user", "is_approved"]
@@ -351,7 +386,50 @@ class StageProgressViewSet(viewsets.ModelViewSet):
         return Response({"status": "completed", "score": stage_progress.score})
 
 
-class MissionReportViewSet(viewsets.ModelViewSet):
+class GeoQueryMixin:
+    """
+    ``nearby`` action kwa models zenye ``latitude``/``longitude``:
+    ``?bbox=west,south,east,north`` au ``?lat=&lng=&radius_km=``
+    (au ``&nearest=N``). ``limit`` = max rows (default 100, max 500).
+    """
+    geo_default_limit = 100
+    geo_max_limit = 500
+
+    @action(detail=False)
+    def nearby(self, request):
+        params = request.query_params
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            limit = min(int(params.get("limit", self.geo_default_limit)), self.geo_max_limit)
+            if "bbox" in params:
+                bbox = heatmap.parse_bbox(params["bbox"])
+                rows = list(geo.within_bbox(queryset, *bbox)[:limit])
+            else:
+                lat, lng = float(params["lat"]), float(params["lng"])
+                if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+                    raise ValueError("lat/lng out of range")
+                if "nearest" in params:
+                    rows = geo.nearest(queryset, lat, lng, min(int(params["nearest"]), limit))
+                else:
+                    radius = float(params.get("radius_km", 10))
+                    if radius <= 0:
+                        raise ValueError("radius_km must be positive")
+                    rows = list(geo.within_radius(queryset, lat, lng, radius)[:limit])
+        except (KeyError, ValueError):
+            return Response(
+                {"error": "Provide bbox=west,south,east,north or lat, lng and radius_km/nearest."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        data = self.get_serializer(rows, many=True).data
+        for row, item in zip(rows, data):
+            distance = getattr(row, "distance_km", None)
+            if distance is not None:
+                item["distance_km"] = round(distance, 3)
+        return Response({"count": len(data), "results": data})
+
+
+class MissionReportViewSet(GeoQueryMixin, viewsets.ModelViewSet):
     serializer_class = MissionReportSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -401,7 +479,7 @@ class MissionReportViewSet(viewsets.ModelViewSet):
         )
 
 
-class BibleStudyGroupViewSet(viewsets.ModelViewSet):
+class BibleStudyGroupViewSet(GeoQueryMixin, AnnotatedCountsMixin, viewsets.ModelViewSet):
     serializer_class = BibleStudyGroupSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -492,7 +570,7 @@ class BaptismRecordViewSet(viewsets.ModelViewSet):
         return Response({"status": "follow up completed"})
 
 
-class MissionMapLocationViewSet(viewsets.ModelViewSet):
+class MissionMapLocationViewSet(GeoQueryMixin, viewsets.ModelViewSet):
     serializer_class = MissionMapLocationSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
@@ -510,22 +588,7 @@ class MissionMapLocationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False)
     def heatmap_data(self, request):
-        locations = self.get_queryset()
-        heatmap_data = []
-
-        for location in locations:
-            heatmap_data.append(
-                {
-                    "lat": location.gps_coordinates.get("lat"),
-                    "lng": location.gps_coordinates.get("lng"),
-                    "weight": location.souls_contacted,
-                    "location_name": location.location_name,
-                    "visit_type": location.visit_type,
-                    "date": location.date_visited,
-                }
-            )
-
-        return Response(heatmap_data)
+        return heatmap_response(request)
 
 
 class CertificateViewSet(viewsets.ModelViewSet):
@@ -560,24 +623,34 @@ class GlobalSoulsCounterViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         return GlobalSoulsCounter.objects.filter(pk=1)
 
+    # Base row + shards (tazama content/services/global_counter.py)
+    def list(self, request, *args, **kwargs):
+        rows = [global_counter.snapshot()] if self.get_queryset().exists() else []
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer(rows, many=True).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        self.get_object()
+        return Response(self.get_serializer(global_counter.snapshot()).data)
+
     @action(detail=False)
     def dashboard_stats(self, request):
-        global_counter = self.get_queryset().first()
-        if not global_counter:
-            global_counter = GlobalSoulsCounter.objects.create(pk=1)
+        counter = global_counter.snapshot()
 
         active_missionaries = DiscipleshipJourney.objects.filter(current_stage="missionary").count()
         active_groups = BibleStudyGroup.objects.filter(is_active=True).count()
 
         return Response(
             {
-                "total_souls_reached": global_counter.total_souls_reached,
-                "total_baptisms": global_counter.total_baptisms,
-                "total_mission_reports": global_counter.total_mission_reports,
-                "total_bible_study_groups": global_counter.total_bible_study_groups,
+                "total_souls_reached": counter.total_souls_reached,
+                "total_baptisms": counter.total_baptisms,
+                "total_mission_reports": counter.total_mission_reports,
+                "total_bible_study_groups": counter.total_bible_study_groups,
                 "active_missionaries": active_missionaries,
                 "active_groups": active_groups,
-                "last_updated": global_counter.last_updated,
+                "last_updated": counter.last_updated,
             }
         )
 
@@ -649,33 +722,46 @@ class UserJourneyProgressAPIView(APIView):
         )
 
 
+def heatmap_response(request):
+    """
+    Bins za heatmap kwa ``?zoom=&bbox=west,south,east,north``.
+    Staff wanaona wamisionari wote (au ``?missionary=<id>``); wengine bins zao tu.
+    """
+    try:
+        zoom = int(request.query_params.get("zoom", settings.MISSION_HEATMAP_DEFAULT_ZOOM))
+        raw_bbox = request.query_params.get("bbox")
+        bbox = heatmap.parse_bbox(raw_bbox) if raw_bbox else None
+        missionary = request.query_params.get("missionary")
+        missionary = int(missionary) if missionary else None
+    except ValueError:
+        return Response(
+            {"error": "zoom/missionary must be integers and bbox must be 'west,south,east,north'."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    zoom = max(0, min(zoom, heatmap.max_zoom()))
+    if not request.user.is_staff:
+        missionary = request.user.pk
+
+    cells, truncated = heatmap.cells_in_view(zoom, bbox, missionary)
+    return Response({"zoom": zoom, "bbox": bbox, "cells": cells, "truncated": truncated})
+
+
 class MissionHeatmapDataAPIView(APIView):
     """
-    Endpoint rahisi wa heatmap data (kwa user au kwa staff wote).
+    Heatmap ya mission map kwa tiles (kwa user au kwa staff wote).
     """
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        if request.user.is_staff:
-            locations = MissionMapLocation.objects.all()
-        else:
-            locations = MissionMapLocation.objects.filter(missionary=request.user)
-
-        data = []
-        for loc in locations:
-            data.append(
-                {
-                    "lat": loc.gps_coordinates.get("lat"),
-                    "lng": loc.gps_coordinates.get("lng"),
-                    "weight": loc.souls_contacted,
-                    "location_name": loc.location_name,
-                    "visit_type": loc.visit_type,
-                    "visit_type_display": loc.get_visit_type_display(),
-                    "date": loc.date_visited,
-                }
-            )
+        return heatmap_response(request)
 
-        return Response(data)
+
+GLOBAL_STATS_CACHE_TAGS = (
+    "content.GlobalSoulsCounter",
+    "content.DiscipleshipJourney",
+    "content.BibleStudyGroup",
+    "content.BaptismRecord",
+)
 
 
 class GlobalStatsAPIView(APIView):
@@ -684,8 +770,9 @@ class GlobalStatsAPIView(APIView):
     """
     permission_classes = [permissions.AllowAny]
 
+    @cache_response(tags=GLOBAL_STATS_CACHE_TAGS, timeout=60)
     def get(self, request):
-        global_counter, _ = GlobalSoulsCounter.objects.get_or_create(pk=1)
+        counter = global_counter.snapshot()
 
         journey_stats = DiscipleshipJourney.objects.aggregate(
             total_users=Count("id"),
@@ -700,7 +787,7 @@ class GlobalStatsAPIView(APIView):
 
         return Response(
             {
-                "global_counter": GlobalSoulsCounterSerializer(global_counter).data,
+                "global_counter": GlobalSoulsCounterSerializer(counter).data,
                 "journey_stats": journey_stats,
                 "active_groups": active_groups,
                 "total_baptism_records": total_baptism_records,
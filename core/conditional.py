@@ -0,0 +1,122 @@
+# core/conditional.py
+"""
+Conditional GET (ETag / Last-Modified) kwa ViewSets zenye ``updated_at``.
+
+- Detail: ETag = model + id + updated_at (+ ``conditional_fields``), inasomwa
+  kwa query ndogo (``values_list``) kabla ya ku-load row nzima.
+- List: ETag = max(updated_at) + idadi ya rows za queryset iliyochujwa
+  (+ ``conditional_aggregates``) + query string + bucket (public/staff, au
+  user kwa ``cache_per_user``).
+- ETag inawekwa kwenye ``self.conditional_etag``; CachedResponseMixin
+  inaiweka kwenye cache key, hivyo body iliyo-cache inalingana na ETag yake.
+Client akituma ``If-None-Match`` / ``If-Modified-Since`` inayolingana
+anapata 304 bila serializer kuguswa.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .response_cache import user_bucket
+
+
+def _timestamp(value):
+    return int(value.timestamp()) if value else None
+
+
+def make_etag(*parts):
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def conditional_response(request, etag, last_modified=None, use_last_modified=True):
+    """304 kama validators za request zinalingana, la sivyo None."""
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=_timestamp(last_modified) if use_last_modified else None,
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(_timestamp(last_modified))
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    Ongeza kwenye ModelViewSet (kabla ya mixins nyingine za list/retrieve).
+    ``conditional_fields`` / ``conditional_aggregates`` = fields (detail) na
+    aggregates (list) zinazobadilika bila kugusa ``updated_at`` (mf. counters).
+    """
+    last_modified_field = "updated_at"
+    conditional_fields = ()
+    conditional_aggregates = {}
+
+    def conditional_etag_parts(self):
+        """Sehemu za ziada za ETag ya list (mf. versions za tags za user)."""
+        return ()
+
+    def _label(self):
+        return self.get_queryset().model._meta.label_lower
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        stamp = (
+            queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+            .values_list("pk", self.last_modified_field, *self.conditional_fields)
+            .first()
+        )
+        if stamp is None:
+            # 404 ya kawaida
+            return super().retrieve(request, *args, **kwargs)
+
+        pk, modified, *extra = stamp
+        etag = make_etag(self._label(), pk, modified.isoformat() if modified else "", *extra)
+        self.conditional_etag = etag
+        not_modified = conditional_response(request, etag, modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().retrieve(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, etag, modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        state = queryset.order_by().aggregate(
+            latest=Max(self.last_modified_field),
+            total=Count("pk"),
+            **self.conditional_aggregates,
+        )
+        latest = state["latest"]
+        query = "&".join(sorted(request.META.get("QUERY_STRING", "").split("&")))
+        etag = make_etag(
+            self._label(),
+            latest.isoformat() if latest else "",
+            *(state[key] for key in sorted(state) if key != "latest"),
+            query,
+            user_bucket(request, getattr(self, "cache_per_user", False)),
+            *self.conditional_etag_parts(),
+        )
+        self.conditional_etag = etag
+        # Row ikifutwa max(updated_at) inaweza kurudi nyuma, hivyo list
+        # inategemea ETag tu (If-Modified-Since peke yake haitoi 304)
+        not_modified = conditional_response(
+            request, etag, latest, use_last_modified=False
+        )
+        if not_modified is not None:
+            return not_modified
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, etag, latest)
+        return response
@@ -0,0 +1,59 @@
+# core/fields.py
+"""
+Serializer fields za pamoja.
+
+``AnnotatedCountField`` = idadi ya related rows (mf. posts za category) bila
+COUNT kwa kila row: ``AnnotatedCountsMixin`` (core/querysets.py) inaongeza
+annotation kwenye queryset ya viewset, na field inaisoma. Bila annotation
+(serializer ikitumika nje ya viewset hiyo) inarudi kwenye query ya kawaida.
+"""
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from rest_framework import serializers
+
+
+class AnnotatedCountField(serializers.IntegerField):
+    """
+    ``AnnotatedCountField("posts", filter={"status": "published"})``
+
+    ``relation`` = jina la related manager kwenye model ya serializer;
+    ``filter`` = lookups juu ya related model; ``offset`` inaongezwa kwenye
+    matokeo (mf. +1 kwa leader wa group).
+    """
+
+    def __init__(self, relation, filter=None, offset=0, **kwargs):
+        kwargs["read_only"] = True
+        kwargs["source"] = "*"
+        self.relation = relation
+        self.filter = dict(filter or {})
+        self.offset = offset
+        self._fallback = {}
+        super().__init__(**kwargs)
+
+    @property
+    def annotation_name(self):
+        return f"annotated_{self.field_name}"
+
+    def annotation(self, model):
+        """Subquery ya COUNT (haiathiriwi na joins/filters za queryset ya nje)."""
+        field = model._meta.get_field(self.relation)
+        if field.auto_created and not field.concrete:
+            lookup = field.field.name  # reverse FK / reverse M2M
+        else:
+            lookup = field.related_query_name()  # forward M2M
+        related = field.related_model._base_manager.filter(
+            Q(**{lookup: OuterRef("pk")}), **self.filter
+        )
+        counts = related.order_by().values(lookup).annotate(n=Count("pk")).values("n")
+        return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+    def to_representation(self, instance):
+        value = getattr(instance, self.annotation_name, None)
+        if value is None:
+            # Hakuna annotation: query moja kwa kila object (memo ndani ya serializer)
+            key = (type(instance), instance.pk)
+            if key not in self._fallback:
+                manager = getattr(instance, self.relation)
+                self._fallback[key] = manager.filter(**self.filter).count()
+            value = self._fallback[key]
+        return int(value) + self.offset
@@ -70,6 +70,7 @@ class UserActivity(models.Model):
         indexes = [
             models.Index(fields=["user", "activity_type"]),
             models.Index(fields=["created_at"]),
+            models.Index(fields=["user", "created_at", "id"]),
         ]
 
     def __str__(self):
@@ -0,0 +1,150 @@
+# core/pagination.py
+"""
+Keyset (cursor) pagination juu ya ``(created_at, id)``.
+
+PageNumberPagination inafanya COUNT(*) kila ukurasa na OFFSET kubwa kwa
+kurasa za ndani. Kwa feeds kubwa, client anaweza kuomba ``?cursor=``
+(tupu kwa ukurasa wa kwanza) na kufuata ``next``/``previous``; kila
+ukurasa ni range scan kwenye index ``(…, created_at, id)`` bila COUNT.
+"""
+import base64
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+@dataclass
+class KeysetPage:
+    items: list
+    next_cursor: str = None
+    previous_cursor: str = None
+
+
+def encode_cursor(direction, created_at, pk):
+    raw = f"{direction}|{created_at.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Inarudisha (direction, created_at, pk); ValueError kama cursor si sahihi."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, stamp, pk = base64.urlsafe_b64decode(padded).decode().split("|")
+        if direction not in ("n", "p"):
+            raise ValueError(direction)
+        return direction, datetime.fromisoformat(stamp), int(pk)
+    except (TypeError, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def _cursor_for(direction, row, field):
+    # Rows zinaweza kuwa model instances au dicts (``.values("pk", …)``)
+    if isinstance(row, dict):
+        return encode_cursor(direction, row[field], row["pk"])
+    return encode_cursor(direction, getattr(row, field), row.pk)
+
+
+def keyset_page(queryset, cursor, page_size, field="created_at"):
+    """
+    Ukurasa mmoja wa ``queryset`` (mpya → wa zamani). ``cursor`` tupu/None =
+    ukurasa wa kwanza. Hakuna COUNT wala OFFSET.
+    """
+    if not cursor:
+        rows = list(queryset.order_by(f"-{field}", "-pk")[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        return KeysetPage(
+            items=rows,
+            next_cursor=_cursor_for("n", rows[-1], field) if has_more else None,
+        )
+
+    direction, stamp, pk = decode_cursor(cursor)
+    if direction == "n":
+        # Za zamani kuliko cursor
+        rows = list(
+            queryset.filter(Q(**{f"{field}__lt": stamp}) | Q(**{field: stamp, "pk__lt": pk}))
+            .order_by(f"-{field}", "-pk")[: page_size + 1]
+        )
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        return KeysetPage(
+            items=rows,
+            next_cursor=_cursor_for("n", rows[-1], field) if has_more else None,
+            previous_cursor=_cursor_for("p", rows[0], field) if rows else None,
+        )
+
+    # direction == "p": mpya kuliko cursor, soma kwa mpangilio wa kupanda kisha geuza
+    rows = list(
+        queryset.filter(Q(**{f"{field}__gt": stamp}) | Q(**{field: stamp, "pk__gt": pk}))
+        .order_by(field, "pk")[: page_size + 1]
+    )
+    has_more = len(rows) > page_size
+    rows = rows[:page_size][::-1]
+    return KeysetPage(
+        items=rows,
+        next_cursor=_cursor_for("n", rows[-1], field) if rows else None,
+        previous_cursor=_cursor_for("p", rows[0], field) if has_more else None,
+    )
+
+
+class CreatedAtCursorPagination(PageNumberPagination):
+    """
+    PageNumberPagination ya kawaida (``?page=``), au keyset pagination
+    ikiwa request ina ``?cursor=``. Response ya cursor mode:
+    ``{"next", "previous", "results"}`` (hakuna ``count``).
+    """
+    cursor_query_param = "cursor"
+    cursor_field = "created_at"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    cursor_mode = False
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            self.cursor_mode = False
+            return super().paginate_queryset(queryset, request, view)
+
+        self.cursor_mode = True
+        self.request = request
+        try:
+            self.keyset = keyset_page(
+                queryset,
+                request.query_params.get(self.cursor_query_param),
+                self.get_page_size(request),
+                field=self.cursor_field,
+            )
+        except ValueError:
+            raise NotFound("Invalid cursor.")
+        return self.keyset.items
+
+    def _cursor_link(self, cursor):
+        if cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self._cursor_link(self.keyset.next_cursor)),
+                    ("previous", self._cursor_link(self.keyset.previous_cursor)),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"]["description"] = "Haipo kwenye ?cursor= mode."
+        return response_schema
@@ -0,0 +1,174 @@
+# core/querysets.py
+"""
+``only()`` inayotokana na fields za serializer.
+
+List serializers hutumia sehemu ndogo ya columns, lakini ``Model.objects``
+inasoma zote (``content``, ``video_embed_code`` ...). ``serializer_only_fields``
+inapitia fields za serializer (pamoja na nested serializers na relations
+zilizo kwenye ``select_related``) na kurudisha paths za ``only()``.
+
+- SerializerMethodField haijulikani inasoma nini: iorodheshe kwenye
+  ``Meta.only_extra`` ya serializer.
+- Source isiyo field ya model (property, ``source="*"``) = hakuna ``only()``
+  (salama kuliko refetch kwa kila row).
+- Kwenye relation, attribute isiyo field (mf. ``author.get_full_name``)
+  inasoma row nzima ya relation hiyo.
+
+Tumia ``core.testing.assert_no_deferred_loads`` kwenye tests kuhakikisha
+list haigusi field iliyo-deferred.
+
+``AnnotatedCountsMixin`` inaongeza annotations za ``AnnotatedCountField``
+(core/fields.py) za serializer, pamoja na za nested ``many=True`` serializers
+(kupitia ``Prefetch`` yenye queryset iliyo-annotated).
+"""
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from .fields import AnnotatedCountField
+
+
+class _Unresolved(Exception):
+    pass
+
+
+def _select_related_paths(tree, prefix=""):
+    paths = set()
+    for name, children in (tree or {}).items():
+        path = f"{prefix}{name}"
+        paths.add(path)
+        paths |= _select_related_paths(children, f"{path}__")
+    return paths
+
+
+def _model_at(model, path):
+    for name in path.split("__"):
+        model = model._meta.get_field(name).related_model
+    return model
+
+
+def _resolve(model, attrs, prefix, joined):
+    name = attrs[0]
+    if name.startswith("get_") and name.endswith("_display"):
+        name = name[4:-8]
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        raise _Unresolved(f"{model._meta.label}.{name}")
+
+    if field.many_to_many or field.one_to_many or not field.concrete:
+        return set()  # related manager / reverse: hakuna column
+    path = f"{prefix}{name}"
+    if not field.is_relation or path not in joined:
+        return {path}
+    if len(attrs) == 1:
+        return {f"{path}__{field.related_model._meta.pk.name}"}
+    try:
+        return _resolve(field.related_model, attrs[1:], f"{path}__", joined)
+    except _Unresolved:
+        return {path}  # row nzima ya relation
+
+
+def _walk(serializer, model, prefix, joined):
+    paths = {f"{prefix}{name}" for name in getattr(serializer.Meta, "only_extra", ())}
+    for field in serializer.fields.values():
+        if field.write_only or isinstance(
+            field, (serializers.SerializerMethodField, AnnotatedCountField)
+        ):
+            continue
+        if isinstance(field, (serializers.ListSerializer, serializers.ManyRelatedField)):
+            continue
+        if field.source == "*":
+            raise _Unresolved("source='*'")
+
+        if isinstance(field, serializers.BaseSerializer) and hasattr(field, "Meta"):
+            # Nested serializer ya relation moja
+            relation = f"{prefix}{'__'.join(field.source_attrs)}"
+            if relation in joined:
+                paths |= _walk(field, field.Meta.model, f"{relation}__", joined)
+                continue
+        paths |= _resolve(model, field.source_attrs, prefix, joined)
+    return paths
+
+
+@lru_cache(maxsize=None)
+def _cached_fields(serializer_class, model, joined):
+    try:
+        paths = _walk(serializer_class(), model, "", joined)
+    except _Unresolved:
+        return None
+    # Kila relation ya select_related lazima ibaki kwenye SELECT
+    for relation in joined:
+        pk_name = _model_at(model, relation)._meta.pk.name
+        if not any(p.startswith(f"{relation}__") or p == relation for p in paths):
+            paths.add(f"{relation}__{pk_name}")
+    return tuple(sorted(paths))
+
+
+def serializer_only_fields(serializer_class, queryset):
+    """Paths za ``queryset.only(...)`` kwa ``serializer_class``, au None."""
+    if queryset.query.select_related is True:
+        return None  # select_related() bila majina: relations hazijulikani
+    joined = frozenset(_select_related_paths(queryset.query.select_related))
+    return _cached_fields(serializer_class, queryset.model, joined)
+
+
+class ListOnlyFieldsMixin:
+    """
+    Weka ``only()`` kwenye queryset ya ``only_actions`` (default: list) kwa
+    kutumia serializer ya action hiyo. Iweke kabla ya ModelViewSet.
+    """
+    only_actions = ("list",)
+    only_extra = ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if getattr(self, "action", None) not in self.only_actions:
+            return queryset
+        fields = serializer_only_fields(self.get_serializer_class(), queryset)
+        if fields is None:
+            return queryset
+        extra = list(self.only_extra)
+        cursor_field = getattr(self.pagination_class, "cursor_field", None)
+        if cursor_field:
+            extra.append(cursor_field)  # keyset pagination inasoma field hii
+        return queryset.only(*fields, *extra)
+
+
+# --------------------------- Annotated counts ---------------------------
+def annotate_counts(queryset, serializer_class):
+    """Ongeza annotations za AnnotatedCountField za ``serializer_class``."""
+    serializer = serializer_class()
+    model = queryset.model
+    annotations = {}
+    prefetches = []
+    for field in serializer.fields.values():
+        if isinstance(field, AnnotatedCountField):
+            annotations[field.annotation_name] = field.annotation(model)
+        elif isinstance(field, serializers.ListSerializer) and hasattr(field.child, "Meta"):
+            child_class = type(field.child)
+            child_model = child_class.Meta.model
+            child_qs = annotate_counts(child_model._default_manager.all(), child_class)
+            if child_qs.query.annotations:
+                prefetches.append(Prefetch(field.source, queryset=child_qs))
+
+    if prefetches:
+        # Badilisha prefetch ya kawaida ya relation hiyo (kama ipo) na ya annotated
+        replaced = {p.prefetch_to for p in prefetches}
+        existing = [
+            lookup for lookup in queryset._prefetch_related_lookups
+            if (lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup) not in replaced
+        ]
+        queryset = queryset.prefetch_related(None).prefetch_related(*existing, *prefetches)
+    if annotations:
+        queryset = queryset.annotate(**annotations)
+    return queryset
+
+
+class AnnotatedCountsMixin:
+    """Annotate queryset ya viewset kwa counts za serializer yake. Iweke kabla ya ModelViewSet."""
+
+    def get_queryset(self):
+        return annotate_counts(super().get_queryset(), self.get_serializer_class())
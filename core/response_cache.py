@@ -0,0 +1,188 @@
+# core/response_cache.py
+"""
+Cache ya responses za GET za umma (posts, lessons, seasons, series, events,
+global stats).
+
+- Key = path + query string (iliyopangwa) + bucket ya mtumiaji
+  ("public" kwa anonymous/wasio staff, "staff" kwa staff; ``per_user`` =
+  bucket ya kila user, hata staff).
+- Kila entry ina tags za models (mf. "content.Post"). Kila tag ina version
+  kwenye cache; ``purge_tags`` inaongeza version, hivyo entries zote za zamani
+  hazifikiki tena bila kuzitafuta moja moja.
+- Hits/misses zinahesabiwa kwenye cache — tazama ``cache_stats()``.
+"""
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models.signals import post_save, post_delete
+from rest_framework.response import Response
+
+KEY_PREFIX = "respcache"
+HITS_KEY = f"{KEY_PREFIX}:stats:hits"
+MISSES_KEY = f"{KEY_PREFIX}:stats:misses"
+
+
+def cache_is_process_local(alias="default"):
+    """
+    True kama cache ni ya process hii tu (LocMem/Dummy): workers wengine
+    (gunicorn, management commands) hawaoni keys zake.
+    """
+    return isinstance(caches[alias], (LocMemCache, DummyCache))
+
+
+def _enabled():
+    return getattr(settings, "RESPONSE_CACHE_ENABLED", True)
+
+
+def _tag_key(tag):
+    return f"{KEY_PREFIX}:tag:{tag}"
+
+
+def _bump(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def _tag_versions(tags):
+    keys = [_tag_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Anza kwa thamani ya kipekee ili tag iliyofutwa (evicted) isirudie version ya zamani
+            cache.add(key, int(time.time() * 1000), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def tags_version(*tags):
+    """String ya versions za ``tags``: tumia kwenye keys za caches nyingine zinazofutwa na ``purge_tags``."""
+    return ".".join(str(v) for v in _tag_versions(tags))
+
+
+def user_bucket(request, per_user=False):
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return "public"
+    if per_user:
+        # Kabla ya staff: response ina fields za user (mf. liked_by_me)
+        return f"u{user.pk}"
+    return "staff" if user.is_staff else "public"
+
+
+def _cache_key(request, tags, per_user, variant=""):
+    query = "&".join(sorted(request.META.get("QUERY_STRING", "").split("&")))
+    raw = f"{request.path}?{query}|{user_bucket(request, per_user)}|{tags_version(*tags)}|{variant}"
+    return f"{KEY_PREFIX}:entry:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def cached_call(request, tags, produce, timeout=None, per_user=False, variant=""):
+    """
+    Rudisha response iliyo kwenye cache, au ita ``produce()`` na uhifadhi
+    ``response.data`` ikiwa ni 200. ``variant`` (mf. ETag ya
+    core/conditional.py) inaingia kwenye key: state mpya = entry mpya.
+    """
+    if not _enabled() or request.method not in ("GET", "HEAD"):
+        return produce()
+
+    key = _cache_key(request, tags, per_user, variant)
+    entry = cache.get(key)
+    if entry is not None:
+        _bump(HITS_KEY)
+        response = Response(entry)
+        response["X-Cache"] = "HIT"
+        return response
+
+    _bump(MISSES_KEY)
+    response = produce()
+    if isinstance(response, Response) and response.status_code == 200:
+        if timeout is None:
+            timeout = getattr(settings, "RESPONSE_CACHE_TIMEOUT", 300)
+        cache.set(key, response.data, timeout)
+        response["X-Cache"] = "MISS"
+    return response
+
+
+def cache_response(tags, timeout=None, per_user=False):
+    """Decorator kwa methods za APIView / @action: ``(self, request, ...)``."""
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            return cached_call(
+                request, tags,
+                lambda: view_method(self, request, *args, **kwargs),
+                timeout=timeout, per_user=per_user,
+            )
+        return wrapper
+    return decorator
+
+
+class CachedResponseMixin:
+    """
+    Kwa ModelViewSet: cache list/retrieve.
+    Weka ``cache_tags`` (labels za models ambazo response inategemea).
+    """
+    cache_tags = ()
+    cache_timeout = None
+    cache_per_user = False
+
+    def get_cache_tags(self):
+        return self.cache_tags
+
+    def list(self, request, *args, **kwargs):
+        return cached_call(
+            request, self.get_cache_tags(),
+            lambda: super(CachedResponseMixin, self).list(request, *args, **kwargs),
+            timeout=self.cache_timeout, per_user=self.cache_per_user,
+            variant=getattr(self, "conditional_etag", ""),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return cached_call(
+            request, self.get_cache_tags(),
+            lambda: super(CachedResponseMixin, self).retrieve(request, *args, **kwargs),
+            timeout=self.cache_timeout, per_user=self.cache_per_user,
+            variant=getattr(self, "conditional_etag", ""),
+        )
+
+
+# ----------------------------- Invalidation -----------------------------
+def purge_tags(*tags):
+    for tag in tags:
+        _bump(_tag_key(tag))
+
+
+def _purge_for_instance(sender, **kwargs):
+    purge_tags(sender._meta.label)
+
+
+def connect_invalidation(*models):
+    """post_save/post_delete ya ``models`` zitafuta tag ``app_label.ModelName``."""
+    for model in models:
+        uid = f"respcache-{model._meta.label}"
+        post_save.connect(_purge_for_instance, sender=model, dispatch_uid=f"{uid}-save")
+        post_delete.connect(_purge_for_instance, sender=model, dispatch_uid=f"{uid}-delete")
+
+
+# ------------------------------- Stats -------------------------------
+def cache_stats():
+    values = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = values.get(HITS_KEY, 0)
+    misses = values.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+    }
+
+
+def reset_cache_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,31 @@
+# core/testing.py
+"""Helpers za tests."""
+from contextlib import contextmanager
+from unittest import mock
+
+from django.db.models import Model
+
+
+@contextmanager
+def assert_no_deferred_loads():
+    """
+    Fail kama code ndani ya block inasoma field iliyo-deferred (``only()`` /
+    ``defer()``): Django hufanya refetch ya row hiyo moja, yaani query kwa
+    kila row ya list.
+
+        with assert_no_deferred_loads():
+            self.client.get("/api/v1/content/posts/")
+    """
+    loads = []
+    original = Model.refresh_from_db
+
+    def tracking_refresh(instance, *args, **kwargs):
+        fields = kwargs.get("fields") or (args[1] if len(args) > 1 else None)
+        if fields:
+            loads.append(f"{instance._meta.label}.{','.join(fields)}")
+        return original(instance, *args, **kwargs)
+
+    with mock.patch.object(Model, "refresh_from_db", tracking_refresh):
+        yield loads
+    if loads:
+        raise AssertionError(f"Deferred field(s) loaded per row: {sorted(set(loads))}")
@@ -26,6 +26,11 @@ urlpatterns = [
         name="dashboard-stats",
     ),
     path("api/search/", views.site_search, name="site-search"),
+    path(
+        "api/cache/stats/",
+        views.ResponseCacheStatsAPIView.as_view(),
+        name="response-cache-stats",
+    ),
     path("api/track-activity/", views.track_activity, name="track-activity"),
     path(
         "api/mission-progress/",
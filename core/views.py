@@ -1,5 +1,5 @@
 # core/views.py
-from django.db.models import Q, Count, Sum
+from django.db.models import Count, Sum
 from django.contrib.auth.models import User  # unaweza usihitajike sana, lakini si shida
 
 from django_filters.rest_framework import DjangoFilterBackend
@@ -15,6 +15,12 @@ from drf_spectacular.utils import (
     OpenApiParameter,
 )
 
+from search import services as search_index
+from content.services import global_counter
+
+from .pagination import CreatedAtCursorPagination
+from .response_cache import cache_stats, reset_cache_stats
+
 from .models import UserActivity, SystemSetting
 from .serializers import (
     UserActivitySerializer,
@@ -31,7 +37,6 @@ from content.models import (
     MissionReport,
     BibleStudyGroup,
     BaptismRecord,
-    GlobalSoulsCounter,
     Profile,
 )
 from content.serializers import (
@@ -63,6 +68,7 @@ class UserActivityViewSet(viewsets.ModelViewSet):
     """
     queryset = UserActivity.objects.select_related("user").all()
     serializer_class = UserActivitySerializer
+    pagination_class = CreatedAtCursorPagination
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["user", "activity_type", "created_at"]
@@ -147,9 +153,7 @@ class DashboardStatsAPIView(APIView):
         }
 
         # Global stats (ensure record exists)
-        global_stats = GlobalSoulsCounter.objects.first()
-        if not global_stats:
-            global_stats = GlobalSoulsCounter.objects.create(pk=1)
+        global_stats = global_counter.snapshot()
 
         # Recent missions
         recent_missions = MissionReport.objects.filter(
@@ -183,10 +187,39 @@ class DashboardStatsAPIView(APIView):
         return Response(serializer.data)
 
 
+class ResponseCacheStatsAPIView(APIView):
+    """
+    Hits/misses za response cache ya GET za umma (admin only).
+    DELETE ina-reset counters.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    @extend_schema(
+        summary="Response cache hit/miss counters",
+        responses=inline_serializer(
+            name="ResponseCacheStats",
+            fields={
+                "hits": serializers.IntegerField(),
+                "misses": serializers.IntegerField(),
+                "hit_rate": serializers.FloatField(),
+            },
+        ),
+        tags=["Core"],
+    )
+    def get(self, request):
+        return Response(cache_stats())
+
+    @extend_schema(summary="Reset response cache counters", responses=None, tags=["Core"])
+    def delete(self, request):
+        reset_cache_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 @extend_schema(
     summary="Global search across gospel content",
     description=(
-        "Search posts, lessons, events and mission reports using a simple keyword query."
+        "Full-text search over posts, lessons, events and mission reports. "
+        "Results are ranked by relevance and carry a highlighted `snippet`."
     ),
     parameters=[
         OpenApiParameter(
@@ -212,48 +245,52 @@ class DashboardStatsAPIView(APIView):
 def site_search(request):
     """
     Global search across gospel content (posts, lessons, events, mission reports).
+    Inatumia full-text index ya app ya `search` badala ya icontains scans.
     """
     query = request.GET.get("q", "").strip()
     results = {}
 
     if query:
-        # Posts
-        posts = Post.pub.published().filter(
-            Q(title__icontains=query)
-            | Q(content__icontains=query)
-            | Q(excerpt__icontains=query)
-        )[:10]
-        results["posts"] = PostListSerializer(posts, many=True).data
-
-        # Lessons
-        lessons = Lesson.pub.published().filter(
-            Q(title__icontains=query)
-            | Q(description__icontains=query)
-            | Q(content__icontains=query)
-            | Q(bible_references__icontains=query)
-        )[:10]
-        results["lessons"] = LessonListSerializer(lessons, many=True).data
-
-        # Events
-        events = Event.objects.filter(
-            Q(title__icontains=query)
-            | Q(description__icontains=query)
-            | Q(location__icontains=query)
-        )[:10]
-        results["events"] = EventSerializer(events, many=True).data
-
-        # Mission Reports (limit access)
-        mission_reports = MissionReport.objects.filter(
-            Q(title__icontains=query)
-            | Q(location__icontains=query)
-            | Q(testimonies__icontains=query)
-        )
-        if not request.user.is_staff:
-            mission_reports = mission_reports.filter(missionary=request.user)
-        mission_reports = mission_reports[:10]
-        results["mission_reports"] = MissionReportSerializer(
-            mission_reports, many=True
-        ).data
+        user = request.user
+        if user.is_staff:
+            mission_reports = MissionReport.objects.all()
+        elif user.is_authenticated:
+            mission_reports = MissionReport.objects.filter(missionary=user)
+        else:
+            mission_reports = MissionReport.objects.none()
+
+        sections = [
+            (
+                "posts", "post",
+                Post.pub.published().select_related("category", "author"),
+                PostListSerializer,
+            ),
+            (
+                "lessons", "lesson",
+                Lesson.pub.published().select_related("series", "series__season"),
+                LessonListSerializer,
+            ),
+            ("events", "event", Event.objects.all(), EventSerializer),
+            (
+                "mission_reports", "mission_report",
+                mission_reports.select_related("missionary"),
+                MissionReportSerializer,
+            ),
+        ]
+        for key, kind, queryset, serializer_class in sections:
+            hits = search_index.search(query, kind, user=user, limit=10)
+            objects = queryset.in_bulk([hit.object_id for hit in hits])
+            section = []
+            # Dumisha mpangilio wa relevance; ruka entries za index zilizopitwa na wakati
+            for hit in hits:
+                obj = objects.get(hit.object_id)
+                if obj is None:
+                    continue
+                item = serializer_class(obj).data
+                item["snippet"] = hit.snippet
+                item["rank"] = hit.rank
+                section.append(item)
+            results[key] = section
 
     total_results = sum(len(section) for section in results.values())
 
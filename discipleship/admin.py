@@ -126,6 +126,8 @@ class PathEnrollmentAdmin(admin.ModelAdmin):
         "path",
         "current_level",
         "progress_percentage",
+        "completed_lessons",
+        "total_lessons",
         "is_active",
         "enrolled_at",
         "completed_at",
@@ -138,6 +140,7 @@ class PathEnrollmentAdmin(admin.ModelAdmin):
         "current_level__name",
     )
     autocomplete_fields = ("user", "path", "current_level")
+    readonly_fields = ("completed_lessons", "total_lessons")
 
 
 @admin.register(Quiz)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DiscipleshipConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'discipleship'
+
+    def ready(self):
+        import discipleship.signals  # noqa: F401
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from discipleship.services.enrollments import reconcile_enrollments
+
+
+class Command(BaseCommand):
+    help = "Recompute PathEnrollment completed_lessons/total_lessons and progress from lessons and LessonProgress."
+
+    def handle(self, *args, **options):
+        fixed = reconcile_enrollments()
+        self.stdout.write(self.style.SUCCESS(f"Reconciled {fixed} enrollment(s)."))
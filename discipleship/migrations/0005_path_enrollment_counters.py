@@ -0,0 +1,56 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:34
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counts(apps, schema_editor):
+    PathEnrollment = apps.get_model('discipleship', 'PathEnrollment')
+    DiscipleshipLesson = apps.get_model('discipleship', 'DiscipleshipLesson')
+    LessonProgress = apps.get_model('discipleship', 'LessonProgress')
+
+    def count_of(queryset, group):
+        return Coalesce(
+            Subquery(
+                queryset.order_by().values(group).annotate(n=Count('pk')).values('n'),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        )
+
+    PathEnrollment.objects.update(
+        total_lessons=count_of(
+            DiscipleshipLesson.objects.filter(is_published=True, level__path=OuterRef('path')),
+            'level__path',
+        ),
+        completed_lessons=count_of(
+            LessonProgress.objects.filter(
+                user=OuterRef('user'),
+                lesson__level__path=OuterRef('path'),
+                status__in=['completed', 'verified'],
+            ),
+            'user',
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('discipleship', '0004_alter_discipleshiplesson_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pathenrollment',
+            name='completed_lessons',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='pathenrollment',
+            name='total_lessons',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
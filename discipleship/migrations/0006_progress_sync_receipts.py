@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('discipleship', '0005_path_enrollment_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressSyncReceipt',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('client_id', models.CharField(max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progress_sync_receipts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Progress Sync Receipt',
+                'verbose_name_plural': 'Progress Sync Receipts',
+                'unique_together': {('user', 'client_id')},
+            },
+        ),
+    ]
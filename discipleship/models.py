@@ -144,6 +144,7 @@ class LessonProgress(models.Model):
         ('completed', 'Completed'),
         ('verified', 'Verified'),
     ]
+    DONE_STATUSES = ('completed', 'verified')
 
     user = models.ForeignKey(
         User,
@@ -222,6 +223,9 @@ class PathEnrollment(models.Model):
     completed_at = models.DateTimeField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
     progress_percentage = models.PositiveIntegerField(default=0)
+    # Counts zinazosasishwa kwa deltas (discipleship/services/enrollments.py)
+    completed_lessons = models.PositiveIntegerField(default=0, editable=False)
+    total_lessons = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         verbose_name = "Path Enrollment"
@@ -234,31 +238,46 @@ class PathEnrollment(models.Model):
     def __str__(self) -> str:
         return f"{self.user.username} - {self.path.name}"
 
-    def update_progress(self):
+    def recount(self):
         """
-        Rekebisha progress_percentage kulingana na idadi ya
-        lessons zilizomalizika kwenye path hii.
+        Hesabu upya ``completed_lessons`` / ``total_lessons`` kutoka tables
+        (enrollment mpya au reconcile). Haihifadhi.
         """
-        total_lessons = DiscipleshipLesson.objects.filter(
-            level__path=self.path,
+        self.total_lessons = DiscipleshipLesson.objects.filter(
+            level__path_id=self.path_id,
             is_published=True,
         ).count()
+        self.completed_lessons = LessonProgress.objects.filter(
+            user_id=self.user_id,
+            lesson__level__path_id=self.path_id,
+            status__in=LessonProgress.DONE_STATUSES,
+        ).count()
+        self.apply_counts()
 
-        if total_lessons == 0:
+    def apply_counts(self):
+        """Weka progress_percentage / completed_at kutoka kwenye counts."""
+        if self.total_lessons == 0:
             self.progress_percentage = 0
             self.completed_at = None
         else:
-            completed_lessons = LessonProgress.objects.filter(
-                user=self.user,
-                lesson__level__path=self.path,
-                status__in=['completed', 'verified'],
-            ).count()
-            self.progress_percentage = int((completed_lessons / total_lessons) * 100)
+            self.progress_percentage = int((self.completed_lessons / self.total_lessons) * 100)
 
             if self.progress_percentage >= 100 and not self.completed_at:
                 self.completed_at = timezone.now()
 
-        self.save()
+    def update_progress(self):
+        """
+        Rekebisha progress_percentage kulingana na counts zilizohifadhiwa
+        (zinasasishwa kwa deltas na signals; tazama
+        discipleship/services/enrollments.py). Hakuna COUNT hapa.
+        """
+        self.apply_counts()
+        self.save(update_fields=['current_level', 'progress_percentage', 'completed_at'])
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.path_id and self.user_id:
+            self.recount()
+        super().save(*args, **kwargs)
 
 
 class Quiz(models.Model):
@@ -367,3 +386,25 @@ class QuizAttempt(models.Model):
 
     def __str__(self) -> str:
         return f"{self.user.username} - {self.quiz.title} - {self.score}%"
+
+
+class ProgressSyncReceipt(models.Model):
+    """
+    client_id ya event ya offline sync iliyokwisha tumika
+    (retry ya batch kwenye request nyingine inarudisha "duplicate")
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='progress_sync_receipts',
+    )
+    client_id = models.CharField(max_length=64)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Progress Sync Receipt"
+        verbose_name_plural = "Progress Sync Receipts"
+        unique_together = ['user', 'client_id']
+
+    def __str__(self) -> str:
+        return f"{self.user_id} - {self.client_id}"
@@ -1,8 +1,11 @@
 # discipleship/serializers.py
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema_field
 
+from core.fields import AnnotatedCountField
 from .models import (
     DiscipleshipPath,
     DiscipleshipLevel,
@@ -23,7 +26,7 @@ class UserMiniSerializer(serializers.ModelSerializer):
 
 
 class DiscipleshipPathSerializer(serializers.ModelSerializer):
-    levels_count = serializers.SerializerMethodField()
+    levels_count = AnnotatedCountField("levels")
     stage_display = serializers.CharField(source="get_stage_display", read_only=True)
 
     class Meta:
@@ -42,14 +45,10 @@ class DiscipleshipPathSerializer(serializers.ModelSerializer):
             "created_at",
         ]
 
-    @extend_schema_field(serializers.IntegerField)
-    def get_levels_count(self, obj) -> int:
-        return obj.levels.count()
-
 
 class DiscipleshipLevelSerializer(serializers.ModelSerializer):
     path_name = serializers.CharField(source="path.name", read_only=True)
-    lessons_count = serializers.SerializerMethodField()
+    lessons_count = AnnotatedCountField("lessons", filter={"is_published": True})
 
     class Meta:
         model = DiscipleshipLevel
@@ -67,10 +66,6 @@ class DiscipleshipLevelSerializer(serializers.ModelSerializer):
             "created_at",
         ]
 
-    @extend_schema_field(serializers.IntegerField)
-    def get_lessons_count(self, obj) -> int:
-        return obj.lessons.filter(is_published=True).count()
-
 
 class DiscipleshipLessonListSerializer(serializers.ModelSerializer):
     level_name = serializers.CharField(source="level.name", read_only=True)
@@ -101,6 +96,8 @@ class DiscipleshipLessonListSerializer(serializers.ModelSerializer):
             "has_pdf",
             "created_at",
         ]
+        # Fields zinazosomwa na SerializerMethodFields (core/querysets.py)
+        only_extra = ["video_url", "audio_url", "pdf_file"]
 
     @extend_schema_field(serializers.BooleanField)
     def get_has_video(self, obj) -> bool:
@@ -290,3 +287,36 @@ class QuizAttemptSerializer(serializers.ModelSerializer):
             "answers",
         ]
         read_only_fields = ["user", "started_at", "completed_at"]
+
+
+class ProgressSyncEventSerializer(serializers.Serializer):
+    """Event moja ya batch ya offline sync (discipleship/services/progress_sync.py)."""
+
+    TYPES = ["lesson_started", "lesson_completed", "activity", "quiz_attempt"]
+
+    client_id = serializers.CharField(max_length=64, required=False, allow_blank=True)
+    type = serializers.ChoiceField(choices=TYPES)
+    occurred_at = serializers.DateTimeField()
+    lesson = serializers.IntegerField(required=False)
+    quiz = serializers.IntegerField(required=False)
+    score = serializers.IntegerField(min_value=0, max_value=100, required=False)
+    time_spent_minutes = serializers.IntegerField(min_value=0, required=False, default=0)
+    answers = serializers.DictField(required=False)
+
+    def validate(self, attrs):
+        target = "quiz" if attrs["type"] == "quiz_attempt" else "lesson"
+        if attrs.get(target) is None:
+            raise serializers.ValidationError({target: "This field is required."})
+        # Saa ya device inaweza kuwa mbele; usikubali muda wa baadaye
+        attrs["occurred_at"] = min(attrs["occurred_at"], timezone.now())
+        return attrs
+
+
+class ProgressSyncSerializer(serializers.Serializer):
+    events = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+
+    def validate_events(self, value):
+        limit = getattr(settings, "DISCIPLESHIP_SYNC_MAX_EVENTS", 200)
+        if len(value) > limit:
+            raise serializers.ValidationError(f"At most {limit} events per batch.")
+        return value
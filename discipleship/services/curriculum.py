@@ -0,0 +1,107 @@
+# discipleship/services/curriculum.py
+"""
+Snapshot ya curriculum nzima (Path → Level → Lesson) kama document moja.
+
+- Version = versions za tags za DiscipleshipPath/Level/Lesson
+  (core/response_cache.py); signals za ``connect_invalidation``
+  (discipleship/signals.py) zinaiongeza kila model ikibadilika.
+- ``curriculum_etag()`` haigusi DB, hivyo 304 ni cache lookup tu.
+- ``curriculum_snapshot()`` inajenga document upya (queries tatu) mara moja
+  tu kwa kila version, kisha inaisoma kutoka cache.
+"""
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.conditional import make_etag
+from core.response_cache import tags_version
+from discipleship.models import DiscipleshipLesson, DiscipleshipLevel, DiscipleshipPath
+
+CACHE_PREFIX = "discipleship:curriculum"
+CURRICULUM_TAGS = (
+    DiscipleshipPath._meta.label,
+    DiscipleshipLevel._meta.label,
+    DiscipleshipLesson._meta.label,
+)
+# Haibadiliki kati ya versions; inafutwa na version mpya
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def curriculum_etag():
+    return make_etag(CACHE_PREFIX, tags_version(*CURRICULUM_TAGS))
+
+
+def build_snapshot():
+    """Mti mzima wa curriculum iliyo published (queries tatu)."""
+    lessons = {}
+    lesson_rows = (
+        DiscipleshipLesson.objects.filter(is_published=True)
+        .order_by("level_id", "order", "pk")
+        .only(
+            "id", "level_id", "title", "slug", "description", "order",
+            "duration_minutes", "points_value", "requires_previous",
+            "video_url", "audio_url", "pdf_file",
+        )
+    )
+    for lesson in lesson_rows:
+        lessons.setdefault(lesson.level_id, []).append(
+            {
+                "id": lesson.id,
+                "title": lesson.title,
+                "slug": lesson.slug,
+                "description": lesson.description,
+                "order": lesson.order,
+                "duration_minutes": lesson.duration_minutes,
+                "points_value": lesson.points_value,
+                "requires_previous": lesson.requires_previous,
+                "has_video": lesson.has_video,
+                "has_audio": lesson.has_audio,
+                "has_pdf": lesson.has_pdf,
+            }
+        )
+
+    levels = {}
+    for level in DiscipleshipLevel.objects.filter(is_active=True).order_by("path_id", "order", "pk"):
+        level_lessons = lessons.get(level.id, [])
+        levels.setdefault(level.path_id, []).append(
+            {
+                "id": level.id,
+                "name": level.name,
+                "slug": level.slug,
+                "description": level.description,
+                "order": level.order,
+                "required_score": level.required_score,
+                "lessons_count": len(level_lessons),
+                "lessons": level_lessons,
+            }
+        )
+
+    paths = []
+    for path in DiscipleshipPath.objects.filter(is_active=True).order_by("order", "pk"):
+        path_levels = levels.get(path.id, [])
+        paths.append(
+            {
+                "id": path.id,
+                "name": path.name,
+                "stage": path.stage,
+                "stage_display": path.get_stage_display(),
+                "slug": path.slug,
+                "description": path.description,
+                "image": path.image.url if path.image else None,
+                "order": path.order,
+                "levels_count": len(path_levels),
+                "lessons_count": sum(level["lessons_count"] for level in path_levels),
+                "levels": path_levels,
+            }
+        )
+    return {"generated_at": timezone.now().isoformat(), "paths": paths}
+
+
+def curriculum_snapshot():
+    """``(etag, document)``; document inajengwa mara moja kwa kila version."""
+    etag = curriculum_etag()
+    key = f"{CACHE_PREFIX}:{etag}"
+    document = cache.get(key)
+    if document is None:
+        document = {"version": etag, **build_snapshot()}
+        cache.set(key, document, CACHE_TIMEOUT)
+    return etag, document
@@ -0,0 +1,119 @@
+# discipleship/services/enrollments.py
+"""
+Counts za PathEnrollment (``completed_lessons`` / ``total_lessons``).
+
+- ``adjust_enrollments(queryset, completed=..., total=...)``: UPDATE ya
+  ``F()`` kwa deltas, kisha UPDATE ya ``progress_percentage``/``completed_at``
+  kutoka counts mpya. Queries mbili bila kujali urefu wa path.
+- Signals (discipleship/signals.py): LessonProgress ikiingia/kutoka
+  completed/verified, na lesson ikiwa published/unpublished/kuhamishwa/kufutwa.
+- ``reconcile_enrollments()``: hesabu upya zote
+  (``manage.py reconcile_path_enrollments``).
+"""
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Value, When
+from django.utils import timezone
+
+from discipleship.models import DiscipleshipLesson, LessonProgress, PathEnrollment
+
+
+def _refresh_progress(queryset):
+    # Sheria sawa na PathEnrollment.apply_counts(), ndani ya DB
+    queryset.update(
+        progress_percentage=Case(
+            When(total_lessons__gt=0, then=F("completed_lessons") * 100 / F("total_lessons")),
+            default=Value(0),
+            output_field=IntegerField(),
+        ),
+        completed_at=Case(
+            When(total_lessons=0, then=Value(None)),
+            When(
+                completed_at__isnull=True,
+                completed_lessons__gte=F("total_lessons"),
+                then=Value(timezone.now()),
+            ),
+            default=F("completed_at"),
+        ),
+    )
+
+
+def adjust_enrollments(queryset, completed=0, total=0):
+    changes = {}
+    rows = queryset
+    if completed:
+        changes["completed_lessons"] = F("completed_lessons") + completed
+        if completed < 0:
+            # PositiveIntegerField: usishuke chini ya sifuri
+            rows = rows.filter(completed_lessons__gte=-completed)
+    if total:
+        changes["total_lessons"] = F("total_lessons") + total
+        if total < 0:
+            rows = rows.filter(total_lessons__gte=-total)
+    if not changes:
+        return
+    with transaction.atomic():
+        if rows.update(**changes):
+            _refresh_progress(queryset)
+
+
+def adjust_user_path(user_id, path_id, completed):
+    adjust_enrollments(
+        PathEnrollment.objects.filter(user_id=user_id, path_id=path_id), completed=completed
+    )
+
+
+def adjust_level_total(level_id, delta):
+    """Lesson published/unpublished kwenye level: enrollments zote za path yake."""
+    if level_id is None:
+        return
+    adjust_enrollments(PathEnrollment.objects.filter(path__levels=level_id), total=delta)
+
+
+def move_lesson_completions(lesson_id, old_level_id, new_level_id):
+    """Lesson imehamishwa level: completions zake zihamie path mpya (kama imebadilika)."""
+    done_users = LessonProgress.objects.filter(
+        lesson_id=lesson_id, status__in=LessonProgress.DONE_STATUSES
+    ).values("user_id")
+    enrollments = PathEnrollment.objects.filter(user_id__in=done_users)
+    adjust_enrollments(
+        enrollments.filter(path__levels=old_level_id).exclude(path__levels=new_level_id),
+        completed=-1,
+    )
+    adjust_enrollments(
+        enrollments.filter(path__levels=new_level_id).exclude(path__levels=old_level_id),
+        completed=1,
+    )
+
+
+@transaction.atomic
+def reconcile_enrollments():
+    """Hesabu counts za enrollments zote upya. Inarudisha idadi iliyorekebishwa."""
+    totals = dict(
+        DiscipleshipLesson.objects.filter(is_published=True)
+        .order_by()
+        .values("level__path_id")
+        .annotate(n=Count("pk"))
+        .values_list("level__path_id", "n")
+    )
+    done = {
+        (row["user_id"], row["lesson__level__path_id"]): row["n"]
+        for row in LessonProgress.objects.filter(status__in=LessonProgress.DONE_STATUSES)
+        .order_by()
+        .values("user_id", "lesson__level__path_id")
+        .annotate(n=Count("pk"))
+    }
+
+    changed = []
+    for enrollment in PathEnrollment.objects.iterator():
+        counts = (done.get((enrollment.user_id, enrollment.path_id), 0), totals.get(enrollment.path_id, 0))
+        if counts == (enrollment.completed_lessons, enrollment.total_lessons):
+            continue
+        enrollment.completed_lessons, enrollment.total_lessons = counts
+        enrollment.apply_counts()
+        changed.append(enrollment)
+    PathEnrollment.objects.bulk_update(
+        changed,
+        ["completed_lessons", "total_lessons", "progress_percentage", "completed_at"],
+        batch_size=500,
+    )
+    return len(changed)
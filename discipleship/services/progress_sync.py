@@ -0,0 +1,246 @@
+# discipleship/services/progress_sync.py
+"""
+Sync ya progress kutoka kwa clients wa offline (missionaries field).
+
+Client anatuma batch ya events (``ProgressSyncEventSerializer``):
+
+- ``lesson_started`` / ``lesson_completed`` / ``activity`` (muda wa kusoma)
+  → zinaunganishwa kwa kila lesson kwa mpangilio wa ``occurred_at``, kisha
+  ``LessonProgress`` zinaandikwa kwa ``bulk_update`` / ``bulk_create``
+  (upsert kwenye ``(user, lesson)``).
+- ``quiz_attempt`` → QuizAttempt moja kwa kila event.
+
+Duplicates (``client_id`` ile ile, au event ile ile kwa ``occurred_at`` ile
+ile) zinarudishwa kama ``duplicate``. ``client_id`` za events zilizotumika
+zinahifadhiwa (``ProgressSyncReceipt``), hivyo retry ya batch kwenye request
+nyingine haiongezi ``time_spent_minutes`` mara ya pili; quiz attempt
+iliyokwisha sync-iwa (``completed_at`` ile ile) haiundwi tena.
+Counts za PathEnrollment zinarekebishwa kwa delta moja kwa kila path
+iliyoguswa, si kwa kila event.
+"""
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from discipleship.models import (
+    DiscipleshipLesson,
+    LessonProgress,
+    PathEnrollment,
+    ProgressSyncReceipt,
+    Quiz,
+    QuizAttempt,
+)
+from discipleship.services import enrollments
+from discipleship.services.quizzes import grade_answers
+
+LESSON_EVENTS = ("lesson_started", "lesson_completed", "activity")
+DONE_STATUSES = LessonProgress.DONE_STATUSES
+
+
+def _dedup_key(event):
+    if event.get("client_id"):
+        return ("client", event["client_id"])
+    target = event.get("quiz") if event["type"] == "quiz_attempt" else event.get("lesson")
+    return (event["type"], target, event["occurred_at"])
+
+
+def _apply(progress, event):
+    """Tumia event moja kwenye LessonProgress (in memory)."""
+    at = event["occurred_at"]
+    if event["type"] == "activity":
+        progress.time_spent_minutes += event.get("time_spent_minutes") or 0
+        return
+
+    if not progress.started_at or at < progress.started_at:
+        progress.started_at = at
+    progress.time_spent_minutes += event.get("time_spent_minutes") or 0
+    if event["type"] == "lesson_started":
+        if progress.status == "not_started":
+            progress.status = "in_progress"
+        return
+
+    # lesson_completed: usishushe "verified"; completed_at ya kwanza inabaki
+    if progress.status not in DONE_STATUSES:
+        progress.status = "completed"
+    if not progress.completed_at or at < progress.completed_at:
+        progress.completed_at = at
+    score = event.get("score")
+    progress.score = 100 if score is None else score
+
+
+def _sync_lessons(user, events, results, is_staff):
+    lesson_ids = {event["lesson"] for _, event in events}
+    lessons = DiscipleshipLesson.objects.select_related("level").filter(pk__in=lesson_ids)
+    if not is_staff:
+        lessons = lessons.filter(is_published=True)
+    lessons = lessons.in_bulk()
+
+    existing = {
+        p.lesson_id: p
+        for p in LessonProgress.objects.filter(user=user, lesson_id__in=lessons)
+    }
+    touched = {}
+    for index, event in sorted(events, key=lambda item: item[1]["occurred_at"]):
+        lesson = lessons.get(event["lesson"])
+        if lesson is None:
+            results[index] = {"status": "error", "detail": "Lesson not found."}
+            continue
+        progress = touched.get(lesson.pk) or existing.get(lesson.pk)
+        if progress is None:
+            progress = LessonProgress(user=user, lesson=lesson)
+        _apply(progress, event)
+        touched[lesson.pk] = progress
+        results[index] = {"status": "ok", "lesson": lesson.pk}
+
+    now = timezone.now()
+    to_update, to_create = [], []
+    for progress in touched.values():
+        progress.last_accessed = now  # auto_now haitumiki kwenye bulk_update
+        (to_update if progress.pk else to_create).append(progress)
+
+    fields = ["status", "started_at", "completed_at", "score", "time_spent_minutes", "last_accessed"]
+    if to_update:
+        LessonProgress.objects.bulk_update(to_update, fields)
+    if to_create:
+        # Upsert: request nyingine ikiwa imeunda row hii, iandikwe upya
+        LessonProgress.objects.bulk_create(
+            to_create,
+            update_conflicts=True,
+            unique_fields=["user", "lesson"],
+            update_fields=fields,
+        )
+
+    for result in results.values():
+        if result.get("lesson") in touched:
+            result["progress_status"] = touched[result["lesson"]].status
+
+    # bulk_* hazitumi signals: deltas za PathEnrollment.completed_lessons hapa
+    completed_levels, deltas = {}, {}
+    for progress in touched.values():
+        level = lessons[progress.lesson_id].level
+        is_done = progress.status in DONE_STATUSES
+        delta = int(is_done) - int(progress._was_done)
+        if delta:
+            deltas[level.path_id] = deltas.get(level.path_id, 0) + delta
+        if is_done:
+            best = completed_levels.get(level.path_id)
+            if best is None or best.order < level.order:
+                completed_levels[level.path_id] = level
+    return completed_levels, deltas
+
+
+def _update_enrollments(user, completed_levels):
+    """
+    ``completed_levels`` = {path_id: level ya juu kabisa iliyo na completion}.
+    Kila enrollment iliyoguswa inasasishwa mara moja tu.
+    """
+    existing = {
+        e.path_id: e
+        for e in PathEnrollment.objects.select_related("current_level").filter(
+            user=user, path_id__in=completed_levels
+        )
+    }
+    for path_id, level in completed_levels.items():
+        enrollment = existing.get(path_id)
+        if enrollment is None:
+            enrollment, _ = PathEnrollment.objects.get_or_create(
+                user=user, path_id=path_id, defaults={"current_level": level}
+            )
+        if enrollment.current_level is None or enrollment.current_level.order <= level.order:
+            enrollment.current_level = level
+        enrollment.update_progress()
+
+
+def _sync_quiz_attempts(user, events, results):
+    quizzes = Quiz.objects.filter(pk__in={event["quiz"] for _, event in events}, is_active=True)
+    quizzes = quizzes.in_bulk()
+    attempts = QuizAttempt.objects.filter(user=user, quiz_id__in=quizzes)
+    synced = set(attempts.values_list("quiz_id", "completed_at"))
+    counts = dict(
+        attempts.order_by().values("quiz_id").annotate(n=Count("pk")).values_list("quiz_id", "n")
+    )
+
+    for index, event in sorted(events, key=lambda item: item[1]["occurred_at"]):
+        quiz = quizzes.get(event["quiz"])
+        if quiz is None:
+            results[index] = {"status": "error", "detail": "Quiz not found."}
+            continue
+        if (quiz.pk, event["occurred_at"]) in synced:
+            results[index] = {"status": "duplicate", "quiz": quiz.pk}
+            continue
+        if quiz.max_attempts and counts.get(quiz.pk, 0) >= quiz.max_attempts:
+            results[index] = {"status": "error", "detail": "Maximum attempts reached for this quiz."}
+            continue
+
+        answers = event.get("answers") or {}
+        score = grade_answers(quiz, answers)
+        attempt = QuizAttempt.objects.create(
+            user=user,
+            quiz=quiz,
+            score=score,
+            passed=score >= quiz.passing_score,
+            completed_at=event["occurred_at"],
+            time_spent_minutes=event.get("time_spent_minutes") or 0,
+            answers=answers,
+        )
+        counts[quiz.pk] = counts.get(quiz.pk, 0) + 1
+        synced.add((quiz.pk, attempt.completed_at))
+        results[index] = {
+            "status": "ok",
+            "quiz": quiz.pk,
+            "attempt": attempt.pk,
+            "score": score,
+            "passed": attempt.passed,
+        }
+
+
+def _processed_client_ids(user, events):
+    client_ids = {event["client_id"] for _, event in events if event.get("client_id")}
+    if not client_ids:
+        return set()
+    return set(
+        ProgressSyncReceipt.objects.filter(user=user, client_id__in=client_ids)
+        .values_list("client_id", flat=True)
+    )
+
+
+def _store_receipts(user, events, results):
+    ProgressSyncReceipt.objects.bulk_create(
+        [
+            ProgressSyncReceipt(user=user, client_id=event["client_id"])
+            for index, event in events
+            if event.get("client_id") and results.get(index, {}).get("status") == "ok"
+        ],
+        ignore_conflicts=True,
+    )
+
+
+@transaction.atomic
+def sync_progress_events(user, events, is_staff=False):
+    """
+    ``events`` = list ya ``(index, event)`` (events zilizo-validate).
+    Rudisha ``{index: result}`` kwa kila event.
+    """
+    results = {}
+    seen = {("client", client_id) for client_id in _processed_client_ids(user, events)}
+    lesson_events, quiz_events = [], []
+    for index, event in events:
+        key = _dedup_key(event)
+        if key in seen:
+            results[index] = {"status": "duplicate"}
+            continue
+        seen.add(key)
+        if event["type"] in LESSON_EVENTS:
+            lesson_events.append((index, event))
+        else:
+            quiz_events.append((index, event))
+
+    if lesson_events:
+        completed_levels, deltas = _sync_lessons(user, lesson_events, results, is_staff)
+        for path_id, delta in deltas.items():
+            enrollments.adjust_user_path(user.pk, path_id, delta)
+        _update_enrollments(user, completed_levels)
+    if quiz_events:
+        _sync_quiz_attempts(user, quiz_events, results)
+    _store_receipts(user, events, results)
+    return results
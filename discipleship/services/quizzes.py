@@ -0,0 +1,138 @@
+# discipleship/services/quizzes.py
+"""
+Usahihishaji wa quizzes.
+
+``compile_answer_key(quiz_id)`` inasoma questions + choices kwa prefetch moja
+na kujenga ``AnswerKey`` (immutable): choice ids sahihi, jibu la true/false
+na points za kila swali. Key ina-cache kwa kila quiz (hadi
+``QUIZ_ANSWER_KEY_CACHE_TIMEOUT`` sekunde) na kufutwa na signals za
+QuizQuestion/QuizChoice (discipleship/signals.py), hivyo ``grade_answers``
+haifanyi query yoyote baada ya key kuwa kwenye cache.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from discipleship.models import Quiz, QuizQuestion
+
+CACHE_PREFIX = "quiz:answer-key"
+TRUE_ANSWERS = ("true", "t", "1", "yes")
+FALSE_ANSWERS = ("false", "f", "0", "no")
+
+
+@dataclass(frozen=True)
+class QuestionKey:
+    id: int
+    question_type: str
+    points: int
+    correct_ids: frozenset = frozenset()
+    # true_false: True/False kutoka kwenye choice sahihi; None = haina choice sahihi
+    truth: Optional[bool] = None
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    quiz_id: int
+    questions: tuple
+    total_points: int
+
+
+def _cache_key(quiz_id):
+    return f"{CACHE_PREFIX}:{quiz_id}"
+
+
+def build_answer_key(quiz_id) -> AnswerKey:
+    """Jenga AnswerKey kutoka DB (queries mbili: questions + choices)."""
+    questions = QuizQuestion.objects.filter(quiz_id=quiz_id).prefetch_related("choices")
+    keys = []
+    for question in questions:
+        correct = [choice for choice in question.choices.all() if choice.is_correct]
+        truth = None
+        if question.question_type == "true_false" and correct:
+            truth = correct[0].choice_text.strip().lower().startswith("t")
+        keys.append(
+            QuestionKey(
+                id=question.id,
+                question_type=question.question_type,
+                points=question.points,
+                correct_ids=frozenset(choice.id for choice in correct),
+                truth=truth,
+            )
+        )
+
+    total_points = sum(key.points for key in keys)
+    if total_points == 0:
+        # Fallback: one point per question
+        total_points = len(keys)
+    return AnswerKey(quiz_id=quiz_id, questions=tuple(keys), total_points=total_points)
+
+
+def compile_answer_key(quiz_id) -> AnswerKey:
+    key = cache.get(_cache_key(quiz_id))
+    if key is None:
+        key = build_answer_key(quiz_id)
+        # Inafutwa na signals maswali/choices zikibadilika; timeout ni kinga tu
+        # (mf. queryset.update ya admin isiyotuma signals)
+        cache.set(
+            _cache_key(quiz_id), key,
+            getattr(settings, "QUIZ_ANSWER_KEY_CACHE_TIMEOUT", 60 * 60),
+        )
+    return key
+
+
+def invalidate_answer_key(quiz_id):
+    transaction.on_commit(lambda: cache.delete(_cache_key(quiz_id)))
+
+
+def _question_points(question: QuestionKey, user_answer) -> int:
+    if user_answer is None:
+        return 0
+
+    if question.question_type == "multiple_choice":
+        # user_answer can be id or list of ids
+        if not isinstance(user_answer, list):
+            user_answer = [user_answer]
+        try:
+            user_ids = {int(x) for x in user_answer}
+        except (ValueError, TypeError):
+            user_ids = set()
+        if question.correct_ids and user_ids == question.correct_ids:
+            return question.points
+
+    elif question.question_type == "true_false":
+        answer_str = str(user_answer).lower()
+        chosen_true = None
+        if answer_str in TRUE_ANSWERS:
+            chosen_true = True
+        elif answer_str in FALSE_ANSWERS:
+            chosen_true = False
+        if question.truth is not None and chosen_true == question.truth:
+            return question.points
+
+    # short_answer – kwa sasa hatu-auto-grade
+    return 0
+
+
+def grade_with_key(key: AnswerKey, answers) -> int:
+    """Pure function: asilimia (0-100) ya ``answers`` kwa ``key``."""
+    if not isinstance(answers, dict):
+        answers = {}
+    score_points = sum(
+        _question_points(question, answers.get(str(question.id)))
+        for question in key.questions
+    )
+    if key.total_points > 0:
+        return int(round((score_points / key.total_points) * 100))
+    return 0
+
+
+def grade_answers(quiz: Quiz, answers) -> int:
+    """
+    Sahihisha majibu ya quiz; rudisha asilimia (0-100).
+
+    ``answers`` = {"question_id": [choice_ids] / "true"/"false"/"some text"}
+    """
+    return grade_with_key(compile_answer_key(quiz.pk), answers)
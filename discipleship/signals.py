@@ -0,0 +1,133 @@
+# discipleship/signals.py
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import Signal, receiver
+
+from core.response_cache import connect_invalidation
+
+from .models import (
+    DiscipleshipLesson,
+    DiscipleshipLevel,
+    DiscipleshipPath,
+    LessonProgress,
+    QuizChoice,
+    QuizQuestion,
+)
+from .services import enrollments
+from .services.quizzes import invalidate_answer_key
+
+
+# ---------------- LessonProgress → PathEnrollment.completed_lessons ----------------
+def _path_id(progress):
+    return progress.lesson.level.path_id
+
+
+@receiver(post_init, sender=LessonProgress)
+def remember_progress_done(sender, instance, **kwargs):
+    # __dict__ ili field iliyo-deferred isilete query
+    instance._was_done = instance.__dict__.get("status") in LessonProgress.DONE_STATUSES
+
+
+@receiver(post_save, sender=LessonProgress)
+def count_progress_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if not created and update_fields is not None and "status" not in update_fields:
+        return
+    is_done = instance.status in LessonProgress.DONE_STATUSES
+    was_done = False if created else instance._was_done
+    if is_done != was_done:
+        enrollments.adjust_user_path(instance.user_id, _path_id(instance), 1 if is_done else -1)
+    instance._was_done = is_done
+
+
+@receiver(post_delete, sender=LessonProgress)
+def count_progress_on_delete(sender, instance, **kwargs):
+    if instance.status in LessonProgress.DONE_STATUSES:
+        enrollments.adjust_user_path(instance.user_id, _path_id(instance), -1)
+
+
+# ---------------- DiscipleshipLesson: level / is_published ----------------
+# Tracking moja ya placement ya lesson; counters za apps nyingine (mf.
+# progress/signals.py) zinasikiliza lesson_placement_changed badala ya
+# kurudia post_init/post_save zao.
+lesson_placement_changed = Signal()
+
+
+@receiver(post_init, sender=DiscipleshipLesson)
+def remember_lesson_placement(sender, instance, **kwargs):
+    # __dict__ ili field iliyo-deferred isilete query
+    instance._saved_placement = (
+        instance.__dict__.get("level_id"),
+        bool(instance.__dict__.get("is_published")),
+    )
+
+
+@receiver(post_save, sender=DiscipleshipLesson)
+def lesson_placement_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not {"is_published", "level"} & set(update_fields):
+        return
+    old_level, was_published = (None, False) if created else instance._saved_placement
+    new_level, is_published = instance.level_id, bool(instance.is_published)
+    instance._saved_placement = (new_level, is_published)
+    if (old_level, was_published) != (new_level, is_published):
+        lesson_placement_changed.send(
+            sender=DiscipleshipLesson, instance=instance, created=created,
+            old_level=old_level, was_published=was_published,
+            new_level=new_level, is_published=is_published,
+        )
+
+
+# ---------------- DiscipleshipLesson → PathEnrollment.total_lessons ----------------
+@receiver(lesson_placement_changed)
+def count_lesson_placement(sender, instance, created, old_level, was_published, new_level, is_published, **kwargs):
+    if was_published:
+        enrollments.adjust_level_total(old_level, -1)
+    if is_published:
+        enrollments.adjust_level_total(new_level, 1)
+    if not created and old_level != new_level:
+        enrollments.move_lesson_completions(instance.pk, old_level, new_level)
+
+
+@receiver(post_delete, sender=DiscipleshipLesson)
+def count_lesson_on_delete(sender, instance, **kwargs):
+    # Completions zake zinatolewa na post_delete za LessonProgress (cascade)
+    if instance.is_published:
+        enrollments.adjust_level_total(instance.level_id, -1)
+
+
+# ---------------- Answer keys za quizzes ----------------
+@receiver(post_init, sender=QuizQuestion)
+def remember_question_quiz(sender, instance, **kwargs):
+    instance._saved_quiz_id = instance.__dict__.get("quiz_id")
+
+
+@receiver(post_save, sender=QuizQuestion)
+@receiver(post_delete, sender=QuizQuestion)
+def question_changed(sender, instance, **kwargs):
+    # Swali likihamishwa quiz nyingine, key ya quiz ya zamani nayo imepitwa
+    for quiz_id in {instance._saved_quiz_id, instance.quiz_id} - {None}:
+        invalidate_answer_key(quiz_id)
+    instance._saved_quiz_id = instance.quiz_id
+
+
+@receiver(post_init, sender=QuizChoice)
+def remember_choice_question(sender, instance, **kwargs):
+    instance._saved_question_id = instance.__dict__.get("question_id")
+
+
+@receiver(post_save, sender=QuizChoice)
+@receiver(post_delete, sender=QuizChoice)
+def choice_changed(sender, instance, **kwargs):
+    question_ids = {instance._saved_question_id, instance.question_id} - {None}
+    quiz_ids = set(
+        QuizQuestion.objects.filter(pk__in=question_ids).values_list("quiz_id", flat=True)
+    )
+    for quiz_id in quiz_ids:
+        invalidate_answer_key(quiz_id)
+    instance._saved_question_id = instance.question_id
+
+
+# Version ya curriculum (snapshot, progress overviews) inabadilika na models hizi
+connect_invalidation(DiscipleshipPath, DiscipleshipLevel, DiscipleshipLesson)
@@ -0,0 +1,215 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from .models import (
+    DiscipleshipLesson,
+    DiscipleshipLevel,
+    DiscipleshipPath,
+    LessonProgress,
+    PathEnrollment,
+    ProgressSyncReceipt,
+    Quiz,
+    QuizAttempt,
+    QuizChoice,
+    QuizQuestion,
+)
+from .services.quizzes import grade_answers
+
+SYNC_URL = "/api/v1/discipleship/api/lesson-progress/sync/"
+
+
+class ProgressSyncTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="field", password="pass12345")
+        self.client.force_authenticate(user=self.user)
+        path = DiscipleshipPath.objects.create(name="Seeker", stage="seeker", description="d")
+        self.level = DiscipleshipLevel.objects.create(path=path, name="Level 1", description="d")
+        self.lessons = [
+            DiscipleshipLesson.objects.create(
+                level=self.level, title=f"Lesson {i}", description="d", content="c", order=i
+            )
+            for i in (1, 2)
+        ]
+        self.quiz = Quiz.objects.create(lesson=self.lessons[0], title="Quiz")
+
+    def test_batch_upserts_and_reports_per_item(self):
+        lesson_a, lesson_b = (lesson.pk for lesson in self.lessons)
+        events = [
+            {"client_id": "1", "type": "lesson_started", "lesson": lesson_a,
+             "occurred_at": "2025-01-01T09:00:00Z"},
+            {"client_id": "2", "type": "lesson_completed", "lesson": lesson_a,
+             "occurred_at": "2025-01-01T10:00:00Z", "score": 80, "time_spent_minutes": 15},
+            {"client_id": "2", "type": "lesson_completed", "lesson": lesson_a,
+             "occurred_at": "2025-01-01T10:00:00Z", "score": 80},
+            {"client_id": "3", "type": "lesson_started", "lesson": lesson_b,
+             "occurred_at": "2025-01-01T11:00:00Z"},
+            {"client_id": "4", "type": "lesson_completed", "lesson": 999999,
+             "occurred_at": "2025-01-01T11:00:00Z"},
+            {"client_id": "5", "type": "quiz_attempt", "quiz": self.quiz.pk,
+             "occurred_at": "2025-01-01T12:00:00Z", "answers": {}},
+            {"client_id": "6", "type": "lesson_completed"},
+        ]
+        response = self.client.post(SYNC_URL, {"events": events}, format="json")
+        self.assertEqual(response.status_code, 200)
+        statuses = [item["status"] for item in response.data["results"]]
+        self.assertEqual(statuses, ["ok", "ok", "duplicate", "ok", "error", "ok", "error"])
+        self.assertEqual(response.data["summary"], {"ok": 4, "duplicate": 1, "error": 2})
+
+        done = LessonProgress.objects.get(user=self.user, lesson_id=lesson_a)
+        self.assertEqual((done.status, done.score, done.time_spent_minutes), ("completed", 80, 15))
+        self.assertEqual(
+            LessonProgress.objects.get(user=self.user, lesson_id=lesson_b).status, "in_progress"
+        )
+        enrollment = PathEnrollment.objects.get(user=self.user)
+        self.assertEqual(enrollment.progress_percentage, 50)
+
+        # Retry ya batch ile ile haiundi quiz attempt ya pili
+        response = self.client.post(SYNC_URL, {"events": events[5:6]}, format="json")
+        self.assertEqual(response.data["results"][0]["status"], "duplicate")
+        self.assertEqual(QuizAttempt.objects.filter(user=self.user).count(), 1)
+
+    def test_retry_in_new_request_is_duplicate(self):
+        events = [
+            {"client_id": "a1", "type": "activity", "lesson": self.lessons[0].pk,
+             "occurred_at": "2025-01-01T09:00:00Z", "time_spent_minutes": 10},
+        ]
+        for expected in ("ok", "duplicate"):
+            response = self.client.post(SYNC_URL, {"events": events}, format="json")
+            self.assertEqual(response.data["results"][0]["status"], expected)
+        progress = LessonProgress.objects.get(user=self.user, lesson=self.lessons[0])
+        self.assertEqual(progress.time_spent_minutes, 10)
+        self.assertEqual(ProgressSyncReceipt.objects.filter(user=self.user).count(), 1)
+
+        # client_id ni ya kila user
+        other = User.objects.create_user(username="other", password="pass12345")
+        self.client.force_authenticate(user=other)
+        response = self.client.post(SYNC_URL, {"events": events}, format="json")
+        self.assertEqual(response.data["results"][0]["status"], "ok")
+
+
+class EnrollmentCountersTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="seeker", password="pass12345")
+        self.client.force_authenticate(user=self.user)
+        self.path = DiscipleshipPath.objects.create(name="Seeker", stage="seeker", description="d")
+        level = DiscipleshipLevel.objects.create(path=self.path, name="Level 1", description="d")
+        self.lessons = [
+            DiscipleshipLesson.objects.create(
+                level=level, title=f"Lesson {i}", description="d", content="c", order=i
+            )
+            for i in (1, 2, 3, 4)
+        ]
+
+    def complete(self, lesson):
+        url = f"/api/v1/discipleship/api/lessons/{lesson.pk}/complete/"
+        self.assertEqual(self.client.post(url).status_code, 200)
+
+    def enrollment(self):
+        return PathEnrollment.objects.get(user=self.user, path=self.path)
+
+    def test_counts_follow_completions_and_publication(self):
+        self.complete(self.lessons[0])
+        enrollment = self.enrollment()
+        self.assertEqual((enrollment.completed_lessons, enrollment.total_lessons), (1, 4))
+        self.assertEqual(enrollment.progress_percentage, 25)
+
+        self.complete(self.lessons[1])
+        self.complete(self.lessons[1])  # mara ya pili haiongezi
+        self.assertEqual(self.enrollment().completed_lessons, 2)
+
+        for lesson in self.lessons[2:]:
+            lesson.is_published = False
+            lesson.save()
+        enrollment = self.enrollment()
+        self.assertEqual((enrollment.total_lessons, enrollment.progress_percentage), (2, 100))
+        self.assertIsNotNone(enrollment.completed_at)
+
+        LessonProgress.objects.filter(user=self.user, lesson=self.lessons[0]).delete()
+        self.assertEqual(self.enrollment().progress_percentage, 50)
+
+        out = StringIO()
+        call_command("reconcile_path_enrollments", stdout=out)
+        self.assertIn("Reconciled 0 enrollment(s).", out.getvalue())
+
+
+class QuizAnswerKeyTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        path = DiscipleshipPath.objects.create(name="Seeker", stage="seeker", description="d")
+        level = DiscipleshipLevel.objects.create(path=path, name="Level 1", description="d")
+        lesson = DiscipleshipLesson.objects.create(level=level, title="L", description="d", content="c")
+        self.quiz = Quiz.objects.create(lesson=lesson, title="Quiz")
+        self.mc = QuizQuestion.objects.create(
+            quiz=self.quiz, question_type="multiple_choice", question_text="?", points=3
+        )
+        self.right = QuizChoice.objects.create(question=self.mc, choice_text="A", is_correct=True)
+        self.wrong = QuizChoice.objects.create(question=self.mc, choice_text="B")
+        self.tf = QuizQuestion.objects.create(
+            quiz=self.quiz, question_type="true_false", question_text="?", points=1
+        )
+        QuizChoice.objects.create(question=self.tf, choice_text="True", is_correct=True)
+
+    def test_grading_uses_cached_key(self):
+        answers = {str(self.mc.pk): self.right.pk, str(self.tf.pk): "false"}
+        self.assertEqual(grade_answers(self.quiz, answers), 75)  # 3 kati ya points 4
+        with self.assertNumQueries(0):
+            self.assertEqual(grade_answers(self.quiz, answers), 75)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.wrong.is_correct = True
+            self.wrong.save()
+        self.assertEqual(grade_answers(self.quiz, answers), 0)
+
+    def test_moving_question_invalidates_old_quiz(self):
+        lesson = DiscipleshipLesson.objects.create(
+            level=self.quiz.lesson.level, title="L2", description="d", content="c"
+        )
+        other = Quiz.objects.create(lesson=lesson, title="Quiz 2")
+        answers = {str(self.mc.pk): self.right.pk}
+        self.assertEqual(grade_answers(self.quiz, answers), 75)
+        self.assertEqual(grade_answers(other, answers), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.mc.quiz = other
+            self.mc.save()
+        self.assertEqual(grade_answers(self.quiz, answers), 0)
+        self.assertEqual(grade_answers(other, answers), 100)
+
+
+class CurriculumSnapshotTest(APITestCase):
+    URL = "/api/v1/discipleship/api/curriculum/"
+
+    def setUp(self):
+        cache.clear()
+        path = DiscipleshipPath.objects.create(name="Seeker", stage="seeker", description="d")
+        level = DiscipleshipLevel.objects.create(path=path, name="Level 1", description="d")
+        self.lesson = DiscipleshipLesson.objects.create(
+            level=level, title="Intro", description="d", content="c", video_url="https://v.example/1"
+        )
+        DiscipleshipLesson.objects.create(
+            level=level, title="Draft", description="d", content="c", is_published=False
+        )
+
+    def test_snapshot_etag_and_rebuild(self):
+        response = self.client.get(self.URL)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        (path,) = response.data["paths"]
+        self.assertEqual(path["lessons_count"], 1)
+        lesson = path["levels"][0]["lessons"][0]
+        self.assertEqual((lesson["title"], lesson["has_video"]), ("Intro", True))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.lesson.title = "Welcome"
+        self.lesson.save()
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["paths"][0]["levels"][0]["lessons"][0]["title"], "Welcome")
@@ -17,5 +17,6 @@ router.register(r"quiz-attempts", views.QuizAttemptViewSet, basename="quizattemp
 
 urlpatterns = [
     # /api/v1/discipleship/api/...
+    path("api/curriculum/", views.CurriculumSnapshotAPIView.as_view(), name="curriculum"),
     path("api/", include(router.urls)),
 ]
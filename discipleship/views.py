@@ -1,12 +1,15 @@
 # discipleship/views.py
 from django.utils import timezone
-from django.db.models import Count
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 
+from core.conditional import conditional_response, set_validators
+from core.querysets import AnnotatedCountsMixin, ListOnlyFieldsMixin
+
 from .models import (
     DiscipleshipPath,
     DiscipleshipLevel,
@@ -25,13 +28,18 @@ from .serializers import (
     PathEnrollmentSerializer,
     QuizSerializer,
     QuizAttemptSerializer,
+    ProgressSyncSerializer,
+    ProgressSyncEventSerializer,
 )
+from .services.curriculum import curriculum_etag, curriculum_snapshot
+from .services.progress_sync import sync_progress_events
+from .services.quizzes import grade_answers
 
 # Tunatumia permission ile ile kama content
 from content.permissions import AdminOrReadOnly
 
 
-class DiscipleshipPathViewSet(viewsets.ModelViewSet):
+class DiscipleshipPathViewSet(AnnotatedCountsMixin, viewsets.ModelViewSet):
     """
     CRUD ya Discipleship Paths (Seeker / Scholar / Missionary)
     """
@@ -45,7 +53,7 @@ class DiscipleshipPathViewSet(viewsets.ModelViewSet):
     ordering = ["order"]
 
 
-class DiscipleshipLevelViewSet(viewsets.ModelViewSet):
+class DiscipleshipLevelViewSet(AnnotatedCountsMixin, viewsets.ModelViewSet):
     """
     Levels ndani ya Path
     """
@@ -63,7 +71,7 @@ class DiscipleshipLevelViewSet(viewsets.ModelViewSet):
     ordering = ["path__order", "order"]
 
 
-class DiscipleshipLessonViewSet(viewsets.ModelViewSet):
+class DiscipleshipLessonViewSet(ListOnlyFieldsMixin, viewsets.ModelViewSet):
     """
     Lessons per level + actions za kuanza/kucomplete
     """
@@ -231,6 +239,45 @@ class LessonProgressViewSet(viewsets.ModelViewSet):
         serializer = LessonProgressSerializer(progress)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["post"])
+    def sync(self, request):
+        """
+        Batch ya events za offline (POST .../lesson-progress/sync/):
+
+        {"events": [
+          {"client_id": "a1", "type": "lesson_completed", "lesson": 3,
+           "occurred_at": "2025-01-01T10:00:00Z", "score": 90},
+          {"type": "quiz_attempt", "quiz": 2, "occurred_at": "...", "answers": {...}}
+        ]}
+
+        Rudisha matokeo ya kila event kwa mpangilio ule ule wa input.
+        """
+        batch = ProgressSyncSerializer(data=request.data)
+        batch.is_valid(raise_exception=True)
+
+        results = {}
+        valid = []
+        for index, raw in enumerate(batch.validated_data["events"]):
+            event = ProgressSyncEventSerializer(data=raw)
+            if event.is_valid():
+                valid.append((index, event.validated_data))
+            else:
+                results[index] = {"status": "error", "errors": event.errors}
+
+        results.update(
+            sync_progress_events(request.user, valid, is_staff=request.user.is_staff)
+        )
+        items = []
+        for index, raw in enumerate(batch.validated_data["events"]):
+            item = {"index": index, "client_id": raw.get("client_id")}
+            item.update(results[index])
+            items.append(item)
+
+        summary = {"ok": 0, "duplicate": 0, "error": 0}
+        for item in items:
+            summary[item["status"]] += 1
+        return Response({"results": items, "summary": summary})
+
 
 class PathEnrollmentViewSet(viewsets.ModelViewSet):
     """
@@ -335,61 +382,7 @@ class QuizViewSet(viewsets.ModelViewSet):
         answers = request.data.get("answers", {}) or {}
         time_spent = request.data.get("time_spent_minutes", 0)
 
-        # Simple grading logic
-        total_points = quiz.questions.aggregate(total=Count("points"))["total"] or 0
-        if total_points == 0:
-            # Fallback: one point per question
-            total_points = quiz.questions.count()
-
-        score_points = 0
-
-        for question in quiz.questions.all():
-            q_key = str(question.id)
-            user_answer = answers.get(q_key)
-
-            if question.question_type == "multiple_choice":
-                # user_answer can be id or list of ids
-                if user_answer is None:
-                    continue
-                if not isinstance(user_answer, list):
-                    user_answer = [user_answer]
-                try:
-                    user_ids = {int(x) for x in user_answer}
-                except (ValueError, TypeError):
-                    user_ids = set()
-
-                correct_ids = set(
-                    question.choices.filter(is_correct=True).values_list("id", flat=True)
-                )
-                if correct_ids and user_ids == correct_ids:
-                    score_points += question.points
-
-            elif question.question_type == "true_false":
-                if user_answer is None:
-                    continue
-                answer_str = str(user_answer).lower()
-                chosen_true = None
-                if answer_str in ["true", "t", "1", "yes"]:
-                    chosen_true = True
-                elif answer_str in ["false", "f", "0", "no"]:
-                    chosen_true = False
-
-                correct_choice = question.choices.filter(is_correct=True).first()
-                if correct_choice and chosen_true is not None:
-                    correct_is_true = (
-                        correct_choice.choice_text.strip().lower().startswith("t")
-                    )
-                    if chosen_true == correct_is_true:
-                        score_points += question.points
-
-            else:
-                # short_answer – kwa sasa hatu-auto-grade
-                continue
-
-        if total_points > 0:
-            percent_score = int(round((score_points / total_points) * 100))
-        else:
-            percent_score = 0
+        percent_score = grade_answers(quiz, answers)
 
         passed = percent_score >= quiz.passing_score
 
@@ -431,3 +424,21 @@ class QuizAttemptViewSet(viewsets.ReadOnlyModelViewSet):
         if self.request.user.is_staff:
             return qs
         return qs.filter(user=self.request.user)
+
+
+class CurriculumSnapshotAPIView(APIView):
+    """
+    GET /api/v1/discipleship/api/curriculum/
+    → Mti mzima wa curriculum iliyo published (paths → levels → lessons)
+      kama document moja iliyo-cache, yenye ETag. Client akituma
+      ``If-None-Match`` ya version ya sasa anapata 304 bila query yoyote.
+    """
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        not_modified = conditional_response(request, curriculum_etag(), use_last_modified=False)
+        if not_modified is not None:
+            return not_modified
+
+        etag, document = curriculum_snapshot()
+        return set_validators(Response(document), etag)
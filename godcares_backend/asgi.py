@@ -1,6 +1,11 @@
+# godcares_backend/asgi.py
+# Endesha kwa ASGI server (mf. `uvicorn godcares_backend.asgi:application`)
+# ili SSE ya notifications (/api/v1/notifications/api/notifications/stream/)
+# isishikilie worker thread kwa kila client. LocalPubSub ni ya process moja;
+# workers wengi => weka NOTIFICATION_PUBSUB_BACKEND.
 import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'godcares_backend.settings')
 
-application = get_asgi_application()
\ No newline at end of file
+application = get_asgi_application()
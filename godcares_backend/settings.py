@@ -61,8 +61,9 @@ LOCAL_APPS = [
     "content.apps.ContentConfig",
     "notifications.apps.NotificationsConfig",
     "discipleship.apps.DiscipleshipConfig",
-    "progress",  # kama haina AppConfig maalum
+    "progress.apps.ProgressConfig",
     "core",      # middleware yako ipo hapa
+    "search.apps.SearchConfig",  # full-text index (FTS5 / tsvector)
     # "shop",      # optional — itaongezwa chini endapo ipo
     # "mentorship" # optional — itaongezwa chini endapo ipo
 ]
@@ -110,7 +111,8 @@ MIDDLEWARE = [
 # -------------------------------------------------------------------
 ROOT_URLCONF = "godcares_backend.urls"
 WSGI_APPLICATION = "godcares_backend.wsgi.application"
-# ASGI_APPLICATION = "godcares_backend.asgi.application"  # kama utaongeza ASGI
+# ASGI (uvicorn/daphne) inahitajika kwa SSE ya notifications
+ASGI_APPLICATION = "godcares_backend.asgi.application"
 
 # -------------------------------------------------------------------
 # Templates
@@ -358,6 +360,125 @@ MENTORSHIP_SIGNUP_URL_NAME = config(
     "MENTORSHIP_SIGNUP_URL_NAME", default="content:signup"
 )
 
+# -------------------------------------------------------------------
+# Cache (LocMem kwa dev; kwa production weka backend ya pamoja, mf.
+#   CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+#   CACHE_LOCATION=redis://127.0.0.1:6379/1)
+# -------------------------------------------------------------------
+CACHE_BACKEND = config(
+    "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+)
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": config("CACHE_LOCATION", default="godcares-default"),
+        "TIMEOUT": config("CACHE_TIMEOUT", default=300, cast=int),
+        "KEY_PREFIX": "godcares",
+    }
+}
+if CACHE_BACKEND.endswith("LocMemCache"):
+    CACHES["default"]["OPTIONS"] = {"MAX_ENTRIES": 10000}
+
+# Response cache ya GET za umma (core/response_cache.py)
+RESPONSE_CACHE_ENABLED = config("RESPONSE_CACHE_ENABLED", default=True, cast=bool)
+RESPONSE_CACHE_TIMEOUT = config("RESPONSE_CACHE_TIMEOUT", default=300, cast=int)
+
+# -------------------------------------------------------------------
+# View counters (write-behind; tazama content/services/view_counts.py)
+# -------------------------------------------------------------------
+# Sekunde kati ya flush za inline; 0 = tumia `manage.py flush_view_counts --loop` tu
+# (command inahitaji cache ya pamoja; kwa LocMem inline flush ndiyo pekee)
+VIEW_COUNTER_FLUSH_INTERVAL = config(
+    "VIEW_COUNTER_FLUSH_INTERVAL", default=30, cast=int
+)
+
+# -------------------------------------------------------------------
+# Mission heatmap (tiles z/x/y; tazama content/services/heatmap.py)
+# -------------------------------------------------------------------
+MISSION_HEATMAP_MAX_ZOOM = config("MISSION_HEATMAP_MAX_ZOOM", default=16, cast=int)
+MISSION_HEATMAP_DEFAULT_ZOOM = config(
+    "MISSION_HEATMAP_DEFAULT_ZOOM", default=6, cast=int
+)
+
+# -------------------------------------------------------------------
+# Global souls counter (sharded; tazama content/services/global_counter.py)
+# -------------------------------------------------------------------
+GLOBAL_COUNTER_SHARDS = config("GLOBAL_COUNTER_SHARDS", default=8, cast=int)
+# Sekunde za ku-cache totals zilizojumlishwa (0 = soma DB kila mara)
+GLOBAL_COUNTER_CACHE_TIMEOUT = config(
+    "GLOBAL_COUNTER_CACHE_TIMEOUT", default=5, cast=int
+)
+# Sekunde kati ya recompute za inline za derived stats (active_missionaries);
+# 0 = tumia `manage.py recompute_global_stats --loop` tu (inahitaji cache ya
+# pamoja: kwa LocMem command haioni flag ya dirty, hivyo weka interval > 0)
+GLOBAL_STATS_RECOMPUTE_INTERVAL = config(
+    "GLOBAL_STATS_RECOMPUTE_INTERVAL", default=30, cast=int
+)
+
+# -------------------------------------------------------------------
+# Progress overview (tazama progress/services/overview.py)
+# -------------------------------------------------------------------
+# Sekunde za ku-cache overview ya kila user; inafutwa mapema na completion mpya
+PROGRESS_OVERVIEW_CACHE_TIMEOUT = config(
+    "PROGRESS_OVERVIEW_CACHE_TIMEOUT", default=60 * 60, cast=int
+)
+
+# -------------------------------------------------------------------
+# Offline progress sync (tazama discipleship/services/progress_sync.py)
+# -------------------------------------------------------------------
+# Events za juu kabisa kwa kila batch ya offline sync
+# (POST /api/v1/discipleship/api/lesson-progress/sync/)
+DISCIPLESHIP_SYNC_MAX_EVENTS = config(
+    "DISCIPLESHIP_SYNC_MAX_EVENTS", default=200, cast=int
+)
+
+# -------------------------------------------------------------------
+# Quizzes (tazama discipleship/services/quizzes.py)
+# -------------------------------------------------------------------
+# Sekunde za ku-cache answer key ya kila quiz; inafutwa mapema na signals
+QUIZ_ANSWER_KEY_CACHE_TIMEOUT = config(
+    "QUIZ_ANSWER_KEY_CACHE_TIMEOUT", default=60 * 60, cast=int
+)
+
+# Outbox ya notifications (manage.py process_notification_outbox):
+# wapokeaji kwa kila chunk/transaction, majaribio kabla ya "failed", na sekunde
+# ambazo entry ya "processing" inachukuliwa kuwa imekwama (worker alikufa)
+NOTIFICATION_OUTBOX_CHUNK_SIZE = config("NOTIFICATION_OUTBOX_CHUNK_SIZE", default=500, cast=int)
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = config("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", default=5, cast=int)
+NOTIFICATION_OUTBOX_STALE_AFTER = config("NOTIFICATION_OUTBOX_STALE_AFTER", default=600, cast=int)
+
+# Sekunde za ku-cache idadi ya notifications zisizosomwa kwa kila user
+# (inasasishwa na create/read; cache miss = COUNT kutoka DB)
+NOTIFICATION_UNREAD_CACHE_TIMEOUT = config(
+    "NOTIFICATION_UNREAD_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int
+)
+# Kwa cache ya process moja (LocMem): outbox worker haiwezi kusasisha counts
+# za web, hivyo zinakaa muda mfupi tu
+NOTIFICATION_UNREAD_LOCAL_CACHE_TIMEOUT = config(
+    "NOTIFICATION_UNREAD_LOCAL_CACHE_TIMEOUT", default=30, cast=int
+)
+
+# SSE ya notifications (api/notifications/stream/): pub/sub backend na
+# sekunde kati ya keep-alive comments.
+# LIMITATION: LocalPubSub inafikisha events za process ile ile ya ASGI tu.
+# Notifications zinazoundwa na `process_notification_outbox` (process nyingine)
+# au kwenye worker mwingine HAZIPUSHIWI; clients wanazipata kwa polling/reconnect.
+# Kwa push kamili weka backend juu ya broker wa pamoja (mf. Redis pub/sub).
+NOTIFICATION_PUBSUB_BACKEND = config(
+    "NOTIFICATION_PUBSUB_BACKEND", default="notifications.realtime.LocalPubSub"
+)
+NOTIFICATION_STREAM_KEEPALIVE = config("NOTIFICATION_STREAM_KEEPALIVE", default=25, cast=int)
+
+# Outbox ya barua pepe (manage.py send_email_outbox): emails kwa kila batch,
+# kikomo cha kila dakika (0 = bila kikomo), majaribio kabla ya "failed",
+# backoff ya kwanza (sekunde, inazidishwa mara 2 kila jaribio) na sekunde
+# ambazo row ya "sending" inachukuliwa kuwa imekwama
+EMAIL_OUTBOX_BATCH_SIZE = config("EMAIL_OUTBOX_BATCH_SIZE", default=50, cast=int)
+EMAIL_OUTBOX_RATE_PER_MINUTE = config("EMAIL_OUTBOX_RATE_PER_MINUTE", default=60, cast=int)
+EMAIL_OUTBOX_MAX_ATTEMPTS = config("EMAIL_OUTBOX_MAX_ATTEMPTS", default=5, cast=int)
+EMAIL_OUTBOX_RETRY_BACKOFF = config("EMAIL_OUTBOX_RETRY_BACKOFF", default=60, cast=int)
+EMAIL_OUTBOX_STALE_AFTER = config("EMAIL_OUTBOX_STALE_AFTER", default=600, cast=int)
+
 # -------------------------------------------------------------------
 # Logging (Dev-friendly)
 # -------------------------------------------------------------------
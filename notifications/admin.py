@@ -4,7 +4,8 @@ from django import forms
 from django.contrib.auth import get_user_model
 from django.db import transaction
 
-from .models import Notification
+from .models import BroadcastNotification, EmailOutbox, Notification, NotificationOutbox
+from .outbox import enqueue_broadcast
 from .utils import broadcast_notification
 
 User = get_user_model()
@@ -55,21 +56,38 @@ class NotificationAdmin(admin.ModelAdmin):
                 if not send_to_all and not recipients:
                     form.add_error("recipients", "Chagua wapokeaji au tiki 'Tuma kwa wote'.")
                 else:
-                    with transaction.atomic():
-                        created_count = broadcast_notification(
+                    if send_to_all:
+                        # Wote: fan-out inafanywa na worker (process_notification_outbox)
+                        enqueue_broadcast(
                             title=title,
                             body=body,
                             url=url,
                             level=level,
-                            recipients=recipients,      # None => all opted-in users
+                            recipients=None,            # None => all opted-in users
                             send_email=email_also,
-                            sender=request.user,        # Hatuwaonyeshi users; tunahifadhi tu
+                            sender=request.user,
+                        )
+                        self.message_user(
+                            request,
+                            "✅ Ujumbe umepangwa kutumwa kwa watumiaji wote.",
+                            level=messages.SUCCESS,
+                        )
+                    else:
+                        with transaction.atomic():
+                            created_count = broadcast_notification(
+                                title=title,
+                                body=body,
+                                url=url,
+                                level=level,
+                                recipients=recipients,
+                                send_email=email_also,
+                                sender=request.user,        # Hatuwaonyeshi users; tunahifadhi tu
+                            )
+                        self.message_user(
+                            request,
+                            f"✅ Ujumbe umetumwa kwa {created_count} wapokeaji.",
+                            level=messages.SUCCESS,
                         )
-                    self.message_user(
-                        request,
-                        f"✅ Ujumbe umetumwa kwa {created_count} wapokeaji.",
-                        level=messages.SUCCESS,
-                    )
                     # Rudi kwenye list view ya Notification
                     from django.urls import reverse
                     from django.shortcuts import redirect
@@ -104,3 +122,33 @@ class NotificationAdmin(admin.ModelAdmin):
             for f in form.base_fields.values():
                 f.disabled = True
         return form
+
+
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    # Foleni ya broadcasts; fan-out inafanywa na `manage.py process_notification_outbox`
+    list_display = ("title", "status", "delivered", "attempts", "created_at", "finished_at")
+    list_filter = ("status", "level", "created_at")
+    search_fields = ("title", "last_error")
+    readonly_fields = (
+        "recipient_ids", "status", "cursor", "delivered", "attempts",
+        "last_error", "created_at", "started_at", "finished_at",
+    )
+
+
+@admin.register(BroadcastNotification)
+class BroadcastNotificationAdmin(admin.ModelAdmin):
+    # Broadcast moja kwa wote; read state iko kwenye BroadcastReadMark/BroadcastReceipt
+    list_display = ("title", "level", "created_at")
+    list_filter = ("level", "created_at")
+    search_fields = ("title", "body")
+    readonly_fields = ("sender", "created_at")
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    # Zinatumwa na `manage.py send_email_outbox`; status ya kila message iko hapa
+    list_display = ("subject", "status", "attempts", "next_attempt_at", "sent_at", "created_at")
+    list_filter = ("status", "created_at")
+    search_fields = ("subject", "last_error")
+    readonly_fields = ("status", "attempts", "last_error", "locked_at", "sent_at", "created_at")
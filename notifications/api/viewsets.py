@@ -3,6 +3,9 @@ from django.apps import apps
 from rest_framework import viewsets, permissions, serializers
 from typing import Dict, Type
 
+from core.pagination import CreatedAtCursorPagination
+from notifications.broadcasts import InboxFeed
+
 class AdminOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
         return True if request.method in ("GET", "HEAD", "OPTIONS") else bool(request.user and request.user.is_staff)
@@ -22,8 +25,23 @@ def get_auto_serializer(Model) -> Type[serializers.ModelSerializer]:
     _SERIALIZER_CACHE[Model] = Cls
     return Cls
 
+class InboxItemSerializer(serializers.Serializer):
+    """Row ya InboxFeed: direct notification au broadcast."""
+    id = serializers.IntegerField(source="pk")
+    kind = serializers.CharField()
+    title = serializers.CharField()
+    body = serializers.CharField()
+    url = serializers.CharField()
+    level = serializers.CharField()
+    is_read = serializers.BooleanField(source="read")
+    created_at = serializers.DateTimeField()
+
+    class Meta:
+        ref_name = "notifications_InboxItem"
+
 class NotificationViewSet(viewsets.ModelViewSet):
     permission_classes = [AdminOrReadOnly]
+    pagination_class = CreatedAtCursorPagination  # ?cursor= kwa inbox kubwa
 
     def get_model(self):
         return apps.get_model("notifications", "Notification")
@@ -33,9 +51,21 @@ class NotificationViewSet(viewsets.ModelViewSet):
         qs = Model._default_manager.all()
         if hasattr(Model, "is_published") and not getattr(self.request.user, "is_staff", False):
             qs = qs.filter(is_published=True)
+        # Wasio staff waone notifications zao tu (index: recipient, created_at, id)
+        if not getattr(self.request.user, "is_staff", False):
+            if not self.request.user.is_authenticated:
+                return qs.none()
+            qs = qs.filter(recipient=self.request.user)
         return qs.order_by("-pk")
 
     def get_serializer_class(self):
         return get_auto_serializer(self.get_model())
 
+    def list(self, request, *args, **kwargs):
+        # Wasio staff: inbox yao = direct notifications + broadcasts (notifications/broadcasts.py)
+        if getattr(request.user, "is_staff", False) or not request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+        page = self.paginate_queryset(InboxFeed(request.user))
+        return self.get_paginated_response(InboxItemSerializer(page, many=True).data)
+
 __all__ = ["NotificationViewSet"]
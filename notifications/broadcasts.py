@@ -0,0 +1,151 @@
+# notifications/broadcasts.py
+"""
+Fan-out-on-read: inbox = ``Notification`` za user + ``BroadcastNotification``.
+
+- Broadcast inaonekana kwa user aliyekuwepo wakati ilipotumwa
+  (``created_at >= date_joined``) na aliyewasha arifa.
+- Imesomwa ikiwa ``id <= BroadcastReadMark.last_read_id`` (mark-all-read ni
+  update ya row moja) au kuna ``BroadcastReceipt`` ya user.
+- ``InboxFeed(user)`` ni ``UNION ALL`` ya vyanzo viwili (rows ni dicts zenye
+  ``kind`` = "direct"/"broadcast"); inafanya kazi na ``Paginator`` na
+  ``core.pagination.keyset_page`` kwa sababu cursor filter inawekwa kwenye
+  kila upande kabla ya union.
+"""
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    BooleanField, Exists, ExpressionWrapper, F, Max, OuterRef, Q, Subquery, Value,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import BroadcastNotification, BroadcastReadMark, BroadcastReceipt, Notification
+
+User = get_user_model()
+FEED_FIELDS = ("pk", "title", "body", "url", "level", "created_at", "kind", "read")
+
+
+def _watermark(user):
+    return Coalesce(
+        Subquery(BroadcastReadMark.objects.filter(user=user.pk).values("last_read_id")[:1]),
+        Value(0),
+    )
+
+
+def visible_broadcasts(user):
+    if not getattr(user, "is_authenticated", False):
+        return BroadcastNotification.objects.none()
+    return BroadcastNotification.objects.filter(
+        Exists(
+            User.objects.filter(pk=user.pk, profile__receive_notifications=True)
+        ),
+        created_at__gte=user.date_joined,
+    )
+
+
+def receives_broadcasts(user):
+    """Kama ``visible_broadcasts``: user aliyezima arifa haoni broadcasts."""
+    return User.objects.filter(pk=user.pk, profile__receive_notifications=True).exists()
+
+
+def with_read_state(queryset, user):
+    """Ongeza ``read`` (bool) kwa kila broadcast ya ``queryset``."""
+    receipt = BroadcastReceipt.objects.filter(user=user.pk, broadcast=OuterRef("pk"))
+    return queryset.annotate(
+        read=ExpressionWrapper(
+            Q(pk__lte=_watermark(user)) | Q(Exists(receipt)),
+            output_field=BooleanField(),
+        )
+    )
+
+
+def unread_broadcasts(user):
+    return (
+        visible_broadcasts(user)
+        .filter(pk__gt=_watermark(user))
+        .exclude(Exists(BroadcastReceipt.objects.filter(user=user.pk, broadcast=OuterRef("pk"))))
+    )
+
+
+def unread_count(user):
+    """Direct zisizosomwa + broadcasts zisizosomwa."""
+    if not getattr(user, "is_authenticated", False):
+        return 0
+    direct = Notification.objects.filter(recipient=user, is_read=False).count()
+    return direct + unread_broadcasts(user).count()
+
+
+def mark_broadcast_read(user, broadcast):
+    if BroadcastReadMark.objects.filter(user=user, last_read_id__gte=broadcast.pk).exists():
+        return False
+    try:
+        with transaction.atomic():
+            BroadcastReceipt.objects.create(user=user, broadcast=broadcast)
+    except IntegrityError:
+        return False
+    from .unread import adjust_unread  # unread.py inaimport module hii
+    adjust_unread([user.pk], -1)
+    return True
+
+
+def mark_all_read(user):
+    """Direct: update moja; broadcasts: sogeza watermark. Rudisha idadi ya direct."""
+    updated = Notification.objects.filter(recipient=user, is_read=False).update(
+        is_read=True, read_at=timezone.now()
+    )
+    last_id = BroadcastNotification.objects.aggregate(last=Max("pk"))["last"]
+    if last_id:
+        with transaction.atomic():
+            mark, _ = BroadcastReadMark.objects.select_for_update().get_or_create(user=user)
+            if mark.last_read_id < last_id:
+                mark.last_read_id = last_id
+                mark.save(update_fields=["last_read_id", "updated_at"])
+            # Receipts chini ya watermark hazihitajiki tena
+            BroadcastReceipt.objects.filter(user=user, broadcast_id__lte=last_id).delete()
+    from .unread import forget_unread
+    forget_unread(user.pk)
+    return updated
+
+
+class InboxFeed:
+    """
+    Inbox ya user kama "queryset" moja (mpya → wa zamani).
+
+    Ina ``filter()``/``order_by()`` (kwa keyset_page) na ``count()``/slicing
+    (kwa Paginator); filters zinawekwa kwenye pande zote mbili.
+    """
+    ordered = True
+
+    def __init__(self, user, where=None):
+        self.user = user
+        self.where = where or Q()
+
+    def filter(self, *args, **kwargs):
+        return InboxFeed(self.user, self.where & Q(*args, **kwargs))
+
+    def _direct(self):
+        return (
+            Notification.objects.filter(recipient=self.user)
+            .filter(self.where)
+            .annotate(kind=Value("direct"), read=F("is_read"))
+            .order_by()
+            .values(*FEED_FIELDS)
+        )
+
+    def _broadcasts(self):
+        return (
+            # kind kabla ya read: union inahitaji mpangilio sawa wa annotations
+            with_read_state(visible_broadcasts(self.user).annotate(kind=Value("broadcast")), self.user)
+            .filter(self.where)
+            .order_by()
+            .values(*FEED_FIELDS)
+        )
+
+    def order_by(self, *fields):
+        return self._direct().union(self._broadcasts(), all=True).order_by(*fields)
+
+    def count(self):
+        return self._direct().count() + self._broadcasts().count()
+
+    def __getitem__(self, key):
+        return self.order_by("-created_at", "-pk")[key]
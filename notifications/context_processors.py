@@ -1,18 +1,20 @@
+from .unread import unread_count
+
+def _unread_for(request):
+    # Processors zote mbili zinatumia hesabu moja kwa kila request
+    if not hasattr(request, "_notif_unread_count"):
+        count = 0
+        u = getattr(request, "user", None)
+        if getattr(u, "is_authenticated", False):
+            try:
+                count = unread_count(u)
+            except Exception:
+                count = 0
+        request._notif_unread_count = count
+    return request._notif_unread_count
+
 def unread_notifications(request):
-    count = 0
-    if request.user.is_authenticated:
-        try:
-            count = request.user.notifications.filter(is_read=False).count()
-        except Exception:
-            count = 0
-    return {"notif_unread_count": count}
+    return {"notif_unread_count": _unread_for(request)}
 
 def notif_counts(request):
-    count = 0
-    u = getattr(request, "user", None)
-    if getattr(u, "is_authenticated", False):
-        try:
-            count = u.notifications.filter(is_read=False).count()
-        except Exception:
-            pass
-    return {"notif_unread_count": count}
+    return {"notif_unread_count": _unread_for(request)}
@@ -0,0 +1,158 @@
+# notifications/email_outbox.py
+"""
+Outbox ya barua pepe: request haisubiri SMTP, na kushindwa hakupotei.
+
+- ``enqueue_email(...)`` / ``enqueue_emails([...])``: row ya ``EmailOutbox``
+  ndani ya transaction ya caller (rollback => hakuna email).
+- ``send_pending()`` (``manage.py send_email_outbox``): inachukua batch ya
+  ``EMAIL_OUTBOX_BATCH_SIZE`` isiyozidi nafasi ya ``EMAIL_OUTBOX_RATE_PER_MINUTE``
+  (zilizotumwa ndani ya sekunde 60 zilizopita), inatuma kwa connection moja,
+  na kuandika status ya kila message.
+- Ikishindwa: ``pending`` tena baada ya backoff (``EMAIL_OUTBOX_RETRY_BACKOFF``
+  × 2^(attempts-1), hadi saa moja) hadi ``EMAIL_OUTBOX_MAX_ATTEMPTS``, kisha
+  ``failed``. Row iliyokwama ``sending`` (worker alikufa) inachukuliwa tena
+  baada ya ``EMAIL_OUTBOX_STALE_AFTER`` sekunde.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+MAX_BACKOFF = 60 * 60
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _message(subject, body, to, *, html_body="", from_email=None, reply_to=None, bcc=None):
+    return EmailOutbox(
+        subject=subject[:255],
+        body=body or "",
+        html_body=html_body or "",
+        from_email=from_email or "",
+        to=[to] if isinstance(to, str) else list(to),
+        bcc=list(bcc or []),
+        reply_to=list(reply_to or []),
+    )
+
+
+def enqueue_email(subject, body, to, **kwargs):
+    """Panga email moja; ``to`` = anwani moja au list."""
+    row = _message(subject, body, to, **kwargs)
+    row.save()
+    return row
+
+
+def enqueue_emails(messages):
+    """``messages`` = [(subject, body, from_email, [to, ...]), ...] kama send_mass_mail."""
+    rows = [
+        _message(subject, body, to, from_email=from_email)
+        for subject, body, from_email, to in messages
+    ]
+    EmailOutbox.objects.bulk_create(rows, batch_size=500)
+    return len(rows)
+
+
+@dataclass
+class SendResult:
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+def _budget(now):
+    rate = _setting("EMAIL_OUTBOX_RATE_PER_MINUTE", 60)
+    batch = _setting("EMAIL_OUTBOX_BATCH_SIZE", 50)
+    if not rate:
+        return batch
+    recent = EmailOutbox.objects.filter(status="sent", sent_at__gte=now - timedelta(minutes=1)).count()
+    return max(0, min(batch, rate - recent))
+
+
+def _claim(limit, now):
+    stale = now - timedelta(seconds=_setting("EMAIL_OUTBOX_STALE_AFTER", 600))
+    with transaction.atomic():
+        ids = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(Q(status="pending", next_attempt_at__lte=now) | Q(status="sending", locked_at__lt=stale))
+            .order_by("next_attempt_at", "id")
+            .values_list("pk", flat=True)[:limit]
+        )
+        EmailOutbox.objects.filter(pk__in=ids).update(
+            status="sending", locked_at=now, attempts=F("attempts") + 1
+        )
+    return list(EmailOutbox.objects.filter(pk__in=ids).order_by("id"))
+
+
+def _failed(row, exc, now, result):
+    row.last_error = repr(exc)
+    if row.attempts >= _setting("EMAIL_OUTBOX_MAX_ATTEMPTS", 5):
+        row.status = "failed"
+        result.failed += 1
+    else:
+        backoff = _setting("EMAIL_OUTBOX_RETRY_BACKOFF", 60) * 2 ** max(row.attempts - 1, 0)
+        row.status = "pending"
+        row.next_attempt_at = now + timedelta(seconds=min(backoff, MAX_BACKOFF))
+        result.retried += 1
+    row.save(update_fields=["status", "last_error", "next_attempt_at"])
+
+
+def send_pending(limit=None):
+    """Tuma batch moja. Rudisha ``SendResult``."""
+    now = timezone.now()
+    budget = _budget(now)
+    if limit:
+        budget = min(budget, limit)
+    result = SendResult()
+    rows = _claim(budget, now) if budget else []
+    if not rows:
+        return result
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.exception("Email outbox: could not open connection")
+        for row in rows:
+            _failed(row, exc, now, result)
+        return result
+
+    try:
+        for row in rows:
+            msg = EmailMultiAlternatives(
+                subject=row.subject,
+                body=row.body,
+                from_email=row.from_email or None,
+                to=row.to,
+                bcc=row.bcc or None,
+                reply_to=row.reply_to or None,
+                connection=connection,
+            )
+            if row.html_body:
+                msg.attach_alternative(row.html_body, "text/html")
+            try:
+                msg.send()
+            except Exception as exc:
+                logger.warning("Email outbox %s failed: %s", row.pk, exc)
+                _failed(row, exc, timezone.now(), result)
+                continue
+            row.status = "sent"
+            row.sent_at = timezone.now()
+            row.last_error = ""
+            row.save(update_fields=["status", "sent_at", "last_error"])
+            result.sent += 1
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+    return result
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from notifications.outbox import process_outbox
+
+
+class Command(BaseCommand):
+    help = "Fan-out broadcasts zilizo kwenye NotificationOutbox (notifications + emails)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop", action="store_true",
+            help="Endelea kukagua kila --interval sekunde (worker mode).",
+        )
+        parser.add_argument("--interval", type=int, default=10)
+        parser.add_argument("--limit", type=int, default=None, help="Entries za juu kwa kila mzunguko.")
+        parser.add_argument("--chunk-size", type=int, default=None, help="Wapokeaji kwa kila transaction.")
+
+    def handle(self, *args, **options):
+        while True:
+            done = process_outbox(limit=options["limit"], chunk_size=options["chunk_size"])
+            self.stdout.write(self.style.SUCCESS(f"Processed {done} outbox entries."))
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from notifications.email_outbox import send_pending
+
+
+class Command(BaseCommand):
+    help = "Tuma barua pepe zilizo kwenye EmailOutbox (batches, rate limit, retry)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop", action="store_true",
+            help="Endelea kukagua kila --interval sekunde (worker mode).",
+        )
+        parser.add_argument("--interval", type=int, default=10)
+        parser.add_argument("--limit", type=int, default=None, help="Emails za juu kwa kila mzunguko.")
+
+    def handle(self, *args, **options):
+        while True:
+            result = send_pending(limit=options["limit"])
+            self.stdout.write(self.style.SUCCESS(
+                f"Sent {result.sent}, retry {result.retried}, failed {result.failed}."
+            ))
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
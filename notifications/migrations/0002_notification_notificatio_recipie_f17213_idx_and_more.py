@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'created_at', 'id'], name='notificatio_recipie_f17213_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['created_at', 'id'], name='notificatio_created_a853cd_idx'),
+        ),
+    ]
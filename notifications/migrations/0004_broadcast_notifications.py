@@ -0,0 +1,62 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:42
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('notifications', '0003_notificationoutbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BroadcastNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('body', models.TextField(blank=True)),
+                ('url', models.CharField(blank=True, max_length=500)),
+                ('level', models.CharField(choices=[('info', 'Info'), ('success', 'Success'), ('warning', 'Warning'), ('error', 'Error')], default='info', max_length=12)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sender', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='BroadcastReadMark',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='broadcast_mark', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('last_read_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='BroadcastReceipt',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('read_at', models.DateTimeField(auto_now_add=True)),
+                ('broadcast', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='receipts', to='notifications.broadcastnotification')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='broadcast_receipts', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='notificationoutbox',
+            name='broadcast',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='notifications.broadcastnotification'),
+        ),
+        migrations.AddConstraint(
+            model_name='broadcastreceipt',
+            constraint=models.UniqueConstraint(fields=('user', 'broadcast'), name='uniq_broadcast_receipt'),
+        ),
+        migrations.AddIndex(
+            model_name='broadcastnotification',
+            index=models.Index(fields=['created_at', 'id'], name='notificatio_created_d0b8f2_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_broadcast_notifications'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'is_read'], name='notificatio_recipie_4e3567_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:51
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0005_notification_unread_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('html_body', models.TextField(blank=True)),
+                ('from_email', models.CharField(blank=True, max_length=255)),
+                ('to', models.JSONField(default=list)),
+                ('bcc', models.JSONField(blank=True, default=list)),
+                ('reply_to', models.JSONField(blank=True, default=list)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=12)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ('id',),
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='notificatio_status_1fc719_idx'), models.Index(fields=['status', 'sent_at'], name='notificatio_status_e2239e_idx')],
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
 # notifications/models.py
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 User = get_user_model()
 
@@ -28,6 +29,151 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            # Inbox / cursor pagination: WHERE recipient=… ORDER BY created_at, id
+            models.Index(fields=["recipient", "created_at", "id"]),
+            models.Index(fields=["created_at", "id"]),
+            # Rebuild ya unread counter: WHERE recipient=… AND is_read=false
+            models.Index(fields=["recipient", "is_read"]),
+        ]
 
     def __str__(self):
         return f"[{self.level}] to {self.recipient} :: {self.title}"
+
+
+class BroadcastNotification(models.Model):
+    """
+    Broadcast kwa watumiaji wote (waliowasha arifa) inahifadhiwa mara moja tu.
+
+    Hakuna row kwa kila user: inbox inaunganisha broadcasts na ``Notification``
+    wakati wa kusoma (notifications/broadcasts.py). Hali ya "imesomwa" ni
+    ``BroadcastReadMark`` (watermark ya mark-all-read) + ``BroadcastReceipt``
+    (broadcast moja moja juu ya watermark).
+    """
+    sender = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    title = models.CharField(max_length=200)
+    body = models.TextField(blank=True)
+    url = models.CharField(max_length=500, blank=True)
+    level = models.CharField(max_length=12, choices=Notification.LEVELS, default="info")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = [models.Index(fields=["created_at", "id"])]
+
+    def __str__(self):
+        return f"[{self.level}] broadcast :: {self.title}"
+
+
+class BroadcastReceipt(models.Model):
+    """User amesoma broadcast hii (ile iliyo juu ya watermark yake tu)."""
+    broadcast = models.ForeignKey(BroadcastNotification, on_delete=models.CASCADE, related_name="receipts")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="broadcast_receipts")
+    read_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "broadcast"], name="uniq_broadcast_receipt"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} read {self.broadcast_id}"
+
+
+class BroadcastReadMark(models.Model):
+    """Watermark: broadcasts zote zenye id <= ``last_read_id`` zimesomwa."""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="broadcast_mark")
+    last_read_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user} <= {self.last_read_id}"
+
+
+class NotificationOutbox(models.Model):
+    """
+    Broadcast iliyopangwa (fan-out inafanywa na worker, si ndani ya request).
+
+    Signal/admin inaandika row moja tu; ``manage.py process_notification_outbox``
+    inapitia wapokeaji kwa chunks (``cursor`` = id ya mwisho iliyoshughulikiwa,
+    hivyo worker akikatika anaendelea pale pale). Tazama notifications/outbox.py.
+    """
+    STATUS = [
+        ("pending", "Pending"),
+        ("processing", "Processing"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    title = models.CharField(max_length=200)
+    body = models.TextField(blank=True)
+    url = models.CharField(max_length=500, blank=True)
+    level = models.CharField(max_length=12, choices=Notification.LEVELS, default="info")
+    sender = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    send_email = models.BooleanField(default=True)
+    # None => watumiaji wote waliowasha arifa (BroadcastNotification moja + emails)
+    recipient_ids = models.JSONField(null=True, blank=True)
+    broadcast = models.ForeignKey(
+        BroadcastNotification, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+
+    status = models.CharField(max_length=12, choices=STATUS, default="pending")
+    cursor = models.BigIntegerField(default=0)
+    delivered = models.PositiveIntegerField(default=0)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("created_at", "id")
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return f"[{self.status}] {self.title} ({self.delivered})"
+
+
+class EmailOutbox(models.Model):
+    """
+    Barua pepe moja iliyopangwa kutumwa (helpers zote za ``send_*`` zinaandika hapa).
+
+    ``manage.py send_email_outbox`` inatuma kwa batches juu ya connection moja,
+    kwa rate limit ya kila dakika, na retry yenye backoff. Tazama
+    notifications/email_outbox.py.
+    """
+    STATUS = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=255, blank=True)
+    to = models.JSONField(default=list)
+    bcc = models.JSONField(default=list, blank=True)
+    reply_to = models.JSONField(default=list, blank=True)
+
+    status = models.CharField(max_length=12, choices=STATUS, default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("id",)
+        indexes = [
+            # Worker: WHERE status='pending' AND next_attempt_at <= now
+            models.Index(fields=["status", "next_attempt_at"]),
+            # Rate limit: zilizotumwa ndani ya dakika iliyopita
+            models.Index(fields=["status", "sent_at"]),
+        ]
+
+    def __str__(self):
+        return f"[{self.status}] {self.subject} -> {', '.join(self.to)}"
@@ -0,0 +1,157 @@
+# notifications/outbox.py
+"""
+Fan-out ya broadcasts kupitia NotificationOutbox.
+
+- ``enqueue_broadcast(...)``: row moja ya outbox (O(1) bila kujali idadi ya
+  watumiaji). ``enqueue_on_commit(...)`` inaiandika baada ya transaction ya
+  save (signals za content), hivyo save ya admin hairudi nyuma kwa sababu ya arifa.
+- ``process_outbox()``: worker (``manage.py process_notification_outbox``)
+  anachukua entries, anapitia wapokeaji kwa chunks za
+  ``NOTIFICATION_OUTBOX_CHUNK_SIZE`` kwa mpangilio wa id, na kila chunk ni
+  transaction moja (``bulk_create`` + emails) inayosogeza ``cursor``.
+  Entry ya watumiaji wote inaandika ``BroadcastNotification`` moja, hivyo
+  chunks zake ni emails tu.
+- Entry ikishindwa inarudi ``pending`` hadi ``NOTIFICATION_OUTBOX_MAX_ATTEMPTS``,
+  kisha ``failed``. Entry iliyokaa ``processing`` zaidi ya
+  ``NOTIFICATION_OUTBOX_STALE_AFTER`` sekunde (worker alikufa) inachukuliwa tena.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import NotificationOutbox
+from .utils import _opted_in_users, broadcast_notification, create_broadcast, send_notification_emails
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enqueue_broadcast(
+    *,
+    title,
+    body="",
+    url="",
+    level="info",
+    recipients=None,  # None => all opted-in
+    send_email=True,
+    sender=None,
+):
+    recipient_ids = None
+    if recipients is not None:
+        recipient_ids = sorted({getattr(u, "pk", u) for u in recipients})
+    return NotificationOutbox.objects.create(
+        title=title,
+        body=body or "",
+        url=url or "",
+        level=level,
+        recipient_ids=recipient_ids,
+        send_email=send_email,
+        sender=sender,
+    )
+
+
+def enqueue_on_commit(**kwargs):
+    transaction.on_commit(lambda: enqueue_broadcast(**kwargs))
+
+
+def _recipients(entry):
+    if entry.recipient_ids is None:
+        qs = _opted_in_users()
+    else:
+        qs = User.objects.filter(pk__in=entry.recipient_ids).select_related("profile")
+    return qs.filter(pk__gt=entry.cursor).order_by("pk")
+
+
+def _claim(entry):
+    """
+    Compare-and-swap: worker mmoja tu anapata entry hii. ``started_at`` na
+    ``attempts`` ziko kwenye filter kwa sababu entry ya "processing" iliyokwama
+    inabaki "processing" ikichukuliwa tena.
+    """
+    claimed = NotificationOutbox.objects.filter(
+        pk=entry.pk, status=entry.status, started_at=entry.started_at, attempts=entry.attempts
+    ).update(
+        status="processing",
+        started_at=timezone.now(),
+        attempts=F("attempts") + 1,
+    )
+    if claimed:
+        entry.refresh_from_db()
+    return bool(claimed)
+
+
+def process_entry(entry, chunk_size=None):
+    chunk_size = chunk_size or _setting("NOTIFICATION_OUTBOX_CHUNK_SIZE", 500)
+    try:
+        if entry.recipient_ids is None and entry.broadcast_id is None:
+            # Wote: BroadcastNotification moja tu; chunks zinabaki kwa emails
+            with transaction.atomic():
+                entry.broadcast = create_broadcast(
+                    title=entry.title,
+                    body=entry.body,
+                    url=entry.url,
+                    level=entry.level,
+                    sender=entry.sender,
+                )
+                entry.save(update_fields=["broadcast"])
+
+        while entry.broadcast_id is None or entry.send_email:
+            chunk = list(_recipients(entry)[:chunk_size])
+            if not chunk:
+                break
+            with transaction.atomic():
+                if entry.broadcast_id is None:
+                    broadcast_notification(
+                        title=entry.title,
+                        body=entry.body,
+                        url=entry.url,
+                        level=entry.level,
+                        recipients=chunk,
+                        send_email=entry.send_email,
+                        sender=entry.sender,
+                    )
+                else:
+                    send_notification_emails(chunk, title=entry.title, body=entry.body, url=entry.url)
+                entry.cursor = chunk[-1].pk
+                entry.delivered += len(chunk)
+                # started_at = heartbeat ili entry isionekane stale
+                entry.started_at = timezone.now()
+                entry.save(update_fields=["cursor", "delivered", "started_at"])
+    except Exception as exc:
+        logger.exception("Notification outbox entry %s failed", entry.pk)
+        max_attempts = _setting("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", 5)
+        entry.status = "failed" if entry.attempts >= max_attempts else "pending"
+        entry.last_error = repr(exc)
+        entry.save(update_fields=["status", "last_error"])
+        return False
+
+    entry.status = "done"
+    entry.finished_at = timezone.now()
+    entry.last_error = ""
+    entry.save(update_fields=["status", "finished_at", "last_error"])
+    return True
+
+
+def process_outbox(limit=None, chunk_size=None):
+    """Shughulikia entries zinazosubiri. Rudisha idadi iliyokamilika."""
+    stale = timezone.now() - timedelta(seconds=_setting("NOTIFICATION_OUTBOX_STALE_AFTER", 600))
+    ready = NotificationOutbox.objects.filter(
+        Q(status="pending") | Q(status="processing", started_at__lt=stale)
+    ).order_by("created_at", "id")
+    if limit:
+        ready = ready[:limit]
+
+    done = 0
+    for entry in list(ready):
+        if _claim(entry) and process_entry(entry, chunk_size):
+            done += 1
+    return done
@@ -0,0 +1,128 @@
+# notifications/realtime.py
+"""
+Push ya notifications kwa SSE (``notifications.views.stream``, inahitaji ASGI).
+
+- Pub/sub: ``NOTIFICATION_PUBSUB_BACKEND`` (default ``LocalPubSub``, ndani ya
+  process moja). Events zinazochapishwa na process nyingine — mf. outbox
+  worker (``process_notification_outbox``) au worker mwingine wa ASGI —
+  hazifiki kwa streams za process hii; clients wanazipata kwa polling au
+  reconnect. Kwa push kamili weka class yenye ``publish(channel, message)``
+  na ``subscribe(*channels)`` (async context manager inayotoa ``asyncio.Queue``)
+  juu ya broker wa pamoja (mf. Redis pub/sub).
+- Channels: ``user_channel(id)`` kwa kila user + ``BROADCAST_CHANNEL`` kwa wote.
+- Messages ni ``{"event": "notification" | "unread", "data": {...}}`` na
+  zinachapishwa baada ya commit. Client asiye na matukio hagusi DB wala cache.
+"""
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHANNEL = "notifications:all"
+QUEUE_SIZE = 100
+
+
+def user_channel(user_id):
+    return f"notifications:u{user_id}"
+
+
+class LocalPubSub:
+    """Subscribers wa process hii tu (asyncio queues za kila connection)."""
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                # publish inaitwa kutoka sync code (thread nyingine); queue ni ya loop yake
+                loop.call_soon_threadsafe(self._offer, queue, message)
+            except RuntimeError:
+                # Loop imefungwa; subscriber ataondolewa na subscribe()
+                pass
+
+    @staticmethod
+    def _offer(queue, message):
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Client mzito: "unread" inayofuata itamrudisha sawa
+            pass
+
+    @asynccontextmanager
+    async def subscribe(self, *channels):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=QUEUE_SIZE))
+        with self._lock:
+            for channel in channels:
+                self._subscribers[channel].add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                for channel in channels:
+                    self._subscribers[channel].discard(subscriber)
+                    if not self._subscribers[channel]:
+                        del self._subscribers[channel]
+
+
+_pubsub = None
+_pubsub_lock = threading.Lock()
+
+
+def get_pubsub():
+    global _pubsub
+    if _pubsub is None:
+        with _pubsub_lock:
+            if _pubsub is None:
+                backend = getattr(settings, "NOTIFICATION_PUBSUB_BACKEND", "notifications.realtime.LocalPubSub")
+                _pubsub = import_string(backend)()
+    return _pubsub
+
+
+def publish(channels, event, data=None):
+    """Chapisha sasa hivi (tumia ndani ya on_commit)."""
+    pubsub = get_pubsub()
+    for channel in channels:
+        try:
+            pubsub.publish(channel, {"event": event, "data": data or {}})
+        except Exception:
+            # Push ni ya ziada; polling bado inafanya kazi
+            logger.exception("Notification publish to %s failed", channel)
+
+
+def payload(item, kind="direct"):
+    """Umbo sawa na InboxItemSerializer (notifications/api/viewsets.py)."""
+    return {
+        "id": item.pk,
+        "kind": kind,
+        "title": item.title,
+        "body": item.body,
+        "url": item.url,
+        "level": item.level,
+        "is_read": getattr(item, "is_read", False),
+        "created_at": item.created_at.isoformat() if item.created_at else None,
+    }
+
+
+def announce(notifications):
+    """Notifications mpya (direct) kwa wapokeaji wake, baada ya commit."""
+    messages = [(user_channel(n.recipient_id), payload(n)) for n in notifications]
+    if messages:
+        transaction.on_commit(
+            lambda: [publish([channel], "notification", data) for channel, data in messages]
+        )
+
+
+def announce_broadcast(broadcast):
+    data = payload(broadcast, kind="broadcast")
+    transaction.on_commit(lambda: publish([BROADCAST_CHANNEL], "notification", data))
@@ -2,10 +2,13 @@
 from typing import Iterable, Optional
 from django.utils import timezone
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
 from django.conf import settings
 
+from .email_outbox import enqueue_emails
 from .models import Notification
+from .outbox import enqueue_on_commit
+from .realtime import announce
+from .unread import adjust_unread
 
 User = get_user_model()
 
@@ -22,10 +25,18 @@ def broadcast_notification(
 ) -> int:
     """
     Unda Notification kwa kila recipient. Tuma email kwa waliowasha 'receive_notifications' (kwenye Profile).
-    Rudisha idadi ya waliopokea (idadi ya notifications zilizoundwa).
+    recipients=None => entry ya NotificationOutbox baada ya commit; worker
+    (process_notification_outbox) anaunda BroadcastNotification na emails
+    (kwa subject = title, from = DEFAULT_FROM_EMAIL).
+    Rudisha idadi ya records zilizoundwa (1 kwa broadcast iliyopangwa).
     """
     if recipients is None:
-        recipients = User.objects.filter(is_active=True).select_related("profile")
+        # Wote: fan-out ya O(users) haifanyiki ndani ya request
+        enqueue_on_commit(
+            title=title, body=body, url=url, level=level,
+            recipients=None, send_email=True, sender=sender,
+        )
+        return 1
 
     notifications = []
     email_list = []
@@ -45,15 +56,15 @@ def broadcast_notification(
             email_list.append(user.email)
 
     Notification.objects.bulk_create(notifications, batch_size=500)
+    # bulk_create haitumi signals
+    adjust_unread([n.recipient_id for n in notifications], +1)
+    announce(notifications)
 
-    # Tuma email (optional)
+    # Email (optional): moja kwa kila mpokeaji, kupitia EmailOutbox
     if email_list:
-        send_mail(
-            subject=email_subject or title,
-            message=body or title,
-            from_email=email_from or getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@example.com"),
-            recipient_list=email_list,
-            fail_silently=True,  # epuka kuvunja flow
+        from_email = email_from or getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@example.com")
+        enqueue_emails(
+            (email_subject or title, body or title, from_email, [email]) for email in email_list
         )
 
     return len(notifications)
@@ -1,14 +1,23 @@
 # notifications/signals.py
 from django.apps import apps
-from django.db.models.signals import pre_save, post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, pre_save, post_save
 from django.dispatch import receiver
 
-from .utils import broadcast_notification
+from core.response_cache import purge_tags
 
-# Tunataka Post, Lesson, Event toka app ya "content"
+from .models import BroadcastNotification, Notification
+from .outbox import enqueue_on_commit
+from .realtime import BROADCAST_CHANNEL, announce, announce_broadcast, publish
+from .unread import BROADCAST_TAG, adjust_unread, forget_unread
+
+# Tunataka Post, Lesson, Event toka app ya "content".
+# Signals zinaandika entry moja ya NotificationOutbox baada ya commit; fan-out
+# kwa watumiaji inafanywa na `manage.py process_notification_outbox`.
 Post = apps.get_model("content", "Post")
 Lesson = apps.get_model("content", "Lesson")
 Event = apps.get_model("content", "Event")
+Profile = apps.get_model("content", "Profile")
 
 def _was_just_published(instance, old_status):
     return (old_status != "published") and (getattr(instance, "status", None) == "published")
@@ -41,7 +50,7 @@ def post_post_save(sender, instance, created, **kwargs):
     try:
         if created or _was_just_published(instance, getattr(instance, "_old_status", None)):
             if getattr(instance, "status", "") == "published":
-                broadcast_notification(
+                enqueue_on_commit(
                     title=f"Makala mpya: {instance.title}",
                     body=(instance.excerpt or "")[:300],
                     url=getattr(instance, "get_absolute_url", lambda: "#")(),
@@ -59,7 +68,7 @@ def lesson_post_save(sender, instance, created, **kwargs):
     try:
         if created or _was_just_published(instance, getattr(instance, "_old_status", None)):
             if getattr(instance, "status", "") == "published":
-                broadcast_notification(
+                enqueue_on_commit(
                     title=f"Somo jipya: {instance.title}",
                     body=(instance.description or "")[:300],
                     url=getattr(instance, "get_absolute_url", lambda: "#")(),
@@ -75,7 +84,7 @@ def lesson_post_save(sender, instance, created, **kwargs):
 def event_post_save(sender, instance, created, **kwargs):
     try:
         if created:
-            broadcast_notification(
+            enqueue_on_commit(
                 title=f"Tukio jipya: {instance.title}",
                 body=(instance.description or "")[:300],
                 url=getattr(instance, "get_absolute_url", lambda: "#")(),
@@ -86,3 +95,46 @@ def event_post_save(sender, instance, created, **kwargs):
             )
     except Exception:
         pass
+
+
+# ---------- Unread counter (notifications/unread.py) ----------
+@receiver(post_init, sender=Notification)
+def notification_post_init(sender, instance, **kwargs):
+    instance._was_read = instance.__dict__.get("is_read")
+
+@receiver(post_save, sender=Notification)
+def notification_post_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if created:
+        announce([instance])
+        if not instance.is_read:
+            adjust_unread([instance.recipient_id], +1)
+    elif update_fields is None or "is_read" in update_fields:
+        if instance._was_read is False and instance.is_read:
+            adjust_unread([instance.recipient_id], -1)
+        elif instance._was_read and not instance.is_read:
+            adjust_unread([instance.recipient_id], +1)
+    instance._was_read = instance.is_read
+
+@receiver(post_delete, sender=Notification)
+def notification_post_delete(sender, instance, **kwargs):
+    if not instance.is_read:
+        adjust_unread([instance.recipient_id], -1)
+
+def _broadcasts_changed():
+    # Version mpya => counters za watumiaji wote zinajengwa upya zikisomwa
+    purge_tags(BROADCAST_TAG)
+    publish([BROADCAST_CHANNEL], "unread")
+
+@receiver(post_save, sender=BroadcastNotification)
+@receiver(post_delete, sender=BroadcastNotification)
+def broadcast_changed(sender, instance, created=False, **kwargs):
+    if created:
+        announce_broadcast(instance)
+    transaction.on_commit(_broadcasts_changed)
+
+@receiver(post_save, sender=Profile)
+def profile_post_save(sender, instance, **kwargs):
+    # receive_notifications inaamua kama broadcasts zinaonekana
+    forget_unread(instance.user_id)
@@ -0,0 +1,280 @@
+from io import StringIO
+from smtplib import SMTPException
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from content.models import Category, Post
+from core.pagination import keyset_page
+from notifications.api.viewsets import NotificationViewSet
+from notifications.broadcasts import InboxFeed, mark_all_read, mark_broadcast_read, unread_count
+from notifications import unread
+from notifications.email_outbox import enqueue_email, send_pending
+from notifications.models import (
+    BroadcastNotification, BroadcastReceipt, EmailOutbox, Notification, NotificationOutbox,
+)
+from notifications.services import mark_as_read
+from notifications.utils import broadcast_notification
+from notifications.views import _event_stream
+
+
+class NotificationOutboxTest(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(username="author", password="pass12345")
+        self.readers = [
+            User.objects.create_user(username=f"reader{i}", email=f"r{i}@example.com", password="pass12345")
+            for i in range(3)
+        ]
+        self.category = Category.objects.create(name="News")
+
+    def publish(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Post.objects.create(
+                title="Habari", content="c", excerpt="e",
+                category=self.category, author=self.author, status="published",
+            )
+
+    def test_publish_enqueues_single_entry_without_fan_out(self):
+        self.publish()
+        self.assertEqual(NotificationOutbox.objects.count(), 1)
+        self.assertFalse(Notification.objects.exists())
+
+    def test_worker_delivers_in_chunks(self):
+        self.publish()
+        call_command("process_notification_outbox", "--chunk-size", "2", stdout=StringIO())
+
+        entry = NotificationOutbox.objects.get()
+        self.assertEqual(entry.status, "done")
+        self.assertEqual(entry.attempts, 1)
+        self.assertEqual(entry.delivered, 4)  # author + readers 3
+        # Broadcast moja tu; emails kwa walio na email
+        self.assertEqual(entry.broadcast.title, "Makala mpya: Habari")
+        self.assertFalse(Notification.objects.exists())
+        self.assertEqual(EmailOutbox.objects.filter(status="pending").count(), 3)
+
+        # Mzunguko wa pili hauna kazi; hakuna nakala
+        call_command("process_notification_outbox", stdout=StringIO())
+        self.assertEqual(BroadcastNotification.objects.count(), 1)
+        self.assertEqual(EmailOutbox.objects.count(), 3)
+
+        call_command("send_email_outbox", stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_stale_entry_is_claimed_once(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from notifications import outbox
+
+        self.publish()
+        NotificationOutbox.objects.update(
+            status="processing", started_at=timezone.now() - timedelta(hours=1), attempts=1
+        )
+        # Workers wawili wameorodhesha entry ile ile iliyokwama
+        first, second = NotificationOutbox.objects.get(), NotificationOutbox.objects.get()
+        self.assertTrue(outbox._claim(first))
+        self.assertFalse(outbox._claim(second))
+        self.assertEqual(NotificationOutbox.objects.get().attempts, 2)
+
+    def test_composer_broadcast_to_all_is_queued(self):
+        from notifications import services
+
+        with self.captureOnCommitCallbacks(execute=True):
+            services.broadcast_notification(title="Kwa wote", sender=self.author)
+        entry = NotificationOutbox.objects.get()
+        self.assertIsNone(entry.recipient_ids)
+        self.assertFalse(BroadcastNotification.objects.exists())
+        self.assertFalse(EmailOutbox.objects.exists())
+
+        call_command("process_notification_outbox", stdout=StringIO())
+        self.assertEqual(BroadcastNotification.objects.get().title, "Kwa wote")
+
+
+class BroadcastInboxTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="reader", password="pass12345")
+        self.other = User.objects.create_user(username="other", password="pass12345")
+        Notification.objects.create(recipient=self.user, title="Direct")
+        Notification.objects.create(recipient=self.other, title="Not mine")
+        for i in range(2):
+            broadcast_notification(title=f"Broadcast {i}", send_email=False)
+        self.broadcasts = list(BroadcastNotification.objects.order_by("pk"))
+
+    def test_broadcast_is_stored_once_and_merged(self):
+        self.assertEqual(BroadcastNotification.objects.count(), 2)
+        self.assertFalse(Notification.objects.filter(title__startswith="Broadcast").exists())
+
+        rows = list(InboxFeed(self.user)[:10])
+        self.assertEqual([r["title"] for r in rows], ["Broadcast 1", "Broadcast 0", "Direct"])
+        self.assertEqual([r["kind"] for r in rows], ["broadcast", "broadcast", "direct"])
+        self.assertEqual(InboxFeed(self.user).count(), 3)
+        self.assertEqual(unread_count(self.user), 3)
+
+        page = keyset_page(InboxFeed(self.user), None, 2)
+        self.assertEqual(len(page.items), 2)
+        rest = keyset_page(InboxFeed(self.user), page.next_cursor, 2)
+        self.assertEqual([r["title"] for r in rest.items], ["Direct"])
+
+    def test_read_receipts_and_watermark(self):
+        mark_broadcast_read(self.user, self.broadcasts[0])
+        self.assertEqual(unread_count(self.user), 2)
+        self.assertEqual(unread_count(self.other), 3)
+
+        mark_all_read(self.user)
+        self.assertEqual(unread_count(self.user), 0)
+        self.assertFalse(BroadcastReceipt.objects.exists())
+        self.assertTrue(all(r["read"] for r in InboxFeed(self.user)[:10]))
+
+        # Watumiaji wapya hawaoni broadcasts za zamani
+        late = User.objects.create_user(username="late", password="pass12345")
+        self.assertEqual(unread_count(late), 0)
+
+    def test_api_unread_count_and_viewset(self):
+        base = "/api/v1/notifications/api/notifications"
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(f"{base}/unread-count/").json()["count"], 3)
+
+        view = NotificationViewSet.as_view({"get": "list"})
+        request = APIRequestFactory().get("/", {"cursor": "", "page_size": 2})
+        force_authenticate(request, user=self.user)
+        data = view(request).data
+        self.assertEqual([r["kind"] for r in data["results"]], ["broadcast", "broadcast"])
+        self.assertIsNotNone(data["next"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"{base}/broadcasts/{self.broadcasts[1].pk}/mark-read/")
+        self.assertEqual(self.client.get(f"{base}/unread-count/").json()["count"], 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"{base}/mark-all-read/")
+        self.assertEqual(self.client.get(f"{base}/unread-count/").json()["count"], 0)
+
+
+class UnreadCounterTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="reader", password="pass12345")
+
+    def notify(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            broadcast_notification(send_email=False, **{"title": "Hi", **kwargs})
+
+    def test_counter_is_cached_and_kept_in_sync(self):
+        self.assertEqual(unread.unread_count(self.user), 0)
+        self.notify(recipients=[self.user])
+        self.notify(recipients=[self.user])
+        with self.assertNumQueries(0):
+            self.assertEqual(unread.unread_count(self.user), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_as_read(Notification.objects.first())
+        with self.assertNumQueries(0):
+            self.assertEqual(unread.unread_count(self.user), 1)
+
+        # Broadcast mpya => rebuild kutoka DB
+        self.notify()
+        self.assertEqual(unread.unread_count(self.user), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_all_read(self.user)
+        self.assertEqual(unread.unread_count(self.user), 0)
+
+    @override_settings(NOTIFICATION_UNREAD_LOCAL_CACHE_TIMEOUT=5)
+    def test_process_local_cache_uses_short_timeout(self):
+        # Tests zinatumia LocMem: updates za outbox worker hazingeonekana hapa
+        with mock.patch.object(unread.cache, "set") as cache_set:
+            unread.unread_count(self.user)
+        self.assertEqual(cache_set.call_args.args[2], 5)
+
+
+class NotificationStreamTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="reader", password="pass12345")
+
+    async def test_stream_requires_asgi_and_login(self):
+        url = "/api/v1/notifications/api/notifications/stream/"
+        self.assertEqual((await self.async_client.get(url)).status_code, 403)
+        await sync_to_async(self.async_client.force_login)(self.user)
+        response = await self.async_client.get(url)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        wsgi_response = await sync_to_async(self.client.get)(url)
+        self.assertEqual(wsgi_response.status_code, 400)
+
+    async def test_stream_pushes_new_notifications(self):
+        events = _event_stream(self.user)
+        self.assertEqual(await anext(events), 'event: unread\ndata: {"count": 0}\n\n')
+
+        def notify():
+            with self.captureOnCommitCallbacks(execute=True):
+                Notification.objects.create(recipient=self.user, title="Hi")
+
+        await sync_to_async(notify)()
+        self.assertIn('"title": "Hi"', await anext(events))
+        self.assertEqual(await anext(events), 'event: unread\ndata: {"count": 1}\n\n')
+        await events.aclose()
+
+    async def test_opted_out_user_gets_no_broadcast_events(self):
+        def opt_out():
+            self.user.profile.receive_notifications = False
+            self.user.profile.save()
+
+        await sync_to_async(opt_out)()
+        events = _event_stream(self.user)
+        await anext(events)
+
+        def notify():
+            with self.captureOnCommitCallbacks(execute=True):
+                BroadcastNotification.objects.create(title="Kwa wote")
+                Notification.objects.create(recipient=self.user, title="Direct")
+
+        await sync_to_async(notify)()
+        event = await anext(events)
+        self.assertIn('"title": "Direct"', event)
+        await events.aclose()
+
+
+@override_settings(EMAIL_OUTBOX_RATE_PER_MINUTE=2, EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+class EmailOutboxTest(TestCase):
+    def test_send_html_email_enqueues_instead_of_sending(self):
+        from content.utils.emailing import send_html_email
+
+        with mock.patch("content.utils.emailing._render_email_bodies", return_value=("text", "<p>html</p>")):
+            self.assertTrue(send_html_email("Karibu", "a@example.com", "emails/welcome.html", {}))
+        self.assertEqual(len(mail.outbox), 0)
+        row = EmailOutbox.objects.get()
+        self.assertEqual((row.status, row.to, row.html_body), ("pending", ["a@example.com"], "<p>html</p>"))
+
+        send_pending()
+        self.assertEqual(mail.outbox[0].alternatives, [("<p>html</p>", "text/html")])
+
+    def test_rate_limit_per_minute(self):
+        for i in range(3):
+            enqueue_email(f"S{i}", "b", f"u{i}@example.com")
+        self.assertEqual(send_pending().sent, 2)
+        self.assertEqual(send_pending().sent, 0)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(EmailOutbox.objects.filter(status="pending").count(), 1)
+
+    def test_retry_with_backoff_then_failed(self):
+        row = enqueue_email("S", "b", "u@example.com")
+        path = "django.core.mail.backends.locmem.EmailBackend.send_messages"
+        with mock.patch(path, side_effect=SMTPException("down")):
+            self.assertEqual(send_pending().retried, 1)
+            row.refresh_from_db()
+            self.assertEqual((row.status, row.attempts), ("pending", 1))
+            self.assertGreater(row.next_attempt_at, row.locked_at)
+            self.assertIn("down", row.last_error)
+
+            # Backoff bado haijaisha
+            self.assertEqual(send_pending().retried, 0)
+            EmailOutbox.objects.update(next_attempt_at=row.locked_at)
+            self.assertEqual(send_pending().failed, 1)
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), ("failed", 2))
@@ -0,0 +1,78 @@
+# notifications/unread.py
+"""
+Idadi ya notifications zisizosomwa kwa kila user, kwenye cache.
+
+- Key ina version ya tag ``notifications.BroadcastNotification``: broadcast
+  mpya inaongeza version (notifications/signals.py), hivyo counters za wote
+  zinajengwa upya kivivu bila kuzigusa moja moja.
+- Notification mpya => ``adjust_unread(ids, +1)``; kusoma => ``-1``;
+  mark-all-read / mabadiliko ya opt-in => ``forget_unread`` (rebuild ijayo).
+  Zote zinafanyika baada ya commit, na ``incr``/``decr`` kwenye key isiyokuwepo
+  zinapuuzwa (cache miss = rebuild kutoka DB, index ``recipient, is_read``).
+- Kila badiliko linachapisha "unread" kwa SSE (notifications/realtime.py).
+- Outbox worker (``process_notification_outbox``) ni process nyingine: kwa
+  cache ya process moja (LocMem) incr/version bump zake hazifiki kwa web,
+  hivyo counts zinakaa ``NOTIFICATION_UNREAD_LOCAL_CACHE_TIMEOUT`` tu.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from core.response_cache import cache_is_process_local, tags_version
+
+from .broadcasts import unread_count as count_unread
+from .models import BroadcastNotification
+from .realtime import publish, user_channel
+
+CACHE_PREFIX = "notifications:unread"
+BROADCAST_TAG = BroadcastNotification._meta.label
+
+
+def _key(user_id):
+    return f"{CACHE_PREFIX}:{user_id}:{tags_version(BROADCAST_TAG)}"
+
+
+def _timeout():
+    timeout = getattr(settings, "NOTIFICATION_UNREAD_CACHE_TIMEOUT", 60 * 60 * 24)
+    if cache_is_process_local():
+        return min(timeout, getattr(settings, "NOTIFICATION_UNREAD_LOCAL_CACHE_TIMEOUT", 30))
+    return timeout
+
+
+def unread_count(user):
+    if not getattr(user, "is_authenticated", False):
+        return 0
+    key = _key(user.pk)
+    count = cache.get(key)
+    if count is None:
+        count = count_unread(user)
+        cache.set(key, count, _timeout())
+    return count
+
+
+def _apply(user_ids, delta):
+    for user_id in user_ids:
+        key = _key(user_id)
+        try:
+            if cache.incr(key, delta) < 0:
+                cache.delete(key)
+        except ValueError:
+            # Haipo kwenye cache: itajengwa upya ikisomwa
+            pass
+    # SSE: streams za users hawa zisome idadi mpya
+    publish([user_channel(user_id) for user_id in user_ids], "unread")
+
+
+def adjust_unread(user_ids, delta):
+    user_ids = list(user_ids)
+    if user_ids and delta:
+        transaction.on_commit(lambda: _apply(user_ids, delta))
+
+
+def _forget(user_id):
+    cache.delete(_key(user_id))
+    publish([user_channel(user_id)], "unread")
+
+
+def forget_unread(user_id):
+    transaction.on_commit(lambda: _forget(user_id))
@@ -2,11 +2,14 @@
 from typing import Iterable, Optional
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mass_mail
 from django.db import transaction
+from django.template import TemplateDoesNotExist
 from django.template.loader import render_to_string
 from email.utils import parseaddr, formataddr
-from .models import Notification
+from .email_outbox import enqueue_emails
+from .models import BroadcastNotification, Notification
+from .realtime import announce
+from .unread import adjust_unread
 
 User = get_user_model()
 
@@ -33,6 +36,38 @@ def _opted_in_users() -> Iterable[User]:
     )
     return qs
 
+def send_notification_emails(recipients: Iterable[User], *, title: str, body: str = "", url: str = "") -> int:
+    """Panga barua pepe kwa wapokeaji walio na email + wamewasha arifa. Rudisha idadi."""
+    emails = []
+    from_email = _from_email()
+
+    for u in recipients:
+        if getattr(u, "profile", None) and getattr(u.profile, "receive_notifications", False):
+            if u.email:
+                # Email ya kawaida, unaweza customize template
+                subject = title
+                # Unaweza kutengeneza template yako ya email (HTML/text)
+                try:
+                    message = render_to_string(
+                        "emails/notification.txt",
+                        {"user": u, "title": title, "body": body, "url": url, "site_name": getattr(settings, "SITE_NAME", "GOD CARES 365")}
+                    )
+                except TemplateDoesNotExist:
+                    # Usivunje fan-out ya outbox kwa sababu ya template
+                    message = "\n\n".join(part for part in (title, body, url) if part)
+                emails.append((subject, message, from_email, [u.email]))
+
+    if emails:
+        # Zinatumwa na `manage.py send_email_outbox` (retry + rate limit)
+        enqueue_emails(emails)
+    return len(emails)
+
+def create_broadcast(*, title: str, body: str = "", url: str = "", level: str = "info", sender: Optional[User] = None):
+    """Row moja ya BroadcastNotification kwa watumiaji wote (O(1))."""
+    return BroadcastNotification.objects.create(
+        title=title, body=body or "", url=url or "", level=level, sender=sender,
+    )
+
 @transaction.atomic
 def broadcast_notification(
     *,
@@ -46,20 +81,20 @@ def broadcast_notification(
 ) -> int:
     """
     Tengeneza Notification records (moja kwa kila mpokeaji).
+    recipients=None => BroadcastNotification moja tu (inbox inaiunganisha wakati wa kusoma).
     Ikiwa send_email=True, tuma pia barua pepe kwa walio na email + wamewasha.
     Hatumtaji mtumaji kwa hadhara; 'sender' inahifadhiwa tu kwenye record kwa audit.
+    Rudisha idadi ya records zilizoundwa.
     """
     if recipients is None:
-        recipients = list(_opted_in_users())
-    else:
-        recipients = list(recipients)
-
-    notifs = []
-    emails = []
-    from_email = _from_email()
+        create_broadcast(title=title, body=body, url=url, level=level, sender=sender)
+        if send_email:
+            send_notification_emails(_opted_in_users().iterator(), title=title, body=body, url=url)
+        return 1
 
-    for u in recipients:
-        n = Notification(
+    recipients = list(recipients)
+    notifs = [
+        Notification(
             recipient=u,
             sender=sender,
             title=title,
@@ -67,24 +102,15 @@ def broadcast_notification(
             url=url or "",
             level=level,
         )
-        notifs.append(n)
-
-        if send_email and getattr(u, "profile", None) and getattr(u.profile, "receive_notifications", False):
-            if u.email:
-                # Email ya kawaida, unaweza customize template
-                subject = title
-                # Unaweza kutengeneza template yako ya email (HTML/text)
-                message = render_to_string(
-                    "emails/notification.txt",
-                    {"user": u, "title": title, "body": body, "url": url, "site_name": getattr(settings, "SITE_NAME", "GOD CARES 365")}
-                )
-                emails.append((subject, message, from_email, [u.email]))
-
+        for u in recipients
+    ]
     if notifs:
         Notification.objects.bulk_create(notifs, batch_size=500)
+        # bulk_create haitumi signals
+        adjust_unread([u.pk for u in recipients], +1)
+        announce(notifs)
 
-    if emails:
-        # Kwenye dev unaweza kuweka EMAIL_BACKEND='django.core.mail.backends.console.EmailBackend'
-        send_mass_mail(emails, fail_silently=True)
+    if send_email:
+        send_notification_emails(recipients, title=title, body=body, url=url)
 
     return len(notifs)
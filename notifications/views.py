@@ -6,6 +6,15 @@ from django.core.paginator import Paginator
 from django.urls import reverse
 from django.utils import timezone
 from django.http import JsonResponse, HttpResponseBadRequest
+import asyncio
+import json
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from core.pagination import keyset_page
+from . import broadcasts, unread
+from .realtime import BROADCAST_CHANNEL, get_pubsub, user_channel
 from .models import Notification
 from .services import broadcast_notification, mark_as_read
 from django.contrib.auth import get_user_model
@@ -15,7 +24,20 @@ User = get_user_model()
 
 @login_required
 def inbox(request):
-    qs = Notification.objects.filter(recipient=request.user).order_by("-created_at")
+    # Direct notifications + broadcasts (rows ni dicts zenye "kind")
+    qs = broadcasts.InboxFeed(request.user)
+    if "cursor" in request.GET:
+        # Keyset mode: kurasa za ndani zina gharama sawa na ya kwanza (hakuna COUNT/OFFSET)
+        try:
+            page = keyset_page(qs, request.GET.get("cursor"), 15)
+        except ValueError:
+            page = keyset_page(qs, None, 15)
+        return render(request, "notifications/inbox.html", {
+            "notifications": page.items,
+            "next_cursor": page.next_cursor,
+            "previous_cursor": page.previous_cursor,
+            "cursor_mode": True,
+        })
     paginator = Paginator(qs, 15)
     page_obj = paginator.get_page(request.GET.get("page"))
     # Mark-as-read on visit? Hapana—mteja atabonyeza kila moja; au ongeza "mark all read" kitufe
@@ -29,22 +51,28 @@ def open_and_redirect(request, pk):
         return redirect(notif.url)
     return redirect("notifications_inbox")
 
+@login_required
+def open_broadcast(request, pk):
+    broadcast = get_object_or_404(broadcasts.visible_broadcasts(request.user), pk=pk)
+    broadcasts.mark_broadcast_read(request.user, broadcast)
+    if broadcast.url:
+        return redirect(broadcast.url)
+    return redirect("notifications_inbox")
+
 @login_required
 def unread_count(request):
-    count = Notification.objects.filter(recipient=request.user, is_read=False).count()
-    return JsonResponse({"count": count})
+    return JsonResponse({"count": unread.unread_count(request.user)})
 
 @login_required
 def mark_all_read(request):
-    Notification.objects.filter(recipient=request.user, is_read=False).update(is_read=True, read_at=timezone.now())
+    broadcasts.mark_all_read(request.user)
     return redirect("notifications_inbox")
 
 @login_required
 def api_unread_count(request):
     if request.method != "GET":
         return HttpResponseBadRequest("GET only")
-    count = Notification.objects.filter(recipient=request.user, is_read=False).count()
-    return JsonResponse({"count": count})
+    return JsonResponse({"count": unread.unread_count(request.user)})
 
 @login_required
 def api_mark_read(request, pk):
@@ -57,14 +85,65 @@ def api_mark_read(request, pk):
         n.save(update_fields=["is_read", "read_at"])
     return JsonResponse({"ok": True})
 
+@login_required
+def api_mark_broadcast_read(request, pk):
+    if request.method != "POST":
+        return HttpResponseBadRequest("POST only")
+    broadcast = get_object_or_404(broadcasts.visible_broadcasts(request.user), pk=pk)
+    broadcasts.mark_broadcast_read(request.user, broadcast)
+    return JsonResponse({"ok": True})
+
 @login_required
 def api_mark_all_read(request):
     if request.method != "POST":
         return HttpResponseBadRequest("POST only")
-    qs = Notification.objects.filter(recipient=request.user, is_read=False)
-    now = timezone.now()
-    qs.update(is_read=True, read_at=now)
-    return JsonResponse({"ok": True, "updated": qs.count()})
+    updated = broadcasts.mark_all_read(request.user)
+    return JsonResponse({"ok": True, "updated": updated})
+
+# ---------- Realtime (SSE) ----------
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def _event_stream(user):
+    keepalive = getattr(settings, "NOTIFICATION_STREAM_KEEPALIVE", 25)
+    channels = (user_channel(user.pk),)
+    # Opt-in inakaguliwa mara moja kwa connection: aliyezima arifa hapati
+    # broadcasts ambazo inbox yake haizionyeshi
+    if await sync_to_async(broadcasts.receives_broadcasts)(user):
+        channels += (BROADCAST_CHANNEL,)
+    async with get_pubsub().subscribe(*channels) as messages:
+        count = await sync_to_async(unread.unread_count)(user)
+        yield _sse("unread", {"count": count})
+        while True:
+            try:
+                message = await asyncio.wait_for(messages.get(), timeout=keepalive)
+            except asyncio.TimeoutError:
+                # Comment ya SSE: connection isifungwe na proxies
+                yield ": keep-alive\n\n"
+                continue
+            if message["event"] == "unread":
+                # Cache tu (DB ikiwa cache imefutwa); tuma ikibadilika tu
+                latest = await sync_to_async(unread.unread_count)(user)
+                if latest != count:
+                    count = latest
+                    yield _sse("unread", {"count": count})
+            else:
+                yield _sse(message["event"], message["data"])
+
+async def stream(request):
+    """
+    SSE: ``notification`` (mpya, direct/broadcast) na ``unread`` ({"count"}).
+    Badala ya ku-poll unread-count; inahitaji ASGI (godcares_backend/asgi.py).
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponseBadRequest("SSE inahitaji ASGI server (uvicorn/daphne)")
+    user = await sync_to_async(lambda: request.user if request.user.is_authenticated else None)()
+    if user is None:
+        return HttpResponseForbidden("Login required")
+    response = StreamingHttpResponse(_event_stream(user), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx: usi-buffer stream
+    return response
 
 # ---------- Admin broadcast ----------
 class BroadcastForm(forms.Form):
@@ -0,0 +1,10 @@
+# progress/apps.py
+from django.apps import AppConfig
+
+
+class ProgressConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "progress"
+
+    def ready(self):
+        import progress.signals  # noqa: F401
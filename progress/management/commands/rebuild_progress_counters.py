@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from progress.services.counters import rebuild_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute UserLevelCounter and LevelLessonTotal from LessonProgress and published lessons."
+
+    def handle(self, *args, **options):
+        levels, rows = rebuild_counters()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {levels} level total(s) and {rows} user/level counter(s).")
+        )
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:28
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Q
+
+
+def backfill_counters(apps, schema_editor):
+    DiscipleshipLevel = apps.get_model('discipleship', 'DiscipleshipLevel')
+    LessonProgress = apps.get_model('progress', 'LessonProgress')
+    LevelLessonTotal = apps.get_model('progress', 'LevelLessonTotal')
+    UserLevelCounter = apps.get_model('progress', 'UserLevelCounter')
+
+    totals = DiscipleshipLevel.objects.annotate(
+        n=Count('lessons', filter=Q(lessons__is_published=True))
+    ).values_list('pk', 'n')
+    LevelLessonTotal.objects.bulk_create(
+        [LevelLessonTotal(level_id=pk, published=n) for pk, n in totals]
+    )
+    done = (
+        LessonProgress.objects.filter(status='completed').order_by()
+        .values('user_id', 'lesson__level_id').annotate(n=Count('pk'))
+    )
+    UserLevelCounter.objects.bulk_create(
+        [
+            UserLevelCounter(user_id=row['user_id'], level_id=row['lesson__level_id'], completed=row['n'])
+            for row in done
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('discipleship', '0004_alter_discipleshiplesson_created_at_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('progress', '0002_alter_lessonprogress_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LevelLessonTotal',
+            fields=[
+                ('level', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='lesson_total', serialize=False, to='discipleship.discipleshiplevel')),
+                ('published', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Level Lesson Total',
+                'verbose_name_plural': 'Level Lesson Totals',
+            },
+        ),
+        migrations.CreateModel(
+            name='UserLevelCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('level', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_counters', to='discipleship.discipleshiplevel')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='level_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User Level Counter',
+                'verbose_name_plural': 'User Level Counters',
+                'unique_together': {('user', 'level')},
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -98,3 +98,57 @@ class LevelProgress(models.Model):
 
     def __str__(self):
         return f"{self.user.username} - {self.level.path.name} / {self.level.name} - {self.status}"
+
+
+class UserLevelCounter(models.Model):
+    """
+    Idadi ya masomo ambayo user amekamilisha kwenye level (materialized).
+
+    Inasasishwa na signals za LessonProgress (progress/services/counters.py),
+    hivyo ``mark_lesson_complete`` haifanyi COUNT juu ya history ya user.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="level_counters",
+    )
+    level = models.ForeignKey(
+        DiscipleshipLevel,
+        on_delete=models.CASCADE,
+        related_name="user_counters",
+    )
+    completed = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "User Level Counter"
+        verbose_name_plural = "User Level Counters"
+        unique_together = (("user", "level"),)
+
+    def __str__(self):
+        return f"{self.user_id} / {self.level_id}: {self.completed}"
+
+
+class LevelLessonTotal(models.Model):
+    """
+    Idadi ya masomo published kwenye level (materialized).
+
+    Inasasishwa na signals za DiscipleshipLesson (publish/unpublish/delete).
+    """
+
+    level = models.OneToOneField(
+        DiscipleshipLevel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="lesson_total",
+    )
+    published = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Level Lesson Total"
+        verbose_name_plural = "Level Lesson Totals"
+
+    def __str__(self):
+        return f"{self.level_id}: {self.published}"
@@ -118,3 +118,19 @@ class MenteeProgressResponseSerializer(serializers.Serializer):
     mentee = SimpleUserSerializer()
     levels = LevelProgressSummarySerializer(many=True)
     summary = ProgressSummarySerializer()
+
+
+class CohortLevelSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    order = serializers.IntegerField()
+    total_lessons = serializers.IntegerField()
+    completed = serializers.IntegerField()
+    percent = serializers.IntegerField()
+
+
+class MenteeCohortProgressSerializer(serializers.Serializer):
+    mentee = SimpleUserSerializer()
+    joined = serializers.DateTimeField()
+    levels = CohortLevelSerializer(many=True)
+    summary = ProgressSummarySerializer()
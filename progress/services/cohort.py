@@ -0,0 +1,103 @@
+# progress/services/cohort.py
+"""
+Progress ya mentees wote wa mentor (dashboard ya mentor).
+
+Inasoma counters za progress/services/counters.py badala ya LessonProgress:
+
+- ``cohort_queryset(mentor)``: Mentorship za mentor, zime-annotate
+  ``completed`` (SUM ya UserLevelCounter za mentee) ili kupanga kwa percent
+  ndani ya DB na ku-paginate bila kusoma mentees wote.
+- ``cohort_rows(mentorships)``: kwa ukurasa mmoja tu, query moja ya counters
+  (GROUP by user, level tayari) + query moja ya levels na totals zake.
+"""
+from django.db.models import IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from discipleship.models import DiscipleshipLevel
+from mentorship.models import Mentorship
+from progress.models import UserLevelCounter
+
+ORDERINGS = {
+    "percent": ("completed", "mentee_id"),
+    "-percent": ("-completed", "mentee_id"),
+    "username": ("mentee__username",),
+    "-username": ("-mentee__username",),
+    "joined": ("date_joined", "pk"),
+    "-joined": ("-date_joined", "-pk"),
+}
+DEFAULT_ORDERING = "-percent"
+
+
+def cohort_queryset(mentor, ordering=DEFAULT_ORDERING):
+    # Jumla ya masomo published ni ile ile kwa mentees wote, hivyo kupanga
+    # kwa ``completed`` = kupanga kwa percent
+    completed = (
+        UserLevelCounter.objects.filter(user=OuterRef("mentee_id"))
+        .order_by()
+        .values("user")
+        .annotate(n=Sum("completed"))
+        .values("n")
+    )
+    return (
+        Mentorship.objects.filter(mentor=mentor)
+        .select_related("mentee")
+        .annotate(completed=Coalesce(Subquery(completed, output_field=IntegerField()), Value(0)))
+        .order_by(*ORDERINGS.get(ordering, ORDERINGS[DEFAULT_ORDERING]))
+    )
+
+
+def _percent(done, total):
+    return int((done / total) * 100) if total else 0
+
+
+def cohort_rows(mentorships):
+    """Rows za ``mentorships`` (ukurasa mmoja) pamoja na % ya kila level."""
+    mentorships = list(mentorships)
+    levels = list(
+        DiscipleshipLevel.objects.order_by("path__order", "order")
+        .annotate(total=Coalesce("lesson_total__published", 0))
+        .values("id", "name", "order", "is_active", "total")
+    )
+    total_all = sum(level["total"] for level in levels)
+
+    done = {}
+    counters = UserLevelCounter.objects.filter(
+        user_id__in=[m.mentee_id for m in mentorships]
+    ).values_list("user_id", "level_id", "completed")
+    for user_id, level_id, completed in counters:
+        done.setdefault(user_id, {})[level_id] = completed
+
+    rows = []
+    for mentorship in mentorships:
+        mentee = mentorship.mentee
+        mine = done.get(mentee.pk, {})
+        rows.append(
+            {
+                "mentee": {
+                    "id": mentee.id,
+                    "username": mentee.username,
+                    "email": mentee.email,
+                    "first_name": mentee.first_name,
+                    "last_name": mentee.last_name,
+                },
+                "joined": mentorship.date_joined,
+                "levels": [
+                    {
+                        "id": level["id"],
+                        "name": level["name"],
+                        "order": level["order"],
+                        "total_lessons": level["total"],
+                        "completed": mine.get(level["id"], 0),
+                        "percent": _percent(mine.get(level["id"], 0), level["total"]),
+                    }
+                    for level in levels
+                    if level["is_active"]
+                ],
+                "summary": {
+                    "lessons_completed": mentorship.completed if total_all else 0,
+                    "total_lessons": total_all,
+                    "overall_percent": _percent(mentorship.completed, total_all),
+                },
+            }
+        )
+    return rows
@@ -0,0 +1,124 @@
+# progress/services/counters.py
+"""
+Counters za completion (UserLevelCounter / LevelLessonTotal).
+
+- ``adjust_user_level`` / ``adjust_level_total``: UPDATE moja ya ``F()``
+  (row inaundwa kwa delta chanya tu; delta hasi kwenye row isiyokuwepo = no-op,
+  ili cascade deletes zisiunde rows mpya).
+- Signals (progress/signals.py) zinaziita LessonProgress ikibadilisha status
+  na DiscipleshipLesson ikiwa published/unpublished/kufutwa/kuhamishwa level
+  (``move_lesson_completions`` inahamisha completions za lesson iliyohamishwa).
+- ``level_status`` / ``overall_status``: lookups za counters badala ya COUNT
+  juu ya lessons na history ya user.
+- ``rebuild_counters()``: hesabu upya kutoka tables asili
+  (``manage.py rebuild_progress_counters``).
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+
+from discipleship.models import DiscipleshipLevel
+from progress.models import LessonProgress, LevelLessonTotal, UserLevelCounter
+
+
+def _adjust(model, lookup, field, delta):
+    if not delta or lookup.get("level_id") is None:
+        return
+    rows = model.objects.filter(**lookup)
+    if delta < 0:
+        # PositiveIntegerField: usishuke chini ya sifuri
+        rows.filter(**{f"{field}__gte": -delta}).update(**{field: F(field) + delta})
+        return
+    with transaction.atomic():
+        if not rows.update(**{field: F(field) + delta}):
+            try:
+                with transaction.atomic():
+                    model.objects.create(**lookup, **{field: delta})
+            except IntegrityError:
+                # Request nyingine imeunda row hii sasa hivi
+                rows.update(**{field: F(field) + delta})
+
+
+def adjust_user_level(user_id, level_id, delta):
+    _adjust(UserLevelCounter, {"user_id": user_id, "level_id": level_id}, "completed", delta)
+
+
+def adjust_level_total(level_id, delta):
+    _adjust(LevelLessonTotal, {"level_id": level_id}, "published", delta)
+
+
+def move_lesson_completions(lesson_id, old_level_id, new_level_id):
+    """Lesson imehamishwa level: completions zake zihamie counter za level mpya."""
+    users = list(
+        LessonProgress.objects.filter(lesson_id=lesson_id, status="completed")
+        .values_list("user_id", flat=True)
+    )
+    if not users or old_level_id == new_level_id:
+        return
+    with transaction.atomic():
+        if old_level_id is not None:
+            UserLevelCounter.objects.filter(
+                level_id=old_level_id, user_id__in=users, completed__gte=1
+            ).update(completed=F("completed") - 1)
+        if new_level_id is None:
+            return
+        rows = UserLevelCounter.objects.filter(level_id=new_level_id, user_id__in=users)
+        existing = set(rows.values_list("user_id", flat=True))
+        rows.update(completed=F("completed") + 1)
+        UserLevelCounter.objects.bulk_create(
+            [
+                UserLevelCounter(user_id=user_id, level_id=new_level_id, completed=1)
+                for user_id in users
+                if user_id not in existing
+            ],
+            batch_size=1000,
+        )
+
+
+def level_status(user, level_id):
+    """``(done, total)`` ya user kwenye level."""
+    done = (
+        UserLevelCounter.objects.filter(user=user, level_id=level_id)
+        .values_list("completed", flat=True)
+        .first()
+    )
+    total = (
+        LevelLessonTotal.objects.filter(level_id=level_id)
+        .values_list("published", flat=True)
+        .first()
+    )
+    return (done or 0, total or 0)
+
+
+def overall_status(user):
+    """``(done, total)`` ya masomo yote (published)."""
+    done = UserLevelCounter.objects.filter(user=user).aggregate(n=Sum("completed"))["n"]
+    total = LevelLessonTotal.objects.aggregate(n=Sum("published"))["n"]
+    return (done or 0, total or 0)
+
+
+@transaction.atomic
+def rebuild_counters():
+    """Hesabu counters zote upya. Inarudisha (levels, user_level_rows)."""
+    totals = DiscipleshipLevel.objects.annotate(
+        n=Count("lessons", filter=Q(lessons__is_published=True))
+    ).values_list("pk", "n")
+    LevelLessonTotal.objects.all().delete()
+    LevelLessonTotal.objects.bulk_create(
+        [LevelLessonTotal(level_id=pk, published=n) for pk, n in totals]
+    )
+
+    done = (
+        LessonProgress.objects.filter(status="completed")
+        .order_by()
+        .values("user_id", "lesson__level_id")
+        .annotate(n=Count("pk"))
+    )
+    UserLevelCounter.objects.all().delete()
+    UserLevelCounter.objects.bulk_create(
+        [
+            UserLevelCounter(user_id=row["user_id"], level_id=row["lesson__level_id"], completed=row["n"])
+            for row in done
+        ],
+        batch_size=1000,
+    )
+    return (len(totals), len(done))
@@ -0,0 +1,108 @@
+# progress/services/overview.py
+"""
+Overview ya progress ya user (My Progress / Mentee Progress).
+
+- Query moja ya GROUP BY level juu ya DiscipleshipLesson: masomo published
+  (``total``) na masomo ambayo user ameyakamilisha (``done``, kupitia
+  ``FilteredRelation`` ya LessonProgress za user huyo tu).
+- Query moja ya levels zilizo active (pamoja na path).
+- Matokeo yana-cache kwa kila user. Key ina versions za tags (core/response_cache.py):
+  ``progress.overview:u<id>`` inafutwa na completion ya user (progress/signals.py),
+  na tags za curriculum (discipleship/signals.py) zinafutwa ikibadilika.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, FilteredRelation, Q
+
+from core.response_cache import purge_tags, tags_version
+from discipleship.models import DiscipleshipLesson, DiscipleshipLevel
+from discipleship.services.curriculum import CURRICULUM_TAGS
+
+CACHE_PREFIX = "progress:overview"
+
+
+def user_tag(user_id):
+    return f"progress.overview:u{user_id}"
+
+
+def invalidate_overview(user_id):
+    """Futa overview ya user baada ya transaction (completion mpya n.k.)."""
+    transaction.on_commit(lambda: purge_tags(user_tag(user_id)))
+
+
+def _percent(done, total):
+    return int((done / total) * 100) if total else 0
+
+
+def level_counts(user):
+    """``{level_id: (total_published, done)}`` kwa levels zote, query moja."""
+    rows = (
+        DiscipleshipLesson.objects.alias(
+            mine=FilteredRelation(
+                "user_progress_entries",
+                condition=Q(
+                    user_progress_entries__user=user,
+                    user_progress_entries__status="completed",
+                ),
+            )
+        )
+        .order_by()
+        .values("level_id")
+        .annotate(
+            total=Count("pk", filter=Q(is_published=True)),
+            done=Count("mine__id"),
+        )
+    )
+    return {row["level_id"]: (row["total"], row["done"]) for row in rows}
+
+
+def compute_overview(user):
+    counts = level_counts(user)
+    levels = DiscipleshipLevel.objects.filter(is_active=True).select_related("path")
+
+    levels_data = []
+    for lv in levels:
+        total, done = counts.get(lv.id, (0, 0))
+        levels_data.append(
+            {
+                "id": lv.id,
+                "name": lv.name,
+                "slug": lv.slug,
+                "description": lv.description,
+                "order": lv.order,
+                "path": {
+                    "id": lv.path.id,
+                    "name": lv.path.name,
+                    "stage": lv.path.stage,
+                    "stage_label": lv.path.get_stage_display(),
+                },
+                "total_lessons": total,
+                "percent": _percent(done, total),
+            }
+        )
+
+    # Summary = masomo yote (published) ya levels zote, hata zisizo active
+    total_all = sum(total for total, _ in counts.values())
+    done_all = sum(done for _, done in counts.values())
+    return {
+        "levels": levels_data,
+        "summary": {
+            "lessons_completed": done_all if total_all else 0,
+            "total_lessons": total_all,
+            "overall_percent": _percent(done_all, total_all),
+        },
+    }
+
+
+def progress_overview(user):
+    """
+    ``{"levels": [...], "summary": {...}}`` kwa user (ina-cache).
+    """
+    version = tags_version(user_tag(user.pk), *CURRICULUM_TAGS)
+    key = f"{CACHE_PREFIX}:{user.pk}:{version}"
+    data = cache.get(key)
+    if data is None:
+        data = compute_overview(user)
+        cache.set(key, data, getattr(settings, "PROGRESS_OVERVIEW_CACHE_TIMEOUT", 3600))
+    return data
@@ -6,6 +6,7 @@ from django.utils import timezone
 
 from discipleship.models import DiscipleshipLevel, DiscipleshipLesson
 from progress.models import LessonProgress, LevelProgress
+from progress.services import counters
 from mentorship.services.rewards import award_for_mentee_event
 from mentorship.services.activation import try_activate_for_user
 
@@ -43,16 +44,8 @@ def mark_lesson_complete(user, lesson: Lesson) -> LessonProgress:
         obj.save(update_fields=["status", "completed_at"])
 
     # 2. Cheki kama level yote imekamilika kwa user huyu
-    total_in_level = Lesson.objects.filter(
-        level=lesson.level,
-        is_published=True,
-    ).count()
-
-    done_in_level = LessonProgress.objects.filter(
-        user=user,
-        lesson__level=lesson.level,
-        status="completed",
-    ).count()
+    #    (counters zimesasishwa na signal ya LessonProgress hapo juu)
+    done_in_level, total_in_level = counters.level_status(user, lesson.level_id)
 
     if total_in_level and done_in_level >= total_in_level:
         lp, created = LevelProgress.objects.get_or_create(
@@ -71,14 +64,9 @@ def mark_lesson_complete(user, lesson: Lesson) -> LessonProgress:
                 try_activate_for_user(user, reason="level1")
 
     # 3. Cheki kama amemaliza MASOMO YOTE (global, published)
-    total_all = Lesson.objects.filter(is_published=True).count()
-    if total_all:
-        done_all = LessonProgress.objects.filter(
-            user=user,
-            status="completed",
-        ).count()
-        if done_all == total_all:
-            award_for_mentee_event(user, "all_levels_complete")
+    done_all, total_all = counters.overall_status(user)
+    if total_all and done_all == total_all:
+        award_for_mentee_event(user, "all_levels_complete")
 
     return obj
 
@@ -87,16 +75,10 @@ def user_level_completion_percent(user, level: Level) -> int:
     """
     Return percent ya completion ya user kwenye level fulani.
     """
-    total = level.lessons.filter(is_published=True).count()
+    done, total = counters.level_status(user, level.pk)
     if not total:
         return 0
 
-    done = LessonProgress.objects.filter(
-        user=user,
-        lesson__level=level,
-        status="completed",
-    ).count()
-
     return int((done / total) * 100)
 
 
@@ -104,14 +86,9 @@ def user_overall_completion(user) -> Tuple[int, int, int]:
     """
     Rudisha (done, total, percent) ya masomo yote (published).
     """
-    total = Lesson.objects.filter(is_published=True).count()
+    done, total = counters.overall_status(user)
     if not total:
         return (0, 0, 0)
 
-    done = LessonProgress.objects.filter(
-        user=user,
-        status="completed",
-    ).count()
-
     pct = int((done / total) * 100)
     return (done, total, pct)
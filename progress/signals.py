@@ -0,0 +1,60 @@
+# progress/signals.py
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from discipleship.models import DiscipleshipLesson
+from discipleship.signals import lesson_placement_changed
+from progress.models import LessonProgress
+from progress.services import counters
+from progress.services.overview import invalidate_overview
+
+
+# ---------------- LessonProgress → UserLevelCounter ----------------
+@receiver(post_init, sender=LessonProgress)
+def remember_progress_status(sender, instance, **kwargs):
+    # __dict__ ili field iliyo-deferred isilete query
+    instance._was_completed = instance.__dict__.get("status") == "completed"
+
+
+@receiver(post_save, sender=LessonProgress)
+def count_progress_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if not created and update_fields is not None and "status" not in update_fields:
+        return
+    is_completed = instance.status == "completed"
+    was_completed = False if created else instance._was_completed
+    if is_completed != was_completed:
+        counters.adjust_user_level(
+            instance.user_id, instance.lesson.level_id, 1 if is_completed else -1
+        )
+    instance._was_completed = is_completed
+    # Overview ya user huyu (progress/services/overview.py) imepitwa na wakati
+    invalidate_overview(instance.user_id)
+
+
+@receiver(post_delete, sender=LessonProgress)
+def count_progress_on_delete(sender, instance, **kwargs):
+    if instance.status == "completed":
+        counters.adjust_user_level(instance.user_id, instance.lesson.level_id, -1)
+    invalidate_overview(instance.user_id)
+
+
+# ---------------- DiscipleshipLesson → LevelLessonTotal ----------------
+@receiver(lesson_placement_changed)
+def count_lesson_placement(sender, instance, created, old_level, was_published, new_level, is_published, **kwargs):
+    old = old_level if was_published else None
+    new = new_level if is_published else None
+    if old != new:
+        # publish / unpublish / kuhamishwa level
+        counters.adjust_level_total(old, -1)
+        counters.adjust_level_total(new, 1)
+    if not created and old_level != new_level:
+        # Completions zinahesabiwa hata kwa lesson isiyo published
+        counters.move_lesson_completions(instance.pk, old_level, new_level)
+
+
+@receiver(post_delete, sender=DiscipleshipLesson)
+def count_lesson_on_delete(sender, instance, **kwargs):
+    if instance.is_published:
+        counters.adjust_level_total(instance.level_id, -1)
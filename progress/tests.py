@@ -0,0 +1,155 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from discipleship.models import DiscipleshipLesson, DiscipleshipLevel, DiscipleshipPath
+from mentorship.models import Mentorship
+from progress.models import LessonProgress, LevelProgress
+from progress.services import counters
+from progress.services.overview import progress_overview
+from progress.services.tracker import mark_lesson_complete
+
+
+class ProgressOverviewTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="seeker", password="pass12345")
+        path = DiscipleshipPath.objects.create(name="Seeker", stage="seeker", description="d")
+        self.levels = [
+            DiscipleshipLevel.objects.create(path=path, name=f"Level {i}", description="d", order=i)
+            for i in (1, 2)
+        ]
+        self.lessons = [
+            DiscipleshipLesson.objects.create(
+                level=self.levels[0], title=f"Lesson {i}", description="d", content="c", order=i
+            )
+            for i in (1, 2, 3, 4)
+        ]
+        DiscipleshipLesson.objects.create(
+            level=self.levels[1], title="Draft", description="d", content="c", is_published=False
+        )
+
+    def complete(self, lesson, user=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            LessonProgress.objects.create(
+                user=user or self.user, lesson=lesson, status="completed"
+            )
+
+    def test_overview_counts_with_fixed_queries(self):
+        self.complete(self.lessons[0])
+        other = User.objects.create_user(username="other", password="pass12345")
+        self.complete(self.lessons[1], user=other)
+
+        with self.assertNumQueries(2):
+            data = progress_overview(self.user)
+
+        first, second = data["levels"]
+        self.assertEqual((first["total_lessons"], first["percent"]), (4, 25))
+        self.assertEqual((second["total_lessons"], second["percent"]), (0, 0))
+        self.assertEqual(
+            data["summary"],
+            {"lessons_completed": 1, "total_lessons": 4, "overall_percent": 25},
+        )
+
+    def test_cached_until_next_completion(self):
+        progress_overview(self.user)
+        with self.assertNumQueries(0):
+            progress_overview(self.user)
+
+        self.complete(self.lessons[1])
+        self.assertEqual(progress_overview(self.user)["summary"]["lessons_completed"], 1)
+
+    def test_my_progress_endpoint(self):
+        self.complete(self.lessons[0])
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/v1/progress/me/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["summary"]["overall_percent"], 25)
+
+
+class CompletionCountersTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="seeker", password="pass12345")
+        path = DiscipleshipPath.objects.create(name="Seeker", stage="seeker", description="d")
+        self.level = DiscipleshipLevel.objects.create(path=path, name="Level 1", description="d", order=1)
+        self.lessons = [
+            DiscipleshipLesson.objects.create(
+                level=self.level, title=f"Lesson {i}", description="d", content="c", order=i
+            )
+            for i in (1, 2)
+        ]
+
+    def test_counters_follow_completion_and_publication(self):
+        self.assertEqual(counters.level_status(self.user, self.level.pk), (0, 2))
+
+        mark_lesson_complete(self.user, self.lessons[0])
+        mark_lesson_complete(self.user, self.lessons[0])  # idempotent
+        self.assertEqual(counters.level_status(self.user, self.level.pk), (1, 2))
+
+        self.lessons[1].is_published = False
+        self.lessons[1].save(update_fields=["is_published"])
+        self.assertEqual(counters.overall_status(self.user), (1, 1))
+        self.assertFalse(LevelProgress.objects.filter(user=self.user, level=self.level).exists())
+
+        LessonProgress.objects.filter(user=self.user).delete()
+        self.assertEqual(counters.level_status(self.user, self.level.pk), (0, 1))
+
+    def test_moving_lesson_moves_completions(self):
+        other_level = DiscipleshipLevel.objects.create(
+            path=self.level.path, name="Level 2", description="d", order=2
+        )
+        mark_lesson_complete(self.user, self.lessons[0])
+
+        lesson = DiscipleshipLesson.objects.get(pk=self.lessons[0].pk)
+        lesson.level = other_level
+        lesson.save()
+        self.assertEqual(counters.level_status(self.user, self.level.pk), (0, 1))
+        self.assertEqual(counters.level_status(self.user, other_level.pk), (1, 1))
+
+        call_command("rebuild_progress_counters", stdout=StringIO())
+        self.assertEqual(counters.level_status(self.user, self.level.pk), (0, 1))
+        self.assertEqual(counters.level_status(self.user, other_level.pk), (1, 1))
+
+    def test_rebuild_matches_signals(self):
+        mark_lesson_complete(self.user, self.lessons[1])
+        before = counters.overall_status(self.user)
+        call_command("rebuild_progress_counters", stdout=StringIO())
+        self.assertEqual(counters.overall_status(self.user), before)
+
+
+class MenteeCohortProgressTest(APITestCase):
+    def setUp(self):
+        self.mentor = User.objects.create_user(username="mentor", password="pass12345")
+        path = DiscipleshipPath.objects.create(name="Seeker", stage="seeker", description="d")
+        level = DiscipleshipLevel.objects.create(path=path, name="Level 1", description="d", order=1)
+        lessons = [
+            DiscipleshipLesson.objects.create(
+                level=level, title=f"Lesson {i}", description="d", content="c", order=i
+            )
+            for i in (1, 2, 3, 4)
+        ]
+        self.mentees = []
+        for i, done in enumerate((1, 3, 0)):
+            mentee = User.objects.create_user(username=f"mentee{i}", password="pass12345")
+            Mentorship.objects.create(mentor=self.mentor, mentee=mentee)
+            for lesson in lessons[:done]:
+                LessonProgress.objects.create(user=mentee, lesson=lesson, status="completed")
+            self.mentees.append(mentee)
+        self.client.force_authenticate(user=self.mentor)
+
+    def test_sorted_by_percent_and_paginated(self):
+        # COUNT, ukurasa, levels, counters (+1 ya middleware ya DiscipleshipJourney)
+        with self.assertNumQueries(5):
+            response = self.client.get("/api/v1/progress/mentees/?page_size=2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 3)
+        rows = response.data["results"]
+        self.assertEqual([row["mentee"]["username"] for row in rows], ["mentee1", "mentee0"])
+        self.assertEqual([row["summary"]["overall_percent"] for row in rows], [75, 25])
+        self.assertEqual(rows[0]["levels"][0]["completed"], 3)
+
+        response = self.client.get("/api/v1/progress/mentees/?ordering=percent")
+        self.assertEqual(response.data["results"][0]["mentee"]["username"], "mentee2")
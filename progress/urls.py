@@ -7,6 +7,7 @@ from .views import (
     LevelProgressViewSet,
     MyProgressAPIView,
     MenteeProgressAPIView,
+    MenteeCohortProgressAPIView,
 )
 
 app_name = "progress_api"
@@ -18,5 +19,6 @@ router.register(r"level-progress", LevelProgressViewSet, basename="level-progres
 urlpatterns = [
     path("", include(router.urls)),
     path("me/", MyProgressAPIView.as_view(), name="my-progress"),
+    path("mentees/", MenteeCohortProgressAPIView.as_view(), name="mentee-cohort-progress"),
     path("mentee/<int:mentee_id>/", MenteeProgressAPIView.as_view(), name="mentee-progress"),
 ]
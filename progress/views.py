@@ -3,13 +3,13 @@ from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
 
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import viewsets, permissions, status
+from rest_framework import generics, viewsets, permissions, status
 from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 
-from discipleship.models import DiscipleshipLevel
 from mentorship.models import Mentorship
 
 from progress.models import LessonProgress, LevelProgress
@@ -18,11 +18,15 @@ from progress.serializers import (
     LevelProgressSerializer,
     MyProgressResponseSerializer,
     MenteeProgressResponseSerializer,
+    MenteeCohortProgressSerializer,
 )
-from progress.services.tracker import (
-    user_level_completion_percent,
-    user_overall_completion,
+from progress.services.cohort import (
+    DEFAULT_ORDERING,
+    ORDERINGS,
+    cohort_queryset,
+    cohort_rows,
 )
+from progress.services.overview import progress_overview
 
 User = get_user_model()
 
@@ -114,36 +118,7 @@ class MyProgressAPIView(APIView):
     def get(self, request):
         user = request.user
 
-        levels = (
-            DiscipleshipLevel.objects.filter(is_active=True)
-            .select_related("path")
-            .prefetch_related("lessons")
-        )
-
-        levels_data = []
-        for lv in levels:
-            total_lessons = lv.lessons.filter(is_published=True).count()
-            percent = user_level_completion_percent(user, lv)
-
-            levels_data.append(
-                {
-                    "id": lv.id,
-                    "name": lv.name,
-                    "slug": lv.slug,
-                    "description": lv.description,
-                    "order": lv.order,
-                    "path": {
-                        "id": lv.path.id,
-                        "name": lv.path.name,
-                        "stage": lv.path.stage,
-                        "stage_label": lv.path.get_stage_display(),
-                    },
-                    "total_lessons": total_lessons,
-                    "percent": percent,
-                }
-            )
-
-        done, total, overall_pct = user_overall_completion(user)
+        overview = progress_overview(user)
 
         payload = {
             "user": {
@@ -153,12 +128,8 @@ class MyProgressAPIView(APIView):
                 "first_name": user.first_name,
                 "last_name": user.last_name,
             },
-            "levels": levels_data,
-            "summary": {
-                "lessons_completed": done,
-                "total_lessons": total,
-                "overall_percent": overall_pct,
-            },
+            "levels": overview["levels"],
+            "summary": overview["summary"],
         }
 
         serializer = MyProgressResponseSerializer(payload)
@@ -190,36 +161,7 @@ class MenteeProgressAPIView(APIView):
 
         mentee = get_object_or_404(User, pk=mentee_id)
 
-        levels = (
-            DiscipleshipLevel.objects.filter(is_active=True)
-            .select_related("path")
-            .prefetch_related("lessons")
-        )
-
-        levels_data = []
-        for lv in levels:
-            total_lessons = lv.lessons.filter(is_published=True).count()
-            percent = user_level_completion_percent(mentee, lv)
-
-            levels_data.append(
-                {
-                    "id": lv.id,
-                    "name": lv.name,
-                    "slug": lv.slug,
-                    "description": lv.description,
-                    "order": lv.order,
-                    "path": {
-                        "id": lv.path.id,
-                        "name": lv.path.name,
-                        "stage": lv.path.stage,
-                        "stage_label": lv.path.get_stage_display(),
-                    },
-                    "total_lessons": total_lessons,
-                    "percent": percent,
-                }
-            )
-
-        done, total, overall_pct = user_overall_completion(mentee)
+        overview = progress_overview(mentee)
 
         payload = {
             "mentee": {
@@ -229,13 +171,40 @@ class MenteeProgressAPIView(APIView):
                 "first_name": mentee.first_name,
                 "last_name": mentee.last_name,
             },
-            "levels": levels_data,
-            "summary": {
-                "lessons_completed": done,
-                "total_lessons": total,
-                "overall_percent": overall_pct,
-            },
+            "levels": overview["levels"],
+            "summary": overview["summary"],
         }
 
         serializer = MenteeProgressResponseSerializer(payload)
         return Response(serializer.data)
+
+
+class CohortPagination(PageNumberPagination):
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class MenteeCohortProgressAPIView(generics.GenericAPIView):
+    """
+    GET /api/v1/progress/mentees/?ordering=-percent&page=1
+    → Progress ya mentees wote wa mentor (kwa dashboard), ukurasa mmoja kwa
+      wakati. Idadi ya queries haitegemei idadi ya mentees wala levels.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CohortPagination
+    serializer_class = MenteeCohortProgressSerializer
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("ordering", str, enum=sorted(ORDERINGS), default=DEFAULT_ORDERING),
+        ],
+        responses=MenteeCohortProgressSerializer(many=True),
+        tags=["Progress"],
+        summary="Get discipleship progress for all mentees of the current mentor",
+    )
+    def get(self, request):
+        ordering = request.query_params.get("ordering", DEFAULT_ORDERING)
+        page = self.paginate_queryset(cohort_queryset(request.user, ordering))
+        serializer = self.get_serializer(cohort_rows(page), many=True)
+        return self.get_paginated_response(serializer.data)
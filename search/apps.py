@@ -0,0 +1,11 @@
+# search/apps.py
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "search"
+    verbose_name = "Site Search"
+
+    def ready(self):
+        from . import signals  # noqa: F401
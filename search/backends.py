@@ -0,0 +1,183 @@
+# search/backends.py
+"""
+Full-text backends kwa SearchDocument.
+
+- SQLite: FTS5 external-content table + triggers (bm25 ranking, snippet()).
+- Postgres: generated ``tsvector`` column + GIN index (ts_rank, ts_headline).
+- Nyingine: fallback ya icontains (hakuna ranking) ili dev isivunjike.
+"""
+import re
+from dataclasses import dataclass
+
+from django.db import connection
+from django.utils.html import escape
+
+TABLE = "search_searchdocument"
+FTS_TABLE = "search_searchdocument_fts"
+MAX_TERMS = 8
+SNIPPET_WORDS = 16
+MARK_START, MARK_END = "<mark>", "</mark>"
+# DB inaweka placeholders hizi (si HTML); highlight() ina-escape maandishi kisha
+# inaweka <mark>, hivyo HTML iliyo ndani ya body haifiki kwa client kama markup
+SEL_START, SEL_END = "\x02", "\x03"
+
+
+@dataclass
+class SearchHit:
+    object_id: int
+    rank: float
+    snippet: str
+
+
+def query_terms(query):
+    """Maneno safi tu (\\w+) — hakuna operators za FTS kutoka kwa mtumiaji."""
+    return re.findall(r"\w+", (query or "").lower())[:MAX_TERMS]
+
+
+def highlight(raw):
+    """Snippet ya DB (yenye SEL_START/SEL_END) → HTML salama yenye <mark>."""
+    return escape(raw).replace(SEL_START, MARK_START).replace(SEL_END, MARK_END)
+
+
+# ----------------------------- SQLite (FTS5) -----------------------------
+SQLITE_SETUP = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, body, content='{TABLE}', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TABLE}_ai AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TABLE}_ad AFTER DELETE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {TABLE}_au AFTER UPDATE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+SQLITE_TEARDOWN = [
+    f"DROP TRIGGER IF EXISTS {TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def _sqlite_search(cursor, terms, kind, user_id, is_staff, limit):
+    match = " ".join('"%s"*' % term for term in terms)
+    cursor.execute(
+        f"""
+        SELECT d.object_id,
+               -bm25({FTS_TABLE}, 10.0, 1.0) AS rank,
+               snippet({FTS_TABLE}, -1, %s, %s, '…', %s)
+        FROM {FTS_TABLE}
+        JOIN {TABLE} d ON d.id = {FTS_TABLE}.rowid
+        WHERE {FTS_TABLE} MATCH %s
+          AND d.kind = %s
+          AND (d.is_public = 1 OR %s = 1 OR d.owner_id = %s)
+        ORDER BY rank DESC
+        LIMIT %s
+        """,
+        [SEL_START, SEL_END, SNIPPET_WORDS, match, kind, int(is_staff), user_id, limit],
+    )
+    return cursor.fetchall()
+
+
+# ------------------------- Postgres (tsvector + GIN) -------------------------
+POSTGRES_SETUP = [
+    f"""ALTER TABLE {TABLE} ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(body, '')), 'B')
+        ) STORED""",
+    f"CREATE INDEX IF NOT EXISTS {TABLE}_vector_gin ON {TABLE} USING GIN (search_vector)",
+]
+POSTGRES_TEARDOWN = [
+    f"DROP INDEX IF EXISTS {TABLE}_vector_gin",
+    f"ALTER TABLE {TABLE} DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _postgres_search(cursor, terms, kind, user_id, is_staff, limit):
+    tsquery = " & ".join(f"{term}:*" for term in terms)
+    # ts_headline ni ghali: iendeshwe kwa rows za LIMIT tu
+    cursor.execute(
+        f"""
+        WITH q AS (SELECT to_tsquery('simple', %s) AS query),
+        hits AS (
+            SELECT d.object_id, d.body, ts_rank(d.search_vector, q.query) AS rank
+            FROM {TABLE} d, q
+            WHERE d.search_vector @@ q.query
+              AND d.kind = %s
+              AND (d.is_public OR %s OR d.owner_id = %s)
+            ORDER BY rank DESC
+            LIMIT %s
+        )
+        SELECT hits.object_id, hits.rank,
+               ts_headline('simple', hits.body, q.query, %s)
+        FROM hits, q
+        ORDER BY hits.rank DESC
+        """,
+        [
+            tsquery, kind, bool(is_staff), user_id, limit,
+            f"StartSel={SEL_START}, StopSel={SEL_END}, "
+            f"MaxWords={SNIPPET_WORDS}, MinWords=6, MaxFragments=1",
+        ],
+    )
+    return cursor.fetchall()
+
+
+# ------------------------------ Fallback ------------------------------
+def _fallback_search(terms, kind, user_id, is_staff, limit):
+    from django.db.models import Q
+    from .models import SearchDocument
+
+    qs = SearchDocument.objects.filter(kind=kind)
+    if not is_staff:
+        qs = qs.filter(Q(is_public=True) | Q(owner_id=user_id))
+    for term in terms:
+        qs = qs.filter(Q(title__icontains=term) | Q(body__icontains=term))
+    return [
+        (object_id, 0.0, body[:200])
+        for object_id, body in qs.order_by("-updated_at").values_list("object_id", "body")[:limit]
+    ]
+
+
+def search(query, kind, user=None, limit=10):
+    """Rudisha ``SearchHit`` za ``kind`` zilizopangwa kwa relevance."""
+    terms = query_terms(query)
+    if not terms:
+        return []
+
+    is_staff = bool(user and user.is_staff)
+    user_id = user.pk if user is not None and user.is_authenticated else None
+
+    vendor = connection.vendor
+    if vendor == "sqlite":
+        with connection.cursor() as cursor:
+            rows = _sqlite_search(cursor, terms, kind, user_id, is_staff, limit)
+    elif vendor == "postgresql":
+        with connection.cursor() as cursor:
+            rows = _postgres_search(cursor, terms, kind, user_id, is_staff, limit)
+    else:
+        rows = _fallback_search(terms, kind, user_id, is_staff, limit)
+    return [SearchHit(object_id=r[0], rank=float(r[1] or 0), snippet=highlight(r[2] or "")) for r in rows]
+
+
+def setup_statements(vendor):
+    return {"sqlite": SQLITE_SETUP, "postgresql": POSTGRES_SETUP}.get(vendor, [])
+
+
+def teardown_statements(vendor):
+    return {"sqlite": SQLITE_TEARDOWN, "postgresql": POSTGRES_TEARDOWN}.get(vendor, [])
+
+
+def optimize():
+    """Baada ya rebuild kubwa: unganisha segments za FTS5."""
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
@@ -0,0 +1,65 @@
+# search/documents.py
+"""
+Ni nini kinaingia kwenye index kwa kila model.
+Builder ikirudisha None, object hiyo inaondolewa kwenye index (mf. draft).
+"""
+from django.utils.html import strip_tags
+
+from content.models import Post, Lesson, Event, MissionReport
+
+
+def _join(*parts):
+    return "\n".join(strip_tags(p) for p in parts if p)
+
+
+def post_document(post):
+    if post.status != "published":
+        return None
+    return {
+        "title": post.title,
+        "body": _join(post.excerpt, post.content),
+        "is_public": True,
+        "owner_id": None,
+    }
+
+
+def lesson_document(lesson):
+    if lesson.status != "published":
+        return None
+    return {
+        "title": lesson.title,
+        "body": _join(lesson.description, lesson.content, lesson.bible_references),
+        "is_public": True,
+        "owner_id": None,
+    }
+
+
+def event_document(event):
+    return {
+        "title": event.title,
+        "body": _join(event.description, event.location),
+        "is_public": True,
+        "owner_id": None,
+    }
+
+
+def mission_report_document(report):
+    return {
+        "title": report.title,
+        "body": _join(report.location, report.testimonies),
+        "is_public": False,
+        "owner_id": report.missionary_id,
+    }
+
+
+# kind -> (model, builder, queryset ya rebuild)
+REGISTRY = {
+    "post": (Post, post_document, lambda: Post.pub.published()),
+    "lesson": (Lesson, lesson_document, lambda: Lesson.pub.published()),
+    "event": (Event, event_document, lambda: Event.objects.all()),
+    "mission_report": (
+        MissionReport, mission_report_document, lambda: MissionReport.objects.all()
+    ),
+}
+
+KIND_BY_MODEL = {model: kind for kind, (model, _b, _q) in REGISTRY.items()}
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from search.documents import REGISTRY
+from search.services import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for posts, lessons, events and mission reports."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind", action="append", choices=sorted(REGISTRY),
+            help="Jenga aina hii tu (inaweza kurudiwa).",
+        )
+
+    def handle(self, *args, **options):
+        counts = rebuild_index(kinds=options["kind"])
+        for kind, total in counts.items():
+            self.stdout.write(f"{kind}: {total}")
+        self.stdout.write(self.style.SUCCESS(f"Indexed {sum(counts.values())} document(s)."))
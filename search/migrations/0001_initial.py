@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:04
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('post', 'Post'), ('lesson', 'Lesson'), ('event', 'Event'), ('mission_report', 'Mission Report')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('is_public', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'is_public'], name='search_sear_kind_b59149_idx')],
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+    ]
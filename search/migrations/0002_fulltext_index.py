@@ -0,0 +1,27 @@
+# FTS5 (SQLite) / tsvector + GIN (Postgres) juu ya search_searchdocument.
+# Baada ya migrate kwenye DB yenye data: `manage.py rebuild_search_index`.
+
+from django.db import migrations
+
+from search.backends import setup_statements, teardown_statements
+
+
+def create_fulltext(apps, schema_editor):
+    for sql in setup_statements(schema_editor.connection.vendor):
+        schema_editor.execute(sql)
+
+
+def drop_fulltext(apps, schema_editor):
+    for sql in teardown_statements(schema_editor.connection.vendor):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext, drop_fulltext),
+    ]
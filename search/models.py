@@ -0,0 +1,35 @@
+# search/models.py
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    Nakala ya maandishi ya kila kitu kinachotafutwa (post, lesson, event,
+    mission report). Full-text index yenyewe ni ya DB husika:
+    FTS5 virtual table (SQLite) au tsvector + GIN (Postgres) — tazama backends.py.
+    """
+    KIND_CHOICES = [
+        ("post", "Post"),
+        ("lesson", "Lesson"),
+        ("event", "Event"),
+        ("mission_report", "Mission Report"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    # Mission reports si za umma: zinaonekana kwa mwenye nazo na staff tu
+    is_public = models.BooleanField(default=True)
+    owner = models.ForeignKey(
+        User, on_delete=models.CASCADE, null=True, blank=True, related_name="+"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ["kind", "object_id"]
+        indexes = [models.Index(fields=["kind", "is_public"])]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} {self.title}"
@@ -0,0 +1,60 @@
+# search/services.py
+from django.db import transaction
+
+from . import backends
+from .documents import REGISTRY, KIND_BY_MODEL
+from .models import SearchDocument
+
+REBUILD_BATCH = 500
+
+
+def index_instance(instance):
+    """Upsert (au ondoa) document ya ``instance`` kwenye index."""
+    kind = KIND_BY_MODEL.get(type(instance))
+    if kind is None:
+        return None
+    _model, builder, _qs = REGISTRY[kind]
+    doc = builder(instance)
+    if doc is None:
+        unindex_instance(instance)
+        return None
+    obj, _created = SearchDocument.objects.update_or_create(
+        kind=kind, object_id=instance.pk, defaults=doc
+    )
+    return obj
+
+
+def unindex_instance(instance):
+    kind = KIND_BY_MODEL.get(type(instance))
+    if kind is not None:
+        SearchDocument.objects.filter(kind=kind, object_id=instance.pk).delete()
+
+
+@transaction.atomic
+def rebuild_index(kinds=None):
+    """Jenga upya index yote (au ``kinds`` fulani). Inarudisha {kind: idadi}."""
+    counts = {}
+    for kind, (_model, builder, queryset) in REGISTRY.items():
+        if kinds and kind not in kinds:
+            continue
+        SearchDocument.objects.filter(kind=kind).delete()
+        batch, total = [], 0
+        for obj in queryset().iterator(chunk_size=REBUILD_BATCH):
+            doc = builder(obj)
+            if doc is None:
+                continue
+            batch.append(SearchDocument(kind=kind, object_id=obj.pk, **doc))
+            if len(batch) >= REBUILD_BATCH:
+                SearchDocument.objects.bulk_create(batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            SearchDocument.objects.bulk_create(batch)
+            total += len(batch)
+        counts[kind] = total
+    backends.optimize()
+    return counts
+
+
+def search(query, kind, user=None, limit=10):
+    return backends.search(query, kind, user=user, limit=limit)
@@ -0,0 +1,30 @@
+# search/signals.py
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from .documents import REGISTRY
+from .services import index_instance, unindex_instance
+
+logger = logging.getLogger(__name__)
+
+
+def _on_save(sender, instance, raw=False, **kwargs):
+    if raw:  # loaddata
+        return
+    try:
+        with transaction.atomic():
+            index_instance(instance)
+    except Exception:
+        # Search isiwe sababu ya save kushindwa; rebuild_search_index itarekebisha
+        logger.exception("Failed to index %s %s", sender.__name__, instance.pk)
+
+
+def _on_delete(sender, instance, **kwargs):
+    unindex_instance(instance)
+
+
+for _kind, (_model, _builder, _qs) in REGISTRY.items():
+    post_save.connect(_on_save, sender=_model, dispatch_uid=f"search-index-{_kind}")
+    post_delete.connect(_on_delete, sender=_model, dispatch_uid=f"search-unindex-{_kind}")
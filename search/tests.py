@@ -0,0 +1,90 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from content.models import Category, Post, MissionReport
+from .models import SearchDocument
+from . import services
+
+
+class SearchIndexTest(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="reader", password="testpass123")
+        self.category = Category.objects.create(name="Kiroho")
+        self.post = Post.objects.create(
+            title="Neema ya Mungu",
+            content="<p>Neema ni zawadi ya bure kwa kila aaminiye.</p>",
+            category=self.category,
+            author=self.user,
+            status="published",
+        )
+
+    def test_save_hooks_keep_index_in_sync(self):
+        self.assertTrue(SearchDocument.objects.filter(kind="post", object_id=self.post.pk).exists())
+
+        self.post.status = "draft"
+        self.post.save()
+        self.assertFalse(SearchDocument.objects.filter(kind="post").exists())
+
+        self.post.status = "published"
+        self.post.save()
+        self.post.delete()
+        self.assertFalse(SearchDocument.objects.filter(kind="post").exists())
+
+    def test_ranked_results_with_snippet(self):
+        Post.objects.create(
+            title="Habari za wiki",
+            content="Tulizungumza kidogo kuhusu neema.",
+            category=self.category,
+            author=self.user,
+            status="published",
+        )
+        hits = services.search("neema", "post")
+        self.assertEqual(len(hits), 2)
+        # Title match ina uzito mkubwa kuliko body
+        self.assertEqual(hits[0].object_id, self.post.pk)
+
+        response = self.client.get("/api/v1/core/api/search/", {"q": "zawadi"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        posts = response.data["results"]["posts"]
+        self.assertEqual([p["id"] for p in posts], [self.post.pk])
+        self.assertIn("<mark>zawadi</mark>", posts[0]["snippet"])
+        self.assertNotIn("<p>", posts[0]["snippet"])
+
+    def test_prefix_match_and_mission_report_visibility(self):
+        other = User.objects.create_user(username="other", password="testpass123")
+        MissionReport.objects.create(
+            missionary=other, title="Outreach", location="Dodoma",
+            souls_reached=3, testimonies="Familia nzima ilibatizwa",
+        )
+        self.assertEqual(len(services.search("famil", "mission_report", user=other)), 1)
+        self.assertEqual(services.search("famil", "mission_report", user=self.user), [])
+
+        response = self.client.get("/api/v1/core/api/search/", {"q": "famil"})
+        self.assertEqual(response.data["results"]["mission_reports"], [])
+
+    def test_snippet_escapes_indexed_html(self):
+        report = MissionReport.objects.create(
+            missionary=self.user, title="Outreach", location="Mbeya",
+            souls_reached=2, testimonies="Familia <script>alert(1)</script> ilibatizwa",
+        )
+        # Maandishi yaliyoingia kwenye index bila kusafishwa (mf. data ya zamani)
+        SearchDocument.objects.filter(kind="mission_report", object_id=report.pk).update(
+            body="Familia <script>alert(1)</script> ilibatizwa"
+        )
+        hits = services.search("familia", "mission_report", user=self.user)
+        self.assertEqual(len(hits), 1)
+        self.assertNotIn("<script>", hits[0].snippet)
+        self.assertIn("&lt;script&gt;", hits[0].snippet)
+        self.assertIn("<mark>Familia</mark>", hits[0].snippet)
+
+    def test_rebuild_command(self):
+        SearchDocument.objects.all().delete()
+        self.assertEqual(services.search("neema", "post"), [])
+
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual([h.object_id for h in services.search("neema", "post")], [self.post.pk])
@@ -6,6 +6,7 @@ from django.db.models import F
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
+from core.fields import AnnotatedCountField
 from .models import Category, Product, ProductImage, Order, OrderItem
 
 
@@ -25,16 +26,13 @@ class CategorySerializer(serializers.ModelSerializer):
     Tunatumia ref_name ili kuepuka clash na CategorySerializer ya content.api.
     """
 
-    products_count = serializers.SerializerMethodField()
+    products_count = AnnotatedCountField("products", filter={"is_published": True})
 
     class Meta:
         model = Category
         fields = ["id", "name", "slug", "products_count"]
         ref_name = "ShopCategory"
 
-    def get_products_count(self, obj) -> int:
-        return obj.products.filter(is_published=True).count()
-
 
 class ProductListSerializer(serializers.ModelSerializer):
     """
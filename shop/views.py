@@ -13,9 +13,10 @@ from .serializers import (
     OrderSerializer,
 )
 from content.permissions import AdminOrReadOnly  # tayari upo kwenye content app
+from core.querysets import AnnotatedCountsMixin
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(AnnotatedCountsMixin, viewsets.ModelViewSet):
     """
     CRUD ya Category:
     - Public: GET (list, retrieve)